@@ -0,0 +1,129 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from datetime import datetime
+
+import data_dummy_ecommerce as dde
+
+def _stats(rows, seconds, peak):
+    return {
+        "rows": int(rows),
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+        "peak_mb": round(peak / 2**20, 2) if peak is not None else None,
+    }
+
+# Jalankan pipeline penuh untuk satu skala dengan seed dan waktu acuan yang sama agar
+# hasil antar-run bisa dibandingkan. Angka per tabel diambil dari span tracer, sehingga
+# jumlah chats/promotions mengikuti planner seperti pada run biasa.
+def run_scale(num_users, seed=42, track_memory=True):
+    reference_now = datetime(2025, 1, 1)
+    results = {"tables": {}, "pipeline": None}
+    tracer = dde.Tracer(verbose=False)
+
+    # Sesi sendiri; sesi default modul tidak disentuh
+    if track_memory:
+        tracemalloc.start()
+    try:
+        with dde.GeneratorSession(seed, reference_now=reference_now):
+            with tracer.span("generate_all_data", stage="pipeline", table="all_tables") as pipeline:
+                all_tables = dde.generate_all_data(num_users, verbose=False, tracer=tracer)
+                pipeline["rows"] = sum(len(df) for df in all_tables.values())
+    finally:
+        if track_memory:
+            tracemalloc.stop()
+    del all_tables
+
+    # Tabel gabungan (mis. orders + order_items) dicatat di bawah nama tabel pembuatnya
+    for span in tracer.spans:
+        if span["stage"] != "generate":
+            continue
+        results["tables"][span["name"]] = _stats(span["rows"], span["duration_seconds"], span["peak_memory_bytes"])
+        print(f"  {span['name']:<20} {span['rows']:>10} baris  {span['duration_seconds']:>9.3f} s")
+
+    results["pipeline"] = _stats(pipeline["rows"], pipeline["duration_seconds"], pipeline["peak_memory_bytes"])
+    print(f"  {'generate_all_data':<20} {results['pipeline']['rows']:>10} baris  {pipeline['duration_seconds']:>9.3f} s")
+    return results
+
+# Bandingkan dengan baseline: regresi bila waktu atau peak memori naik melebihi threshold.
+# Waktu di bawah min_seconds diabaikan karena didominasi noise.
+def compare_to_baseline(current, baseline, threshold=0.2, min_seconds=0.05):
+    regressions = []
+    for scale, result in current["results"].items():
+        base = baseline.get("results", {}).get(scale)
+        if base is None:
+            continue
+        entries = [(name, stats, base["tables"].get(name)) for name, stats in result["tables"].items()]
+        entries.append(("generate_all_data", result["pipeline"], base.get("pipeline")))
+        for name, stats, base_stats in entries:
+            if not base_stats:
+                continue
+            for metric in ("seconds", "peak_mb"):
+                old, new = base_stats.get(metric), stats.get(metric)
+                if metric == "seconds" and max(old or 0, new or 0) < min_seconds:
+                    continue
+                if old and new and new > old * (1 + threshold):
+                    regressions.append(f"{scale} user / {name}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark throughput dan memori generator data dummy e-commerce")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="jumlah user untuk setiap skala (default: 1000 10000 100000)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark_results.json", help="file JSON hasil benchmark")
+    parser.add_argument("--baseline", help="file JSON baseline untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="kenaikan relatif yang dianggap regresi (default: 0.2 = 20%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="abaikan perbandingan waktu di bawah nilai ini (default: 0.05)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="simpan hasil sebagai baseline baru ke file --baseline")
+    parser.add_argument("--no-memory", action="store_true", help="lewati pengukuran peak memori (tracemalloc)")
+    args = parser.parse_args(argv)
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline membutuhkan --baseline")
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "memory_tracked": not args.no_memory,
+        },
+        "results": {},
+    }
+
+    for num_users in args.scales:
+        print(f"\nBenchmark {num_users} user...")
+        report["results"][str(num_users)] = run_scale(num_users, seed=args.seed, track_memory=not args.no_memory)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nHasil benchmark disimpan ke {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline disimpan ke {args.baseline}")
+        return 0
+
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold, args.min_seconds)
+        if regressions:
+            print("\nREGRESI terdeteksi:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\nTidak ada regresi dibanding baseline.")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,120 +1,1054 @@
-import pandas as pd
-import numpy as np
-from faker import Faker
-import random
+import shutil
+import tempfile
 from datetime import datetime, timedelta
 import json
 import os
+import argparse
+import asyncio
+import binascii
+import contextvars
+import hashlib
+import importlib
+import math
+import sys
+import sqlite3
+import string
+import gc
+import time
+import tracemalloc
+from contextlib import contextmanager
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# pandas dan NumPy baru diimpor saat pertama kali dipakai; setelah itu nama modul
+# global langsung menunjuk ke modul aslinya
+class _LazyModule:
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+pd = _LazyModule('pandas', 'pd')
+np = _LazyModule('numpy', 'np')
+
+# Sesi generator: stream acak NumPy, waktu acuan dan model popularitas milik satu sesi.
+# Generator selalu memakai sesi aktif (contextvar), jadi thread atau proses bisa
+# menjalankan sesi masing-masing tanpa berbagi state global. Tanpa sesi eksplisit dipakai
+# sesi default ber-seed 42. Stream baru dibuat saat pertama dipakai.
+class GeneratorSession:
+    def __init__(self, seed=42, reference_now=None, popularity=None):
+        self._tokens = []
+        self.popularity = {'model': 'zipf', 'exponent': 1.1}
+        if popularity:
+            self.set_popularity(**popularity)
+        self.set_reference_now(reference_now)
+        self.set_seed(seed)
+
+    # Reset stream acak ke seed tertentu
+    def set_seed(self, seed):
+        self.seed = seed
+        self._rng = None
+        self._fresh_state = None
+
+    # Waktu acuan "sekarang". Bila dipatok, semua tanggal relatif dihitung dari titik
+    # yang sama sehingga output bisa direproduksi byte per byte
+    def set_reference_now(self, value=None):
+        self.reference_now = value.replace(microsecond=0) if value is not None else None
+
+    def now(self):
+        return self.reference_now if self.reference_now is not None else datetime.now().replace(microsecond=0)
+
+    def set_popularity(self, model='zipf', exponent=1.1):
+        if model not in POPULARITY_MODELS:
+            raise ValueError(f"Model popularitas tidak dikenal: {model}")
+        self.popularity = {'model': model, 'exponent': exponent}
+
+    @property
+    def rng(self):
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+            self._fresh_state = self._rng.bit_generator.state
+        return self._rng
+
+    # Seed aktif, atau None bila stream NumPy sudah dipakai sejak set_seed terakhir
+    # (dipakai kunci cache dataset)
+    def current_seed(self):
+        if self._rng is None or self._rng.bit_generator.state == self._fresh_state:
+            return self.seed
+        return None
+
+    def __enter__(self):
+        self._tokens.append(_active_session.set(self))
+        return self
+
+    def __exit__(self, *exc):
+        _active_session.reset(self._tokens.pop())
+
+_active_session = contextvars.ContextVar('data_dummy_session', default=GeneratorSession(42))
+
+def current_session():
+    return _active_session.get()
+
+# Akses atribut sesi aktif lewat nama global (rng.integers(...))
+class _SessionAttribute:
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(getattr(_active_session.get(), self._name), attr)
+
+rng = _SessionAttribute('rng')
+
+def set_reference_now(value=None):
+    current_session().set_reference_now(value)
+
+def _now():
+    return current_session().now()
+
+def set_seed(seed):
+    current_session().set_seed(seed)
+
+def _current_seed():
+    return current_session().current_seed()
+
+# Pool string Faker: korpus per jenis teks dibuat sekali dengan Faker ber-seed tetap
+# (TEXT_POOL_SEED), disimpan di disk, lalu kolom teks diisi dengan mengambil indeks
+# secara massal. Isi pool tidak bergantung pada stream acak utama, sehingga aman
+# dipakai bersama oleh semua shard.
+TEXT_POOL_SEED = 42
+TEXT_POOL_DIR = os.environ.get(
+    'DATA_DUMMY_TEXT_POOL_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'data_dummy_ecommerce', 'text_pool')
+)
+
+_faker_pools = {}
+
+def _build_text_pool(method, size, kwargs):
+    name = "-".join([method] + [f"{k}{v}" for k, v in sorted(kwargs.items())] + [str(size), str(TEXT_POOL_SEED)])
+    path = os.path.join(TEXT_POOL_DIR, f"{name}.json") if TEXT_POOL_DIR else None
+
+    if path and os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return np.array(json.load(f), dtype=object)
+        except (OSError, ValueError):
+            pass
+
+    from faker import Faker
+    pool_fake = Faker('id_ID')
+    pool_fake.seed_instance(f"{TEXT_POOL_SEED}-{name}")
+    func = getattr(pool_fake, method)
+    # Nilai kembar dibuang agar pool bisa langsung dipakai sebagai kategori
+    values = list(dict.fromkeys(func(**kwargs) for _ in range(size)))
+
+    if path:
+        try:
+            os.makedirs(TEXT_POOL_DIR, exist_ok=True)
+            _atomic_write_text(path, json.dumps(values, ensure_ascii=False))
+        except OSError:
+            pass
+
+    return np.array(values, dtype=object)
+
+def _faker_pool(method, size=1000, **kwargs):
+    key = (method, size, tuple(sorted(kwargs.items())))
+    if key not in _faker_pools:
+        _faker_pools[key] = _build_text_pool(method, size, kwargs)
+    return _faker_pools[key]
+
+def _sample_pool(method, n, size=1000, **kwargs):
+    pool = _faker_pool(method, size, **kwargs)
+    return pool[rng.integers(0, len(pool), n)]
+
+# Seperti _sample_pool, tetapi hasilnya Categorical (dictionary-encoded): setiap string
+# pool hanya disimpan sekali, baris cukup menyimpan kode. empty_ratio mengisi sebagian baris dengan ''.
+def _sample_text(method, n, size=1000, empty_ratio=0.0, **kwargs):
+    pool = _faker_pool(method, size, **kwargs)
+    codes = rng.integers(0, len(pool), n)
+    categories = pool
+    if empty_ratio > 0:
+        categories = np.append(pool, '')
+        codes[rng.random(n) < empty_ratio] = len(pool)
+    return pd.Categorical.from_codes(codes, categories=pd.Index(categories, dtype=object))
+
+# Tanggal acak (presisi detik) di antara start dan end; keduanya boleh berupa array
+def _random_datetimes_between(start, end, size=None):
+    start = np.asarray(start, dtype='datetime64[s]')
+    end = np.asarray(end, dtype='datetime64[s]')
+    if size is None:
+        size = np.broadcast(start, end).shape
+    span = np.maximum((end - start).astype(np.int64), 0)
+    offsets = (rng.random(size) * span).astype(np.int64)
+    return start + offsets.astype('timedelta64[s]')
+
+# Pilihan (opsional berbobot) untuk banyak baris sekaligus
+def _batched_choice(values, size, weights=None):
+    values = np.asarray(values, dtype=object)
+    p = None
+    if weights is not None:
+        p = np.asarray(weights, dtype=float)
+        p = p / p.sum()
+    return values[rng.choice(len(values), size=size, p=p)]
+
+# Kode acak berformat prefix + digit, mis. 'TRK-########'
+def _random_codes(prefix, digits, n):
+    numbers = rng.integers(0, 10 ** digits, n).astype(str)
+    return np.char.add(prefix, np.char.zfill(numbers, digits)).astype(object)
+
+# k huruf acak (besar/kecil) per baris, seperti '?' pada fake.bothify
+def _random_letters(n, k):
+    letters = np.frombuffer(string.ascii_letters.encode(), dtype=np.uint8)
+    return letters[rng.integers(0, len(letters), (n, k))].view(f'S{k}').ravel().astype(str)
+
+# Gabungkan potongan teks (skalar atau array) per baris
+def _join_text(*parts):
+    result = np.asarray(parts[0]).astype(str)
+    for part in parts[1:]:
+        result = np.char.add(result, np.asarray(part).astype(str))
+    return result
+
+# Jumlah baris anak per baris parent: dari DatasetPlan bila diberikan, atau diambil di
+# sini secara seragam sesuai FANOUT_RANGES
+def _fan_out(counts, num_parents, table_name):
+    if counts is None:
+        low, high = FANOUT_RANGES[table_name]
+        return rng.integers(low, high + 1, num_parents)
+    return _check_planned(counts, num_parents, table_name)
+
+def _check_planned(values, num_rows, table_name):
+    values = np.asarray(values)
+    if len(values) != num_rows:
+        raise ValueError(f"Plan {table_name} berisi {len(values)} nilai untuk {num_rows} baris parent")
+    return values
+
+# Posisi parent dan urutan anak (0, 1, ...) untuk setiap baris anak
+def _expand(counts):
+    counts = np.asarray(counts, dtype=np.int64)
+    parent_pos = np.repeat(np.arange(len(counts)), counts)
+    child_pos = np.arange(len(parent_pos)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return parent_pos, child_pos
+
+# Model popularitas untuk memilih produk, variant, seller dan kategori:
+# 'uniform', 'zipf' (power law atas peringkat acak), atau 'sold_count'/'views_count'
+# (bobot produk diambil dari kolom itu; variant membagi bobot produknya)
+POPULARITY_MODELS = ('uniform', 'zipf', 'sold_count', 'views_count')
+
+def set_popularity(model='zipf', exponent=1.1):
+    current_session().set_popularity(model, exponent)
+
+# Tabel alias (metode Vose) untuk pengambilan indeks berbobot O(1) per sampel.
+# Dibangun per putaran secara vektor: setiap kolom "kecil" (bobot < 1) dipasangkan ke
+# kolom "besar" lewat cumsum defisit vs kelebihan; kolom besar yang kelebihannya habis
+# menjadi kolom kecil di putaran berikutnya.
+class AliasTable:
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        n = len(weights)
+        if n == 0 or not np.isfinite(weights).all() or (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("Bobot alias table harus non-negatif dengan total > 0")
+        scaled = weights * (n / weights.sum())
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+        small = np.flatnonzero(scaled < 1.0)
+        large = np.flatnonzero(scaled >= 1.0)
+        while len(small) and len(large):
+            deficit = 1.0 - scaled[small]
+            owner = np.minimum(np.searchsorted(np.cumsum(scaled[large] - 1.0), np.cumsum(deficit)), len(large) - 1)
+            self.prob[small] = scaled[small]
+            self.alias[small] = large[owner]
+            scaled[large] -= np.bincount(owner, weights=deficit, minlength=len(large))
+            exhausted = scaled[large] < 1.0
+            small, large = large[exhausted], large[~exhausted]
+        # Sisa pembulatan float: kolom tersebut selalu memilih dirinya sendiri
+        self.prob[small] = 1.0
+
+    def __len__(self):
+        return len(self.prob)
+
+    def sample(self, size):
+        pos = rng.integers(0, len(self.prob), size)
+        return np.where(rng.random(size) < self.prob[pos], pos, self.alias[pos])
+
+class _UniformSampler:
+    def __init__(self, n):
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def sample(self, size):
+        return rng.integers(0, max(self.n, 1), size)
+
+# Sampler indeks baris sesuai model popularitas aktif. weights dipakai untuk model
+# berbasis kolom (sold_count/views_count); tanpa weights model tersebut jatuh ke zipf.
+def _popularity_sampler(n, weights=None):
+    popularity = current_session().popularity
+    if popularity['model'] == 'uniform' or n == 0:
+        return _UniformSampler(n)
+    if popularity['model'] != 'zipf' and weights is not None:
+        return AliasTable(weights)
+    return AliasTable(1.0 / (rng.permutation(n) + 1.0) ** popularity['exponent'])
+
+def _product_weights(products_df):
+    model = current_session().popularity['model']
+    if products_df is None or model not in products_df.columns:
+        return None
+    return products_df[model].to_numpy().astype(float) + 1.0
+
+def _variant_weights(variants_df, products_df):
+    weights = _product_weights(products_df)
+    if weights is None or 'product_id' not in variants_df.columns:
+        return None
+    index = _parent_index(None, 'products', products_df, 'product_id')
+    product_pos = index.positions('products', variants_df['product_id'])
+    variants_per_product = np.bincount(product_pos, minlength=len(products_df))
+    return weights[product_pos] / variants_per_product[product_pos]
+
+def _duplicates_in_group(group_pos, picks):
+    keys = group_pos.astype(np.int64) * (int(picks.max(initial=0)) + 1) + picks
+    duplicate = np.ones(len(keys), dtype=bool)
+    duplicate[np.unique(keys, return_index=True)[1]] = False
+    return duplicate
+
+# Satu pilihan per baris, unik dalam satu grup (cart, wishlist, user). group_pos harus
+# terurut dan jumlah baris per grup <= num_choices. Duplikat diambil ulang dari sampler
+# beberapa putaran; sisanya digeser ke pilihan berikutnya yang belum dipakai di grupnya,
+# sehingga jumlah baris tetap sama dengan yang direncanakan.
+def _distinct_in_group(group_pos, sampler, num_choices, rounds=8):
+    picks = sampler.sample(len(group_pos))
+    for _ in range(rounds):
+        duplicate = _duplicates_in_group(group_pos, picks)
+        if not duplicate.any():
+            return picks
+        picks[duplicate] = sampler.sample(int(duplicate.sum()))
+    duplicate = np.flatnonzero(_duplicates_in_group(group_pos, picks))
+    starts = np.searchsorted(group_pos, group_pos[duplicate], 'left')
+    ends = np.searchsorted(group_pos, group_pos[duplicate], 'right')
+    for i, start, end in zip(duplicate, starts, ends):
+        used = set(picks[start:end].tolist())
+        pick = picks[i]
+        while pick in used:
+            pick = (pick + 1) % num_choices
+        picks[i] = pick
+    return picks
+
+# Planner jumlah baris (gaya scale factor TPC). Semua fan-out per baris parent diambil di
+# depan dari satu stream acak, sehingga total baris dan rentang ID setiap tabel sudah
+# diketahui sebelum generator berjalan, dan setiap generator membuat kolomnya sekali
+# dengan panjang pastinya. Skala 1.0 = BASE_USERS user; chat dan promosi ikut berskala.
+BASE_USERS = 1000
+SELLER_PERCENTAGE = 0.4
+ACTIVE_CART_PERCENTAGE = 0.7
+CHATS_PER_USER = 0.2
+PROMOTIONS_PER_USER = 0.015
+PAYMENT_STATUSES = ['Pending', 'Paid', 'Failed', 'Refunded']
+
+# Jumlah baris anak per baris parent (inklusif). products dibatasi total_products seller;
+# cart_items, user_vouchers dan wishlist_items dibatasi jumlah pilihan yang ada.
+# order_items adalah ukuran keranjang; item order Failed tidak ditulis.
+FANOUT_RANGES = {
+    'addresses': (1, 3),
+    'products': (3, 10),
+    'product_variants': (1, 5),
+    'variant_options': (1, 3),
+    'product_images': (1, 5),
+    'cart_items': (1, 5),
+    'order_items': (1, 5),
+    'vouchers': (0, 5),
+    'user_vouchers': (0, 3),
+    'wishlists': (0, 2),
+    'wishlist_items': (1, 10),
+    'notifications': (0, 15),
+}
+
+def _scaled_limits(num_users):
+    return int(round(num_users * CHATS_PER_USER)), max(1, int(round(num_users * PROMOTIONS_PER_USER)))
+
+class DatasetPlan:
+    def __init__(self, num_users, user_id_start=1000, user_id_space=None, chat_limit=None, promotion_limit=None,
+                 random_state=None):
+        r = rng if random_state is None else random_state
+        scaled_chats, scaled_promotions = _scaled_limits(num_users)
+        self.num_users = num_users
+        self.user_id_start = user_id_start
+        self.user_id_space = user_id_space if user_id_space is not None else max(9000, num_users)
+        # counts: tabel -> jumlah baris anak per baris parent (urutan baris parent);
+        # columns: (tabel, kolom) -> nilai kolom parent yang menentukan fan-out
+        self.counts = {}
+        self.columns = {}
+
+        def draw(table_name, num_parents, cap=None):
+            low, high = FANOUT_RANGES[table_name]
+            counts = r.integers(low, high + 1, num_parents)
+            self.counts[table_name] = counts if cap is None else np.minimum(counts, cap)
+            return int(self.counts[table_name].sum())
+
+        n = num_users
+        num_sellers = int(n * SELLER_PERCENTAGE)
+        total_products = r.integers(5, 151, num_sellers)
+        self.columns[('sellers', 'total_products')] = total_products
+        orders_count = np.where(r.random(n) > 0.2, r.integers(0, 21, n), 0)
+        self.columns[('buyers', 'orders_count')] = orders_count
+        num_orders = int(orders_count.sum())
+        payment_status = np.asarray(PAYMENT_STATUSES, dtype=object)[r.integers(0, len(PAYMENT_STATUSES), num_orders)]
+        self.columns[('orders', 'payment_status')] = payment_status
+
+        num_products = draw('products', num_sellers, cap=total_products)
+        num_variants = draw('product_variants', num_products)
+        num_vouchers = draw('vouchers', num_sellers)
+        num_wishlists = draw('wishlists', n)
+        draw('order_items', num_orders)
+        order_items = self.counts['order_items']
+        self.rows = {
+            'users': n,
+            'sellers': num_sellers,
+            'buyers': n,
+            'addresses': draw('addresses', n),
+            'product_categories': len(generate_product_categories()),
+            'products': num_products,
+            'product_variants': num_variants,
+            'variant_options': draw('variant_options', num_variants),
+            'product_images': draw('product_images', num_products),
+            'carts': n,
+            'cart_items': draw('cart_items', int(n * ACTIVE_CART_PERCENTAGE), cap=num_variants),
+            'orders': num_orders,
+            'order_items': int(order_items[payment_status != 'Failed'].sum()),
+            'vouchers': num_vouchers,
+            'user_vouchers': draw('user_vouchers', n, cap=num_vouchers),
+            'wishlists': num_wishlists,
+            'wishlist_items': draw('wishlist_items', num_wishlists, cap=num_products),
+            'notifications': draw('notifications', n),
+            'chats': scaled_chats if chat_limit is None else chat_limit,
+            'promotions': scaled_promotions if promotion_limit is None else promotion_limit,
+            # Bergantung pada status item yang diambil saat generate: separuh item order
+            # Paid yang Delivered/Completed (peluang 0.6)
+            'product_reviews': int(round(0.5 * 0.6 * order_items[payment_status == 'Paid'].sum())),
+        }
+        self.estimated = {'product_reviews'}
+
+    @property
+    def scale_factor(self):
+        return self.num_users / BASE_USERS
+
+    def id_ranges(self):
+        ranges = {t: (1, rows) for t, rows in self.rows.items()}
+        ranges['users'] = (self.user_id_start, self.user_id_start + self.user_id_space - 1)
+        category_ids = generate_product_categories()['category_id']
+        ranges['product_categories'] = (int(category_ids.min()), int(category_ids.max()))
+        return ranges
+
+    # Perkiraan baris dan ukuran (memori DataFrame dan file CSV) per tabel, dari ukuran per
+    # baris sampel kecil; tanpa membuat dataset penuh
+    def estimate(self):
+        row_bytes = _row_bytes()
+        return {
+            t: {
+                'rows': rows,
+                'estimated': t in self.estimated,
+                'memory_bytes': int(row_bytes[t]['fixed'] + rows * row_bytes[t]['memory']),
+                'csv_bytes': int(rows * row_bytes[t]['csv']),
+            }
+            for t, rows in self.rows.items()
+        }
 
-# Inisialisasi Faker
-fake = Faker('id_ID')
-random.seed(42)
-np.random.seed(42)
-fake.seed_instance(42)
-
-# 1. USER Table
-def generate_dummy_users(n=1000):
-    users = []
-    used_ids = set()
-
-    for _ in range(n):
-        while True:
-            user_id = fake.unique.random_int(min=1000, max=9999)
-            if user_id not in used_ids:
-                used_ids.add(user_id)
-                break
+# Plan untuk num_users. Dengan seed, fan-out diambil dari stream baru ber-seed itu, yaitu
+# sama persis dengan plan yang dibuat generate_all_data setelah set_seed(seed).
+def plan_dataset(num_users, seed=None, **kwargs):
+    random_state = np.random.default_rng(seed) if seed is not None else None
+    return DatasetPlan(num_users, random_state=random_state, **kwargs)
+
+# Nilai dari plan di konteks builder (None bila tidak ada plan: generator mengambil sendiri)
+def _planned(ctx, table_name, column=None):
+    plan = ctx.get('plan')
+    if plan is None:
+        return None
+    return plan.counts[table_name] if column is None else plan.columns[(table_name, column)]
+
+# Ukuran per baris tiap tabel dari sampel kecil (dihitung sekali per proses). Kategori
+# kolom Categorical dihitung sebagai biaya tetap, bukan per baris.
+_ROW_BYTES_SAMPLE_USERS = 500
+_row_bytes_cache = {}
+
+def _row_bytes():
+    if not _row_bytes_cache:
+        # Sesi tersendiri, agar stream acak sesi pemanggil tidak ikut terpakai
+        session = current_session()
+        with GeneratorSession(0, reference_now=session.reference_now, popularity=session.popularity):
+            sample = generate_all_data(_ROW_BYTES_SAMPLE_USERS, verbose=False, validate=False)
+        for table_name, df in sample.items():
+            rows = max(len(df), 1)
+            fixed = sum(df[c].cat.categories.memory_usage(deep=True) for c in df.columns
+                        if isinstance(df[c].dtype, pd.CategoricalDtype))
+            _row_bytes_cache[table_name] = {
+                'fixed': fixed,
+                'memory': (df.memory_usage(deep=True).sum() - fixed) / rows,
+                'csv': len(_csv_frame(table_name, df).to_csv(index=False).encode()) / rows,
+            }
+    return _row_bytes_cache
+
+# Tracing: span per tahap (generate/validate/save) per tabel yang mencatat durasi,
+# jumlah baris, rows/sec dan selisih memori (RSS). Mode streaming melaporkan progres
+# + ETA per chunk lewat _track ke span yang sedang aktif.
+def _rss_bytes():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+# Tracer dari span yang sedang berjalan (per thread/task, seperti sesi generator)
+_active_tracer = contextvars.ContextVar('data_dummy_tracer', default=None)
+
+class Tracer:
+    def __init__(self, progress_interval=5.0, verbose=True):
+        self.progress_interval = progress_interval
+        self.verbose = verbose
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def span(self, name, stage="generate", table=None):
+        record = {"name": name, "stage": stage, "table": table or name, "rows": None,
+                  "started_at": datetime.now().isoformat(timespec="seconds")}
+        token = _active_tracer.set(self)
+        rss_before = _rss_bytes()
+        # Bila tracemalloc aktif, peak dihitung per span (relatif terhadap memori saat span
+        # mulai); peak span dalam ikut diteruskan ke span luarnya
+        tracing = tracemalloc.is_tracing()
+        traced_before = self._reset_peak() if tracing else None
+        start = time.perf_counter()
+        entry = {"record": record, "start": start, "last_report": start, "peak": 0}
+        self._stack.append(entry)
+        try:
+            yield record
+        finally:
+            self._stack.pop()
+            _active_tracer.reset(token)
+            duration = time.perf_counter() - start
+            record["duration_seconds"] = round(duration, 6)
+            record["memory_delta_bytes"] = _rss_bytes() - rss_before
+            record["peak_memory_bytes"] = None
+            if tracing and tracemalloc.is_tracing():
+                peak = max(entry["peak"], self._reset_peak())
+                record["peak_memory_bytes"] = peak - traced_before
+            rows = record["rows"]
+            record["rows_per_second"] = round(rows / duration, 1) if rows and duration > 0 else None
+            self.spans.append(record)
+
+    # Catat span yang diukur di tempat lain (mis. di proses worker)
+    def record(self, name, stage="generate", rows=None, duration=0.0, table=None):
+        self.spans.append({
+            "name": name, "stage": stage, "table": table or name, "rows": rows,
+            "started_at": None, "duration_seconds": round(duration, 6), "memory_delta_bytes": None,
+            "peak_memory_bytes": None,
+            "rows_per_second": round(rows / duration, 1) if rows and duration > 0 else None,
+        })
 
-        registration_date = fake.date_time_this_decade()
-        last_login = fake.date_time_between(start_date=registration_date, end_date=datetime.now())
-
-        user = {
-            "user_id": user_id,
-            "username": fake.user_name(),
-            "email": fake.email(),
-            "password_hash": fake.sha256(),
-            "phone_number": fake.phone_number(),
-            "registration_date": registration_date,
-            "is_active": random.choice([0, 1]),
-            "last_login": last_login,
-            "profile_picture": fake.image_url(),
-            "is_verified": random.choice([0, 1]),
-            "wallet_balance": round(random.uniform(0, 10000), 2)
-        }
-        users.append(user)
+    # Simpan peak tracemalloc sejauh ini ke span luar lalu mulai hitung ulang; hasilnya
+    # memori yang ter-trace saat ini
+    def _reset_peak(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def progress(self, done, total):
+        if not self._stack:
+            return
+        current = self._stack[-1]
+        now = time.perf_counter()
+        if now - current["last_report"] < self.progress_interval:
+            return
+        current["last_report"] = now
+        elapsed = now - current["start"]
+        rate = done / elapsed if elapsed > 0 else 0
+        eta = (total - done) / rate if rate > 0 else float('nan')
+        if self.verbose:
+            print(f"  [{current['record']['name']}] {done}/{total} ({done / max(total, 1):.0%}), "
+                  f"{rate:,.0f}/s, ETA {eta:,.0f} s", flush=True)
+
+    def to_dict(self):
+        return {"spans": list(self.spans)}
+
+    def write_json(self, path):
+        _atomic_write_text(path, json.dumps(self.to_dict(), indent=2))
+
+    # Format teks Prometheus (untuk node_exporter textfile collector)
+    def to_prometheus(self, prefix="dde"):
+        metrics = [
+            ("duration_seconds", "duration_seconds", "Durasi tahap"),
+            ("rows", "rows", "Jumlah baris yang diproses tahap"),
+            ("rows_per_second", "rows_per_second", "Throughput tahap"),
+            ("memory_delta_bytes", "memory_delta_bytes", "Selisih RSS selama tahap"),
+        ]
+        # Span yang berulang (mis. per chunk) dijumlahkan per (stage, table)
+        # supaya tiap label set hanya muncul sekali
+        totals = {}
+        for record in self.spans:
+            total = totals.setdefault((record["stage"], record["table"]), {})
+            for key in ("duration_seconds", "rows", "memory_delta_bytes"):
+                if record.get(key) is not None:
+                    total[key] = total.get(key, 0) + record[key]
+        for total in totals.values():
+            rows, duration = total.get("rows"), total.get("duration_seconds", 0)
+            total["duration_seconds"] = round(duration, 6)
+            total["rows_per_second"] = round(rows / duration, 1) if rows and duration > 0 else None
+        lines = []
+        for metric, key, help_text in metrics:
+            name = f"{prefix}_stage_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for (stage, table), total in totals.items():
+                if total.get(key) is None:
+                    continue
+                lines.append(f'{name}{{stage="{stage}",table="{table}"}} {total[key]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="dde"):
+        _atomic_write_text(path, self.to_prometheus(prefix))
+
+# Tracer kosong dipakai bila tracing tidak diminta
+class _NullTracer:
+    @contextmanager
+    def span(self, name, stage="generate", table=None):
+        yield {}
+
+_NULL_TRACER = _NullTracer()
+
+def _track(iterable, total):
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield from iterable
+        return
+    for i, item in enumerate(iterable, 1):
+        yield item
+        tracer.progress(i, total)
+
+def _atomic_write_text(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+# Jalankan generator tabel di dalam span tracer dan catat jumlah barisnya
+def _traced(tracer, table_name, func, *args, **kwargs):
+    with tracer.span(table_name) as span:
+        df = func(*args, **kwargs)
+        span["rows"] = sum(len(t) for t in df.values()) if isinstance(df, dict) else len(df)
+    return df
+
+# Pembagian tabel ke folder output part1/ dan part2/
+PART1_TABLES = ['users', 'sellers', 'buyers', 'addresses', 'product_categories',
+                'products', 'product_variants', 'variant_options', 'product_images', 'carts']
+
+PART2_TABLES = ['cart_items', 'orders', 'order_items', 'vouchers', 'user_vouchers',
+                'wishlists', 'wishlist_items', 'notifications', 'chats', 'promotions', 'product_reviews']
+
+# Primary key tiap tabel dan relasi foreign key (kolom -> tabel parent)
+PRIMARY_KEYS = {
+    'users': 'user_id', 'sellers': 'seller_id', 'buyers': 'buyer_id', 'addresses': 'address_id',
+    'product_categories': 'category_id', 'products': 'product_id', 'product_variants': 'variant_id',
+    'variant_options': 'option_id', 'product_images': 'image_id', 'carts': 'cart_id',
+    'cart_items': 'cart_item_id', 'orders': 'order_id', 'order_items': 'order_item_id',
+    'vouchers': 'voucher_id', 'user_vouchers': 'user_voucher_id', 'wishlists': 'wishlist_id',
+    'wishlist_items': 'wishlist_item_id', 'notifications': 'notification_id', 'chats': 'chat_id',
+    'promotions': 'promotion_id', 'product_reviews': 'review_id',
+}
+
+FOREIGN_KEYS = {
+    'sellers': {'user_id': 'users'},
+    'buyers': {'user_id': 'users'},
+    'addresses': {'user_id': 'users'},
+    'products': {'seller_id': 'sellers', 'category_id': 'product_categories'},
+    'product_variants': {'product_id': 'products'},
+    'variant_options': {'variant_id': 'product_variants'},
+    'product_images': {'product_id': 'products'},
+    'carts': {'user_id': 'users'},
+    'cart_items': {'cart_id': 'carts', 'variant_id': 'product_variants'},
+    'orders': {'buyer_id': 'buyers'},
+    'order_items': {'order_id': 'orders', 'seller_id': 'sellers', 'variant_id': 'product_variants'},
+    'vouchers': {'seller_id': 'sellers'},
+    'user_vouchers': {'user_id': 'users', 'voucher_id': 'vouchers'},
+    'wishlists': {'user_id': 'users'},
+    'wishlist_items': {'wishlist_id': 'wishlists', 'product_id': 'products'},
+    'notifications': {'user_id': 'users'},
+    'chats': {'sender_id': 'users', 'receiver_id': 'users'},
+    'product_reviews': {'product_id': 'products', 'user_id': 'users', 'order_item_id': 'order_items'},
+}
+
+# Skema dtype ringkas per tabel, diterapkan oleh setiap generator sebelum mengembalikan
+# DataFrame: ID sebagai int32 (user_id dan FK ke users tetap int64 karena ruang ID user
+# tidak dibatasi), hitungan kecil int16/int8, kolom enum sebagai category,
+# flag 0/1 sebagai bool, dan tanggal sebagai datetime64 ('date' = tanpa jam).
+# Kolom yang belum tentu terisi (NULLABLE_COLUMNS) memakai NaT, bukan sentinel 1970-01-01.
+TABLE_SCHEMAS = {
+    'users': {'user_id': 'int64', 'registration_date': 'datetime', 'is_active': 'bool',
+              'last_login': 'datetime', 'is_verified': 'bool'},
+    'sellers': {'seller_id': 'int32', 'user_id': 'int64', 'joined_date': 'datetime', 'is_official': 'bool',
+                'total_products': 'int16', 'followers_count': 'int32'},
+    'buyers': {'buyer_id': 'int32', 'user_id': 'int64', 'orders_count': 'int16', 'last_purchase': 'datetime'},
+    'addresses': {'address_id': 'int32', 'user_id': 'int64', 'province': 'category', 'country': 'category',
+                  'is_default': 'bool', 'label': 'category'},
+    'product_categories': {'category_id': 'int16', 'parent_category_id': 'int16', 'level': 'int8',
+                           'display_order': 'int8'},
+    'products': {'product_id': 'int32', 'seller_id': 'int32', 'category_id': 'int16', 'total_stock': 'int32',
+                 'sold_count': 'int32', 'views_count': 'int32', 'is_active': 'bool',
+                 'created_at': 'datetime', 'updated_at': 'datetime'},
+    'product_variants': {'variant_id': 'int32', 'product_id': 'int32', 'stock': 'int32', 'is_active': 'bool'},
+    'variant_options': {'option_id': 'int32', 'variant_id': 'int32', 'option_type': 'category',
+                        'option_value': 'category'},
+    'product_images': {'image_id': 'int32', 'product_id': 'int32', 'is_primary': 'bool', 'display_order': 'int8'},
+    'carts': {'cart_id': 'int32', 'user_id': 'int64', 'last_updated': 'datetime'},
+    'cart_items': {'cart_item_id': 'int32', 'cart_id': 'int32', 'variant_id': 'int32', 'quantity': 'int16',
+                   'added_at': 'datetime', 'is_selected': 'bool'},
+    'orders': {'order_id': 'int32', 'buyer_id': 'int32', 'order_date': 'datetime', 'payment_method': 'category',
+               'payment_status': 'category', 'payment_date': 'datetime'},
+    'order_items': {'order_item_id': 'int32', 'order_id': 'int32', 'seller_id': 'int32', 'variant_id': 'int32',
+                    'quantity': 'int16', 'order_status': 'category', 'status_updated': 'datetime',
+                    'shipping_method': 'category', 'estimated_delivery': 'datetime'},
+    'vouchers': {'voucher_id': 'int32', 'seller_id': 'int32', 'is_percentage': 'bool', 'is_free_shipping': 'bool',
+                 'usage_limit': 'int32', 'times_used': 'int32', 'start_date': 'date', 'end_date': 'date',
+                 'is_active': 'bool'},
+    'user_vouchers': {'user_voucher_id': 'int32', 'user_id': 'int64', 'voucher_id': 'int32', 'is_used': 'bool',
+                      'used_at': 'datetime', 'expires_at': 'datetime'},
+    'wishlists': {'wishlist_id': 'int32', 'user_id': 'int64', 'is_public': 'bool', 'created_at': 'datetime'},
+    'wishlist_items': {'wishlist_item_id': 'int32', 'wishlist_id': 'int32', 'product_id': 'int32',
+                       'added_at': 'datetime'},
+    'notifications': {'notification_id': 'int32', 'user_id': 'int64', 'notification_type': 'category',
+                      'is_read': 'bool', 'created_at': 'datetime'},
+    'chats': {'chat_id': 'int32', 'sender_id': 'int64', 'receiver_id': 'int64', 'message_type': 'category',
+              'is_read': 'bool', 'sent_at': 'datetime'},
+    'promotions': {'promotion_id': 'int32', 'start_date': 'date', 'end_date': 'date', 'target_type': 'category',
+                   'is_active': 'bool'},
+    'product_reviews': {'review_id': 'int32', 'product_id': 'int32', 'user_id': 'int64', 'order_item_id': 'int32',
+                        'rating': 'int8', 'review_date': 'datetime', 'helpful_votes': 'int32'},
+}
+
+NULLABLE_COLUMNS = {
+    'buyers': ['last_purchase'],
+    'orders': ['payment_date'],
+    'order_items': ['estimated_delivery'],
+    'user_vouchers': ['used_at'],
+}
+
+# Kolom teks yang isinya bisa berupa angka saja; dibaca dari CSV tetap sebagai string
+TEXT_COLUMNS = {
+    'addresses': ['postal_code'],
+    'promotions': ['reference_id'],
+}
+
+# Sentinel tanggal kosong di CSV (format lama tetap dipertahankan untuk file CSV)
+CSV_NULL_DATE = datetime(1970, 1, 1)
+
+def _apply_schema(table_name, df):
+    for column, kind in TABLE_SCHEMAS.get(table_name, {}).items():
+        if column not in df.columns:
+            continue
+        if kind == 'category':
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+        elif kind == 'datetime':
+            df[column] = pd.to_datetime(df[column])
+        elif kind == 'date':
+            df[column] = pd.to_datetime(df[column]).dt.normalize()
+        elif np.dtype(kind).kind in 'iu':
+            df[column] = _narrow_int(table_name, column, df[column], kind)
+        else:
+            df[column] = df[column].astype(kind)
+    return df
+
+# Cast ke integer sempit hanya bila semua nilai muat, supaya ID besar tidak terlipat
+def _narrow_int(table_name, column, values, kind):
+    info = np.iinfo(kind)
+    if len(values) and (values.min() < info.min or values.max() > info.max):
+        raise ValueError(f"Kolom {table_name}.{column} berisi nilai di luar rentang {kind} "
+                         f"({values.min()}..{values.max()})")
+    return values.astype(kind)
+
+def _schema_columns(table_name, kind):
+    return [c for c, k in TABLE_SCHEMAS.get(table_name, {}).items() if k == kind]
+
+# Bentuk DataFrame untuk CSV: flag bool ditulis 0/1 dan NaT di kolom nullable ditulis
+# sebagai sentinel, sehingga file CSV sama seperti sebelum skema ringkas
+def _csv_frame(table_name, df):
+    columns = {c: df[c].astype(np.int8) for c in _schema_columns(table_name, 'bool') if c in df.columns}
+    for column in NULLABLE_COLUMNS.get(table_name, ()):
+        if column in df.columns:
+            columns[column] = df[column].fillna(CSV_NULL_DATE)
+    return df.assign(**columns) if columns else df
+
+# Kebalikan _csv_frame untuk DataFrame yang dibaca dari CSV (keep_default_na=False):
+# kolom tanggal kembali menjadi datetime64 dan sentinel di kolom nullable menjadi NaT
+def _from_csv_frame(table_name, df):
+    columns = {}
+    for column in _schema_columns(table_name, 'datetime') + _schema_columns(table_name, 'date'):
+        if column in df.columns:
+            values = pd.to_datetime(df[column].replace('', None), format='ISO8601').astype('datetime64[s]')
+            if column in NULLABLE_COLUMNS.get(table_name, ()):
+                values = values.mask(values == CSV_NULL_DATE)
+            columns[column] = values
+    return df.assign(**columns) if columns else df
+
+# Tabel dengan key yang tidak berurutan dari 1 (user_id acak, kategori statis)
+_NON_SEQUENTIAL_KEYS = {'users', 'product_categories'}
+
+# Indeks atribut parent: dibangun sekali di generate_all_data, lalu dipakai tabel anak
+# untuk mengambil kolom parent secara massal (hash lookup) tanpa scan boolean per baris
+class ParentIndex:
+    def __init__(self):
+        self._tables = {}
+
+    def add(self, name, df, key):
+        self._tables[name] = (pd.Index(df[key]), df)
+        return self
+
+    def __contains__(self, name):
+        return name in self._tables
+
+    # Posisi baris untuk setiap key; -1 untuk key yang tidak ada bila strict=False
+    def positions(self, name, ids, strict=True):
+        index, _ = self._tables[name]
+        pos = index.get_indexer(np.asarray(ids))
+        if strict and (pos < 0).any():
+            missing = np.asarray(ids)[pos < 0][:5]
+            raise KeyError(f"Key tidak ditemukan di {name}: {missing.tolist()}")
+        return pos
+
+    def gather(self, name, ids, column):
+        _, df = self._tables[name]
+        return df[column].take(self.positions(name, ids)).reset_index(drop=True)
+
+# Pakai indeks yang diberikan, atau bangun indeks sementara bila fungsi dipanggil sendiri
+def _parent_index(parent_index, name, df, key):
+    if parent_index is None:
+        parent_index = ParentIndex()
+    if name not in parent_index:
+        parent_index.add(name, df, key)
+    return parent_index
+
+# Penyimpanan kolom di disk untuk tabel perantara. Setiap kolom ditulis sebagai file .npy
+# (kolom teks dan kategori sebagai kode int + daftar kategori di JSON) lalu dibaca kembali
+# lewat memory map, sehingga tabel anak hanya memuat kolom yang dipakainya dan data yang
+# lebih besar dari RAM tetap bisa dibuat di satu mesin. File dibuat di subdirektori
+# sementara (di dalam directory bila diberikan) yang dihapus saat close().
+class ColumnStore:
+    def __init__(self, directory=None):
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="dde_store_", dir=directory)
+        self.tables = {}
+        self.owned = True
+
+    # Store di atas direktori yang sudah ada (mis. entri DatasetCache) beserta metadata
+    # tabelnya; direktori tersebut tidak dihapus oleh close()
+    @classmethod
+    def attach(cls, directory, tables):
+        store = cls.__new__(cls)
+        store.directory = directory
+        store.tables = tables
+        store.owned = False
+        return store
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _path(self, table_name, column, suffix):
+        return os.path.join(self.directory, table_name, f"{column}.{suffix}")
+
+    def put(self, table_name, df):
+        os.makedirs(os.path.join(self.directory, table_name), exist_ok=True)
+        columns = {}
+        for column in df.columns:
+            series = df[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes, categories = series.cat.codes.to_numpy(), series.cat.categories
+                columns[column] = {'kind': 'category', 'dtype': str(categories.dtype)}
+            elif series.dtype.kind in 'biufmM':
+                np.save(self._path(table_name, column, 'npy'), series.to_numpy())
+                columns[column] = {'kind': 'array'}
+                continue
+            else:
+                codes, categories = pd.factorize(series)
+                columns[column] = {'kind': 'text', 'dtype': str(series.dtype)}
+            np.save(self._path(table_name, column, 'codes.npy'), codes)
+            _atomic_write_text(self._path(table_name, column, 'json'), json.dumps(list(categories)))
+        self.tables[table_name] = {'length': len(df), 'columns': columns}
+
+    def __contains__(self, table_name):
+        return table_name in self.tables
+
+    def column(self, table_name, column):
+        meta = self.tables[table_name]['columns'][column]
+        if meta['kind'] == 'array':
+            return pd.Series(np.load(self._path(table_name, column, 'npy'), mmap_mode='r'), name=column, copy=False)
+        codes = np.load(self._path(table_name, column, 'codes.npy'), mmap_mode='r')
+        with open(self._path(table_name, column, 'json')) as f:
+            categories = json.load(f)
+        if meta['kind'] == 'category':
+            categories = pd.Index(categories, dtype=meta.get('dtype'))
+            return pd.Series(pd.Categorical.from_codes(codes, categories), name=column)
+        # Kode -1 (nilai kosong) menunjuk ke elemen None terakhir
+        values = np.array(categories + [None], dtype=object)[codes]
+        return pd.Series(values, name=column, dtype=meta['dtype'])
+
+    # Hanya kolom yang diminta yang dimuat (None = semua kolom)
+    def frame(self, table_name, columns=None):
+        names = list(self.tables[table_name]['columns']) if columns is None else columns
+        return pd.DataFrame({c: self.column(table_name, c) for c in names}, copy=False)
+
+    def drop(self, table_name):
+        self.tables.pop(table_name, None)
+        shutil.rmtree(os.path.join(self.directory, table_name), ignore_errors=True)
+
+    # Salin file kolom sebuah tabel dari store lain tanpa memuatnya ke memori
+    def copy_from(self, other, table_name):
+        self.drop(table_name)
+        shutil.copytree(os.path.join(other.directory, table_name), os.path.join(self.directory, table_name))
+        self.tables[table_name] = json.loads(json.dumps(other.tables[table_name]))
+
+    def close(self):
+        self.tables.clear()
+        if self.owned:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+# Tampilan dict dari tabel di ColumnStore: setiap tabel baru dimuat saat diakses
+class StoredTables(Mapping):
+    def __init__(self, store, table_names):
+        self.store = store
+        self.table_names = list(table_names)
+
+    def __getitem__(self, table_name):
+        if table_name not in self.table_names:
+            raise KeyError(table_name)
+        return self.store.frame(table_name)
+
+    def __iter__(self):
+        return iter(self.table_names)
+
+    def __len__(self):
+        return len(self.table_names)
+
+# Jumlah baris per tabel tanpa memuat tabel dari store
+def _row_counts(tables):
+    if isinstance(tables, StoredTables):
+        return {name: tables.store.tables[name]['length'] for name in tables}
+    return {name: len(df) for name, df in tables.items()}
 
-    return pd.DataFrame(users)
+# 1. USER Table
+# Dibangun per kolom dengan NumPy. user_id diambil unik dari ruang
+# [id_start, id_start + id_space); default tetap 1000-9999 dan otomatis melebar bila n > 9000.
+def generate_dummy_users(n=1000, id_start=1000, id_space=None, start_date=None, end_date=None):
+    if id_space is None:
+        id_space = max(9000, n)
+    if n > id_space:
+        raise ValueError(f"id_space ({id_space}) lebih kecil dari jumlah user ({n})")
+
+    user_ids = id_start + rng.choice(id_space, size=n, replace=False).astype(np.int64)
+
+    # Default: terdaftar sejak awal dekade ini sampai sekarang
+    now = np.datetime64(end_date or _now(), 's')
+    decade_start = np.datetime64(start_date or datetime(_now().year // 10 * 10, 1, 1), 's')
+    registration_date = _random_datetimes_between(decade_start, now, n)
+    last_login = _random_datetimes_between(registration_date, now)
+
+    usernames = pd.Series(_sample_pool('user_name', n, size=5000))
+    email_domains = pd.Series(_sample_pool('free_email_domain', n, size=50))
+    emails = usernames + pd.Series(user_ids).astype(str) + '@' + email_domains
+
+    password_hash = np.frombuffer(binascii.hexlify(rng.bytes(32 * n)), dtype='S64').astype(str)
+    phone_number = np.char.add('+62 8', rng.integers(10**9, 10**10, n).astype(str))
+
+    return _apply_schema('users', pd.DataFrame({
+        "user_id": user_ids,
+        "username": usernames.to_numpy(),
+        "email": emails.to_numpy(),
+        "password_hash": password_hash.astype(object),
+        "phone_number": phone_number.astype(object),
+        "registration_date": registration_date,
+        "is_active": rng.integers(0, 2, n),
+        "last_login": last_login,
+        "profile_picture": _sample_pool('image_url', n),
+        "is_verified": rng.integers(0, 2, n),
+        "wallet_balance": np.round(rng.uniform(0, 10000, n), 2)
+    }))
 
 # 2. SELLER Table
-def generate_sellers(users_df, percentage=0.4):
+def generate_sellers(users_df, percentage=SELLER_PERCENTAGE, parent_index=None, total_products=None):
     num_sellers = int(len(users_df) * percentage)
-    seller_user_ids = random.sample(users_df['user_id'].tolist(), num_sellers)
-
-    sellers = []
-    for i, user_id in enumerate(seller_user_ids, 1):
-        user = users_df[users_df['user_id'] == user_id].iloc[0]
-        registration_date = user['registration_date']
-        joined_date = registration_date + timedelta(days=random.randint(1, 30))
-
-        sellers.append({
-            "seller_id": i,
-            "user_id": user_id,
-            "shop_name": fake.company(),
-            "description": fake.paragraph(),
-            "shop_banner": fake.image_url() if random.random() > 0.4 else '',
-            "shop_logo": fake.image_url() if random.random() > 0.3 else '',
-            "joined_date": joined_date,
-            "is_official": random.choice([0, 1]),
-            "rating": round(random.uniform(3.0, 5.0), 1),
-            "total_products": random.randint(5, 150),
-            "followers_count": random.randint(0, 5000)
-        })
-    return pd.DataFrame(sellers)
+    seller_user_ids = users_df['user_id'].to_numpy()[rng.choice(len(users_df), num_sellers, replace=False)]
+
+    parent_index = _parent_index(parent_index, 'users', users_df, 'user_id')
+    registration_dates = parent_index.gather('users', seller_user_ids, 'registration_date').to_numpy()
+    if total_products is None:
+        total_products = rng.integers(5, 151, num_sellers)
+    total_products = _check_planned(total_products, num_sellers, 'sellers')
+
+    return _apply_schema('sellers', pd.DataFrame({
+        "seller_id": np.arange(1, num_sellers + 1),
+        "user_id": seller_user_ids,
+        "shop_name": _sample_pool('company', num_sellers, size=2000),
+        "description": _sample_text('paragraph', num_sellers, size=2000),
+        "shop_banner": _sample_text('image_url', num_sellers, empty_ratio=0.4),
+        "shop_logo": _sample_text('image_url', num_sellers, empty_ratio=0.3),
+        "joined_date": registration_dates.astype('datetime64[s]') + rng.integers(1, 31, num_sellers).astype('timedelta64[D]'),
+        "is_official": rng.integers(0, 2, num_sellers),
+        "rating": np.round(rng.uniform(3.0, 5.0, num_sellers), 1),
+        "total_products": total_products,
+        "followers_count": rng.integers(0, 5001, num_sellers)
+    }))
 
 # 3. BUYER Table
-def generate_buyers(users_df):
-    buyers = []
-    for i, user in users_df.iterrows():
-        has_purchased = random.random() > 0.2
-        orders_count = random.randint(0, 20) if has_purchased else 0
-        last_purchase = fake.date_time_between(start_date=user['registration_date'], end_date='now') if has_purchased else pd.Timestamp('1970-01-01')
-
-        buyers.append({
-            "buyer_id": i + 1,
-            "user_id": user['user_id'],
-            "total_spent": round(random.uniform(0, 10000000), 2) if orders_count > 0 else 0,
-            "orders_count": orders_count,
-            "last_purchase": last_purchase
-        })
-    return pd.DataFrame(buyers)
+# 20% user belum pernah membeli; sisanya 0-20 order. last_purchase hanya terisi bila ada order.
+def generate_buyers(users_df, parent_index=None, orders_count=None):
+    parent_index = _parent_index(parent_index, 'users', users_df, 'user_id')
+    registration_dates = parent_index.gather('users', users_df['user_id'], 'registration_date').to_numpy()
+
+    n = len(users_df)
+    if orders_count is None:
+        orders_count = np.where(rng.random(n) > 0.2, rng.integers(0, 21, n), 0)
+    orders_count = _check_planned(orders_count, n, 'buyers')
+    has_orders = orders_count > 0
+    last_purchase = _random_datetimes_between(registration_dates, np.datetime64(_now(), 's'))
+
+    return _apply_schema('buyers', pd.DataFrame({
+        "buyer_id": np.arange(1, n + 1),
+        "user_id": users_df['user_id'].to_numpy(),
+        "total_spent": np.where(has_orders, np.round(rng.uniform(0, 10000000, n), 2), 0.0),
+        "orders_count": orders_count,
+        "last_purchase": np.where(has_orders, last_purchase, np.datetime64('NaT', 's'))
+    }))
 
 # 4. ADDRESS Table
-def generate_addresses(users_df):
-    addresses = []
-    address_id = 1
-
-    for _, user in users_df.iterrows():
-        num_addresses = random.randint(1, 3)
-
-        for j in range(num_addresses):
-            address_line2 = f"RT {random.randint(1, 20)}/RW {random.randint(1, 10)}, {fake.street_name()}" if random.random() > 0.5 else ''
-
-            addresses.append({
-                "address_id": address_id,
-                "user_id": user['user_id'],
-                "recipient_name": fake.name(),
-                "phone_number": fake.phone_number(),
-                "address_line1": fake.street_address(),
-                "address_line2": address_line2,
-                "city": fake.city(),
-                "postal_code": fake.postcode(),
-                "province": fake.state(),
-                "country": "Indonesia",
-                "is_default": 1 if j == 0 else 0,
-                "label": random.choice(['Rumah', 'Kantor', 'Kost', 'Apartemen', 'Alamat Pengiriman'])
-            })
-            address_id += 1
-
-    return pd.DataFrame(addresses)
+# 1-3 alamat per user; alamat pertama adalah default
+def generate_addresses(users_df, counts=None):
+    user_pos, address_pos = _expand(_fan_out(counts, len(users_df), 'addresses'))
+    n = len(user_pos)
+
+    address_line2 = _join_text('RT ', rng.integers(1, 21, n), '/RW ', rng.integers(1, 11, n), ', ',
+                               _sample_pool('street_name', n))
+    return _apply_schema('addresses', pd.DataFrame({
+        "address_id": np.arange(1, n + 1),
+        "user_id": users_df['user_id'].to_numpy()[user_pos],
+        "recipient_name": _sample_pool('name', n, size=5000),
+        "phone_number": _sample_pool('phone_number', n, size=5000),
+        "address_line1": _sample_pool('street_address', n, size=5000),
+        "address_line2": np.where(rng.random(n) > 0.5, address_line2, ''),
+        "city": _sample_pool('city', n),
+        "postal_code": _sample_pool('postcode', n, size=5000),
+        "province": _sample_text('state', n, size=200),
+        "country": "Indonesia",
+        "is_default": address_pos == 0,
+        "label": _batched_choice(['Rumah', 'Kantor', 'Kost', 'Apartemen', 'Alamat Pengiriman'], n)
+    }))
 
 # 5. PRODUCT_CATEGORY Table
 def generate_product_categories():
@@ -152,693 +1086,1123 @@ def generate_product_categories():
         category['description'] = f"Kategori untuk produk {category['category_name']}"
         category['icon_url'] = f"https://ecommerce.com/categories/icons/{category['category_id']}.png"
 
-    return pd.DataFrame(categories)
+    return _apply_schema('product_categories', pd.DataFrame(categories))
 
 # 6. PRODUCT Table
-def generate_products(sellers_df, categories_df):
-    products = []
-    product_id = 1
-
+# 3-10 produk per seller (maksimal total_products seller); kategori daun diambil
+# sesuai model popularitas
+def generate_products(sellers_df, categories_df, parent_index=None, counts=None):
     parent_categories = categories_df[categories_df['parent_category_id'].notna()]['parent_category_id'].unique().tolist()
     leaf_categories = categories_df[~categories_df['category_id'].isin(parent_categories)]['category_id'].tolist()
 
-    for _, seller in sellers_df.iterrows():
-        num_products = min(random.randint(3, 10), seller['total_products'])
-
-        for _ in range(num_products):
-            category_id = random.choice(leaf_categories)
-            created_at = fake.date_time_between(start_date=seller['joined_date'], end_date='now')
-            updated_at = fake.date_time_between(start_date=created_at, end_date='now')
-
-            min_price = round(random.uniform(10000, 5000000), -3)
-            max_price = min_price * random.uniform(1, 1.5)
-
-            products.append({
-                "product_id": product_id,
-                "seller_id": seller['seller_id'],
-                "category_id": category_id,
-                "product_name": fake.catch_phrase(),
-                "description": fake.paragraph(),
-                "long_description": fake.text(max_nb_chars=1000),
-                "min_price": min_price,
-                "max_price": max_price,
-                "seller_sku": fake.bothify(text='???-#####'),
-                "total_stock": random.randint(0, 1000),
-                "rating": round(random.uniform(1.0, 5.0), 1) if random.random() > 0.2 else 0,
-                "sold_count": random.randint(0, 500),
-                "views_count": random.randint(10, 5000),
-                "is_active": random.choice([0, 1]),
-                "created_at": created_at,
-                "updated_at": updated_at
-            })
-            product_id += 1
-
-    return pd.DataFrame(products)
+    parent_index = _parent_index(parent_index, 'sellers', sellers_df, 'seller_id')
+    seller_ids = sellers_df['seller_id'].to_numpy()
+    joined_dates = parent_index.gather('sellers', seller_ids, 'joined_date').to_numpy().astype('datetime64[s]')
+    if counts is None:
+        total_products = parent_index.gather('sellers', seller_ids, 'total_products').to_numpy()
+        counts = np.minimum(_fan_out(None, len(sellers_df), 'products'), total_products)
+    seller_pos, _ = _expand(_check_planned(counts, len(sellers_df), 'products'))
+    n = len(seller_pos)
+
+    now = np.datetime64(_now(), 's')
+    created_at = _random_datetimes_between(joined_dates[seller_pos], now)
+    min_price = np.round(rng.uniform(10000, 5000000, n), -3)
+
+    return _apply_schema('products', pd.DataFrame({
+        "product_id": np.arange(1, n + 1),
+        "seller_id": seller_ids[seller_pos],
+        "category_id": np.asarray(leaf_categories)[_popularity_sampler(len(leaf_categories)).sample(n)],
+        "product_name": _sample_text('catch_phrase', n, size=2000),
+        "description": _sample_text('paragraph', n, size=2000),
+        "long_description": _sample_text('text', n, size=1000, max_nb_chars=1000),
+        "min_price": min_price,
+        "max_price": min_price * rng.uniform(1, 1.5, n),
+        "seller_sku": _random_codes(_join_text(_random_letters(n, 3), '-'), 5, n),
+        "total_stock": rng.integers(0, 1001, n),
+        "rating": np.where(rng.random(n) > 0.2, np.round(rng.uniform(1.0, 5.0, n), 1), 0.0),
+        "sold_count": rng.integers(0, 501, n),
+        "views_count": rng.integers(10, 5001, n),
+        "is_active": rng.integers(0, 2, n),
+        "created_at": created_at,
+        "updated_at": _random_datetimes_between(created_at, now)
+    }))
 
 # 7. PRODUCT_VARIANT Table
-def generate_product_variants(products_df):
-    variants = []
-    variant_id = 1
-
-    for _, product in products_df.iterrows():
-        num_variants = random.randint(1, 5)
-
-        for v in range(num_variants):
-            price_modifier = random.uniform(0.9, 1.1)
-            price = round(product['min_price'] * price_modifier, -3)
-
-            variant_name = fake.word().capitalize()
-            if num_variants > 1:
-                variant_name = f"{variant_name} - Variant {v+1}"
-
-            variants.append({
-                "variant_id": variant_id,
-                "product_id": product['product_id'],
-                "variant_name": variant_name,
-                "sku": f"{product['seller_sku']}-{v+1}",
-                "price": price,
-                "stock": random.randint(0, int(product['total_stock'] / num_variants)),
-                "image_url": fake.image_url(),
-                "is_active": random.choice([0, 1])
-            })
-            variant_id += 1
-
-    return pd.DataFrame(variants)
+# 1-5 variant per produk; harga +-10% dari min_price produk, stok dibagi rata
+def generate_product_variants(products_df, parent_index=None, counts=None):
+    parent_index = _parent_index(parent_index, 'products', products_df, 'product_id')
+    product_ids = products_df['product_id'].to_numpy()
+    min_prices = parent_index.gather('products', product_ids, 'min_price').to_numpy()
+    seller_skus = parent_index.gather('products', product_ids, 'seller_sku').to_numpy()
+    total_stocks = parent_index.gather('products', product_ids, 'total_stock').to_numpy()
+
+    counts = _fan_out(counts, len(products_df), 'product_variants')
+    product_pos, variant_pos = _expand(counts)
+    n = len(product_pos)
+    num_variants = counts[product_pos]
+
+    word = np.char.capitalize(_sample_pool('word', n).astype(str))
+    variant_name = np.where(num_variants > 1, _join_text(word, ' - Variant ', variant_pos + 1), word)
+
+    return _apply_schema('product_variants', pd.DataFrame({
+        "variant_id": np.arange(1, n + 1),
+        "product_id": product_ids[product_pos],
+        "variant_name": variant_name.astype(object),
+        "sku": _join_text(seller_skus[product_pos], '-', variant_pos + 1).astype(object),
+        "price": np.round(min_prices[product_pos] * rng.uniform(0.9, 1.1, n), -3),
+        "stock": rng.integers(0, total_stocks[product_pos] // num_variants + 1),
+        "image_url": _sample_text('image_url', n),
+        "is_active": rng.integers(0, 2, n)
+    }))
 
 # 8. VARIANT_OPTION Table
-def generate_variant_options(variants_df):
-    options = []
-    option_id = 1
-
+# 1-3 opsi per variant dengan tipe berbeda-beda: tipe diambil dari urutan acak tipe per variant
+def generate_variant_options(variants_df, counts=None):
     variant_types = {
         'Warna': ['Merah', 'Biru', 'Hitam', 'Putih', 'Abu-abu', 'Coklat', 'Hijau', 'Kuning', 'Pink', 'Ungu'],
         'Ukuran': ['S', 'M', 'L', 'XL', 'XXL', '36', '37', '38', '39', '40', '41', '42', '43'],
         'Kapasitas': ['32GB', '64GB', '128GB', '256GB', '512GB', '1TB'],
         'Tipe': ['Regular', 'Premium', 'Deluxe', 'Limited', 'Special'],
     }
-
-    for _, variant in variants_df.iterrows():
-        num_options = random.randint(1, 3)
-        option_types = random.sample(list(variant_types.keys()), num_options)
-
-        for option_type in option_types:
-            option_value = random.choice(variant_types[option_type])
-
-            options.append({
-                "option_id": option_id,
-                "variant_id": variant['variant_id'],
-                "option_type": option_type,
-                "option_value": option_value
-            })
-            option_id += 1
-
-    return pd.DataFrame(options)
+    type_names = np.array(list(variant_types), dtype=object)
+    values = np.array([v for options in variant_types.values() for v in options], dtype=object)
+    sizes = np.array([len(options) for options in variant_types.values()])
+    offsets = np.cumsum(sizes) - sizes
+
+    counts = np.minimum(_fan_out(counts, len(variants_df), 'variant_options'), len(type_names))
+    variant_pos, option_pos = _expand(counts)
+    n = len(variant_pos)
+    type_order = np.argsort(rng.random((len(variants_df), len(type_names))), axis=1)
+    type_idx = type_order[variant_pos, option_pos]
+
+    return _apply_schema('variant_options', pd.DataFrame({
+        "option_id": np.arange(1, n + 1),
+        "variant_id": variants_df['variant_id'].to_numpy()[variant_pos],
+        "option_type": type_names[type_idx],
+        "option_value": values[offsets[type_idx] + (rng.random(n) * sizes[type_idx]).astype(np.int64)]
+    }))
 
 # 9. PRODUCT_IMAGE Table
-def generate_product_images(products_df):
-    images = []
-    image_id = 1
-
-    for _, product in products_df.iterrows():
-        num_images = random.randint(1, 5)
-
-        for i in range(num_images):
-            is_primary = 1 if i == 0 else 0
-
-            images.append({
-                "image_id": image_id,
-                "product_id": product['product_id'],
-                "image_url": fake.image_url(),
-                "is_primary": is_primary,
-                "display_order": i + 1
-            })
-            image_id += 1
-
-    return pd.DataFrame(images)
+# 1-5 gambar per produk; gambar pertama adalah gambar utama
+def generate_product_images(products_df, counts=None):
+    product_pos, image_pos = _expand(_fan_out(counts, len(products_df), 'product_images'))
+    n = len(product_pos)
+    return _apply_schema('product_images', pd.DataFrame({
+        "image_id": np.arange(1, n + 1),
+        "product_id": products_df['product_id'].to_numpy()[product_pos],
+        "image_url": _sample_text('image_url', n),
+        "is_primary": image_pos == 0,
+        "display_order": image_pos + 1
+    }))
 
 # 10. CART Table
-def generate_carts(users_df):
-    carts = []
-
-    for _, user in users_df.iterrows():
-        carts.append({
-            "cart_id": len(carts) + 1,
-            "user_id": user['user_id'],
-            "last_updated": fake.date_time_between(start_date=user['registration_date'], end_date='now')
-        })
+def generate_carts(users_df, parent_index=None):
+    parent_index = _parent_index(parent_index, 'users', users_df, 'user_id')
+    registration_dates = parent_index.gather('users', users_df['user_id'], 'registration_date')
 
-    return pd.DataFrame(carts)
+    n = len(users_df)
+    return _apply_schema('carts', pd.DataFrame({
+        "cart_id": np.arange(1, n + 1),
+        "user_id": users_df['user_id'].to_numpy(),
+        "last_updated": _random_datetimes_between(registration_dates.to_numpy(), np.datetime64(_now(), 's'))
+    }))
 
 # 11. CART_ITEM Table
-def generate_cart_items(carts_df, variants_df, active_cart_percentage=0.7):
-    cart_items = []
-    cart_item_id = 1
-
-    active_cart_ids = random.sample(carts_df['cart_id'].tolist(),
-                                    int(len(carts_df) * active_cart_percentage))
-
-    for cart_id in active_cart_ids:
-        num_items = random.randint(1, 5)
-        cart = carts_df[carts_df['cart_id'] == cart_id].iloc[0]
-
-        sample_variants = variants_df.sample(num_items) if len(variants_df) >= num_items else variants_df
-
-        for _, variant in sample_variants.iterrows():
-            added_at = fake.date_time_between(start_date='-30d', end_date='now')
-
-            cart_items.append({
-                "cart_item_id": cart_item_id,
-                "cart_id": cart_id,
-                "variant_id": variant['variant_id'],
-                "quantity": random.randint(1, 5),
-                "price_at_addition": variant['price'],
-                "added_at": added_at,
-                "is_selected": random.choice([0, 1])
-            })
-            cart_item_id += 1
-
-    return pd.DataFrame(cart_items)
-
-# 12. ORDER Table
-def generate_orders(buyers_df):
-    orders = []
-    order_id = 1
-
-    for _, buyer in buyers_df.iterrows():
-        if buyer['orders_count'] > 0:
-            for _ in range(int(buyer['orders_count'])):
-                order_date = fake.date_time_between(start_date='-2y', end_date='now')
-
-                subtotal = round(random.uniform(50000, 2000000), -3)
-                shipping_fee = round(random.uniform(10000, 50000), -3)
-                platform_fee = round(subtotal * 0.05, -3)
-                tax = round(subtotal * 0.11, -3)
-
-                discount = 0
-                if random.random() < 0.3:
-                    discount = round(subtotal * random.uniform(0.05, 0.2), -3)
-
-                total_amount = subtotal + shipping_fee + platform_fee + tax - discount
-
-                payment_method = random.choice(['Credit Card', 'Bank Transfer', 'E-Wallet', 'COD', 'QRIS'])
-                payment_status = random.choice(['Pending', 'Paid', 'Failed', 'Refunded'])
-
-                payment_date = order_date
-                if payment_status == 'Paid':
-                    payment_date = order_date + timedelta(hours=random.randint(1, 24))
-                elif payment_status == 'Failed':
-                    payment_date = order_date + timedelta(hours=random.randint(24, 72))
-                elif payment_status == 'Refunded':
-                    payment_date = order_date + timedelta(days=random.randint(1, 7))
-
-                orders.append({
-                    "order_id": order_id,
-                    "buyer_id": buyer['buyer_id'],
-                    "order_number": fake.bothify(text='ORD-########'),
-                    "order_date": order_date,
-                    "subtotal": subtotal,
-                    "shipping_fee": shipping_fee,
-                    "platform_fee": platform_fee,
-                    "tax": tax,
-                    "discount": discount,
-                    "total_amount": total_amount,
-                    "payment_method": payment_method,
-                    "payment_status": payment_status,
-                    "payment_date": payment_date if payment_status != 'Pending' else pd.Timestamp('1970-01-01')
-                })
-                order_id += 1
-
-    return pd.DataFrame(orders)
-
-# 13. ORDER_ITEM Table
-def generate_order_items(orders_df, sellers_df, variants_df):
-    order_items = []
-    order_item_id = 1
-
+# Jumlah item per cart diambil sekaligus; variant diambil sesuai model popularitas
+# dan tetap berbeda dalam satu cart
+def generate_cart_items(carts_df, variants_df, active_cart_percentage=ACTIVE_CART_PERCENTAGE, products_df=None,
+                        counts=None):
+    num_active = int(len(carts_df) * active_cart_percentage)
+    active_cart_ids = carts_df['cart_id'].to_numpy()[rng.choice(len(carts_df), num_active, replace=False)]
+
+    num_variants = len(variants_df)
+    cart_pos, _ = _expand(np.minimum(_fan_out(counts, num_active, 'cart_items'), num_variants))
+    sampler = _popularity_sampler(num_variants, _variant_weights(variants_df, products_df))
+    variant_pos = _distinct_in_group(cart_pos, sampler, num_variants)
+    n = len(cart_pos)
+
+    now = np.datetime64(_now(), 's')
+    return _apply_schema('cart_items', pd.DataFrame({
+        "cart_item_id": np.arange(1, n + 1),
+        "cart_id": active_cart_ids[cart_pos],
+        "variant_id": variants_df['variant_id'].to_numpy()[variant_pos],
+        "quantity": rng.integers(1, 6, n),
+        "price_at_addition": variants_df['price'].to_numpy()[variant_pos],
+        "added_at": _random_datetimes_between(now - np.timedelta64(30, 'D'), now, n),
+        "is_selected": rng.integers(0, 2, n)
+    }))
+
+# Seller item order diambil sesuai model popularitas dan unik dalam satu order (ambil
+# ulang lalu geser, lewat _distinct_in_group). Bila item lebih banyak dari jumlah seller,
+# item sisanya bebas memakai seller yang sudah muncul.
+def _order_sellers(num_sellers, order_pos, item_pos):
+    sampler = _popularity_sampler(num_sellers)
+    distinct = item_pos < num_sellers
+    seller_pos = np.empty(len(order_pos), dtype=np.int64)
+    seller_pos[distinct] = _distinct_in_group(order_pos[distinct], sampler, num_sellers)
+    seller_pos[~distinct] = sampler.sample(int((~distinct).sum()))
+    return seller_pos
+
+# Status dan timeline item order dari status pembayaran dan tanggal order-nya
+# (datetime64[s]): status_updated, tracking, metode kirim dan estimasi tiba
+def _order_item_timeline(payment_status, order_date, end_date):
     order_status_flow = ['Processing', 'Shipped', 'Delivered', 'Completed', 'Cancelled', 'Returned']
+    shipped_statuses = ['Shipped', 'Delivered', 'Completed']
+    n = len(payment_status)
+
+    order_status = _batched_choice(order_status_flow, n, weights=[0.1, 0.2, 0.3, 0.3, 0.05, 0.05])
+    order_status[payment_status == 'Pending'] = 'Processing'
+    refunded = payment_status == 'Refunded'
+    order_status[refunded] = _batched_choice(['Returned', 'Cancelled'], refunded.sum())
+
+    status_days = np.select(
+        [order_status == 'Shipped', order_status == 'Delivered', order_status == 'Completed'],
+        [rng.integers(1, 3, n), rng.integers(3, 8, n), rng.integers(8, 15, n)],
+        default=0
+    )
+    # Item yang belum sempat mencapai statusnya sebelum end_date mundur ke tahap yang
+    # sudah lewat (Completed -> Delivered -> Shipped -> Processing)
+    elapsed_days = (np.datetime64(end_date, 's') - order_date) // np.timedelta64(1, 'D')
+    late = np.isin(order_status, shipped_statuses) & (status_days > elapsed_days)
+    status_days[late] = elapsed_days[late]
+    order_status[late] = np.select(
+        [status_days[late] >= 8, status_days[late] >= 3, status_days[late] >= 1],
+        ['Completed', 'Delivered', 'Shipped'],
+        default='Processing'
+    )
+    status_updated = order_date + status_days.astype('timedelta64[D]')
+
+    shipped = np.isin(order_status, shipped_statuses)
+    tracking_number = np.where(shipped, _random_codes('TRK-', 8, n), '')
+    shipping_method = np.where(shipped, _batched_choice(['Regular', 'Express', 'Same Day', 'Economy'], n), '')
+    estimated_delivery = np.where(
+        shipped,
+        np.minimum(order_date + rng.integers(3, 11, n).astype('timedelta64[D]'), np.datetime64(end_date, 's')),
+        np.datetime64('NaT', 's')
+    )
+    return {
+        "order_status": order_status,
+        "status_updated": status_updated,
+        "tracking_number": tracking_number.astype(object),
+        "shipping_method": shipping_method.astype(object),
+        "estimated_delivery": estimated_delivery,
+    }
 
-    for _, order in orders_df.iterrows():
-        if order['payment_status'] == 'Failed':
-            continue
-
-        num_items = random.randint(1, 5)
-        seller_ids = sellers_df.sample(min(num_items, len(sellers_df)))['seller_id'].tolist()
-
-        for i in range(num_items):
-            seller_id = seller_ids[i % len(seller_ids)]
-            variant = variants_df.sample().iloc[0]
-
-            quantity = random.randint(1, 3)
-            unit_price = variant['price']
-            subtotal = unit_price * quantity
-
-            if order['payment_status'] == 'Pending':
-                order_status = 'Processing'
-            elif order['payment_status'] == 'Refunded':
-                order_status = random.choice(['Returned', 'Cancelled'])
-            else:
-                order_status = random.choices(
-                    order_status_flow,
-                    weights=[0.1, 0.2, 0.3, 0.3, 0.05, 0.05],
-                    k=1
-                )[0]
-
-            status_updated = order['order_date']
-            if order_status == 'Shipped':
-                status_updated = order['order_date'] + timedelta(days=random.randint(1, 2))
-            elif order_status == 'Delivered':
-                status_updated = order['order_date'] + timedelta(days=random.randint(3, 7))
-            elif order_status == 'Completed':
-                status_updated = order['order_date'] + timedelta(days=random.randint(8, 14))
-
-            tracking_number = fake.bothify(text='TRK-########') if order_status in ['Shipped', 'Delivered', 'Completed'] else ''
-            shipping_method = random.choice(['Regular', 'Express', 'Same Day', 'Economy']) if order_status in ['Shipped', 'Delivered', 'Completed'] else ''
-            estimated_delivery = order['order_date'] + timedelta(days=random.randint(3, 10)) if order_status in ['Shipped', 'Delivered', 'Completed'] else pd.Timestamp('1970-01-01')
-
-            order_items.append({
-                "order_item_id": order_item_id,
-                "order_id": order['order_id'],
-                "seller_id": seller_id,
-                "variant_id": variant['variant_id'],
-                "quantity": quantity,
-                "unit_price": unit_price,
-                "subtotal": subtotal,
-                "order_status": order_status,
-                "status_updated": status_updated,
-                "tracking_number": tracking_number,
-                "shipping_method": shipping_method,
-                "estimated_delivery": estimated_delivery
-            })
-            order_item_id += 1
-
-    return pd.DataFrame(order_items)
+# 12-13. ORDER + ORDER_ITEM Table (digabung)
+# Kedua tabel dibuat dalam satu pass kolom: keranjang tiap order diambil lebih dulu,
+# subtotal order dijumlahkan dari item-nya, lalu timeline pembayaran dan status item
+# dihitung dengan aritmetika datetime64. Order dengan pembayaran Failed tetap punya
+# subtotal dari keranjangnya, tetapi item-nya tidak ditulis.
+def generate_orders_with_items(buyers_df, sellers_df, variants_df, start_date=None, end_date=None,
+                               products_df=None, payment_status=None, counts=None):
+    end_date = end_date or _now()
+    start_date = start_date or end_date - timedelta(days=730)
+
+    buyer_pos, _ = _expand(buyers_df['orders_count'].to_numpy())
+    m = len(buyer_pos)
+
+    order_date = _random_datetimes_between(np.datetime64(start_date, 's'), np.datetime64(end_date, 's'), m)
+    payment_method = _batched_choice(['Credit Card', 'Bank Transfer', 'E-Wallet', 'COD', 'QRIS'], m)
+    if payment_status is None:
+        payment_status = _batched_choice(PAYMENT_STATUSES, m)
+    payment_status = _check_planned(np.asarray(payment_status, dtype=object), m, 'orders')
+    payment_delay = np.select(
+        [payment_status == 'Paid', payment_status == 'Failed', payment_status == 'Refunded'],
+        [rng.integers(1, 25, m) * 3600, rng.integers(24, 73, m) * 3600, rng.integers(1, 8, m) * 86400],
+        default=0
+    )
+    payment_date = np.where(payment_status == 'Pending', np.datetime64('NaT', 's'),
+                            np.minimum(order_date + payment_delay.astype('timedelta64[s]'),
+                                       np.datetime64(end_date, 's')))
+
+    # Keranjang: 1-5 item per order, seller dalam satu order berbeda-beda
+    order_pos, item_pos = _expand(_fan_out(counts, m, 'order_items'))
+    seller_pos = _order_sellers(len(sellers_df), order_pos, item_pos)
+    variant_sampler = _popularity_sampler(len(variants_df), _variant_weights(variants_df, products_df))
+    variant_pos = variant_sampler.sample(len(order_pos))
+    unit_price = variants_df['price'].to_numpy()[variant_pos]
+    quantity = rng.integers(1, 4, len(order_pos))
+    item_subtotal = unit_price * quantity
+
+    subtotal = np.bincount(order_pos, weights=item_subtotal, minlength=m)
+    shipping_fee = np.round(rng.uniform(10000, 50000, m), -3)
+    platform_fee = np.round(subtotal * 0.05, -3)
+    tax = np.round(subtotal * 0.11, -3)
+    discount = np.where(rng.random(m) < 0.3, np.round(subtotal * rng.uniform(0.05, 0.2, m), -3), 0.0)
+
+    order_ids = np.arange(1, m + 1)
+    orders_df = _apply_schema('orders', pd.DataFrame({
+        "order_id": order_ids,
+        "buyer_id": buyers_df['buyer_id'].to_numpy()[buyer_pos],
+        "order_number": _random_codes('ORD-', 8, m),
+        "order_date": order_date,
+        "subtotal": subtotal,
+        "shipping_fee": shipping_fee,
+        "platform_fee": platform_fee,
+        "tax": tax,
+        "discount": discount,
+        "total_amount": subtotal + shipping_fee + platform_fee + tax - discount,
+        "payment_method": payment_method,
+        "payment_status": payment_status,
+        "payment_date": payment_date
+    }))
+
+    kept = payment_status[order_pos] != 'Failed'
+    order_pos = order_pos[kept]
+    n = len(order_pos)
+    order_items_df = _apply_schema('order_items', pd.DataFrame({
+        "order_item_id": np.arange(1, n + 1),
+        "order_id": order_ids[order_pos],
+        "seller_id": sellers_df['seller_id'].to_numpy()[seller_pos[kept]],
+        "variant_id": variants_df['variant_id'].to_numpy()[variant_pos[kept]],
+        "quantity": quantity[kept],
+        "unit_price": unit_price[kept],
+        "subtotal": item_subtotal[kept],
+        **_order_item_timeline(payment_status[order_pos], order_date[order_pos], end_date)
+    }))
+    return orders_df, order_items_df
 
 # 14. VOUCHER Table
-def generate_vouchers(sellers_df):
-    vouchers = []
-    voucher_id = 1
-
-    for _, seller in sellers_df.iterrows():
-        num_vouchers = random.randint(0, 5)
-
-        for _ in range(num_vouchers):
-            is_percentage = random.choice([0, 1])
-
-            if is_percentage:
-                discount_amount = random.randint(5, 50)
-                minimum_purchase = round(random.uniform(50000, 200000), -3)
-            else:
-                discount_amount = round(random.uniform(10000, 100000), -3)
-                minimum_purchase = round(discount_amount * random.uniform(2, 5), -3)
-
-            is_free_shipping = random.choice([0, 1])
-            start_date_v = fake.date_between(start_date='-1y', end_date='+3m')
-            end_date_v = fake.date_between(start_date=start_date_v, end_date=start_date_v + timedelta(days=90))
-
-            vouchers.append({
-                "voucher_id": voucher_id,
-                "seller_id": seller['seller_id'],
-                "code": fake.bothify(text='???###').upper(),
-                "description": fake.sentence(),
-                "discount_amount": discount_amount,
-                "minimum_purchase": minimum_purchase,
-                "is_percentage": is_percentage,
-                "is_free_shipping": is_free_shipping,
-                "usage_limit": random.randint(50, 1000),
-                "times_used": random.randint(0, 49),
-                "start_date": start_date_v,
-                "end_date": end_date_v,
-                "is_active": random.choice([0, 1])
-            })
-            voucher_id += 1
-
-    return pd.DataFrame(vouchers)
+# 0-5 voucher per seller: potongan persen (5-50%) atau nominal, berlaku hingga 90 hari.
+# Mulai antara setahun lalu dan 3 bulan ke depan (voucher yang akan datang)
+def generate_vouchers(sellers_df, counts=None):
+    seller_pos, _ = _expand(_fan_out(counts, len(sellers_df), 'vouchers'))
+    n = len(seller_pos)
+
+    is_percentage = rng.integers(0, 2, n).astype(bool)
+    discount_amount = np.where(is_percentage, rng.integers(5, 51, n), np.round(rng.uniform(10000, 100000, n), -3))
+    minimum_purchase = np.where(is_percentage, np.round(rng.uniform(50000, 200000, n), -3),
+                                np.round(discount_amount * rng.uniform(2, 5, n), -3))
+    start_date = np.datetime64(_now().date(), 'D') - rng.integers(-90, 366, n).astype('timedelta64[D]')
+
+    return _apply_schema('vouchers', pd.DataFrame({
+        "voucher_id": np.arange(1, n + 1),
+        "seller_id": sellers_df['seller_id'].to_numpy()[seller_pos],
+        "code": _random_codes(np.char.upper(_random_letters(n, 3)), 3, n),
+        "description": _sample_text('sentence', n, size=5000),
+        "discount_amount": discount_amount,
+        "minimum_purchase": minimum_purchase,
+        "is_percentage": is_percentage,
+        "is_free_shipping": rng.integers(0, 2, n),
+        "usage_limit": rng.integers(50, 1001, n),
+        "times_used": rng.integers(0, 50, n),
+        "start_date": start_date,
+        "end_date": start_date + rng.integers(0, 91, n).astype('timedelta64[D]'),
+        "is_active": rng.integers(0, 2, n)
+    }))
 
 # 15. USER_VOUCHER Table
-def generate_user_vouchers(users_df, vouchers_df):
-    user_vouchers = []
-    user_voucher_id = 1
-
-    for _, user in users_df.iterrows():
-        num_vouchers = random.randint(0, 3)
-
-        if num_vouchers > 0 and len(vouchers_df) > 0:
-            sample_vouchers = vouchers_df.sample(min(num_vouchers, len(vouchers_df)))
-
-            for _, voucher in sample_vouchers.iterrows():
-                is_used = random.choice([0, 1])
-                used_at = fake.date_time_between(start_date='-30d', end_date='now') if is_used else pd.Timestamp('1970-01-01')
-                expires_at = fake.date_time_between(start_date='now', end_date='+30d')
-
-                user_vouchers.append({
-                    "user_voucher_id": user_voucher_id,
-                    "user_id": user['user_id'],
-                    "voucher_id": voucher['voucher_id'],
-                    "is_used": is_used,
-                    "used_at": used_at,
-                    "expires_at": expires_at
-                })
-                user_voucher_id += 1
-
-    return pd.DataFrame(user_vouchers)
+# 0-3 voucher berbeda per user; used_at dalam 30 hari terakhir bila sudah dipakai
+def generate_user_vouchers(users_df, vouchers_df, counts=None):
+    num_vouchers = len(vouchers_df)
+    user_pos, _ = _expand(np.minimum(_fan_out(counts, len(users_df), 'user_vouchers'), num_vouchers))
+    n = len(user_pos)
+    voucher_pos = _distinct_in_group(user_pos, _UniformSampler(num_vouchers), num_vouchers)
+
+    now = np.datetime64(_now(), 's')
+    is_used = rng.integers(0, 2, n).astype(bool)
+    used_at = _random_datetimes_between(now - np.timedelta64(30, 'D'), now, n)
+    return _apply_schema('user_vouchers', pd.DataFrame({
+        "user_voucher_id": np.arange(1, n + 1),
+        "user_id": users_df['user_id'].to_numpy()[user_pos],
+        "voucher_id": vouchers_df['voucher_id'].to_numpy()[voucher_pos],
+        "is_used": is_used,
+        "used_at": np.where(is_used, used_at, np.datetime64('NaT', 's')),
+        "expires_at": _random_datetimes_between(now, now + np.timedelta64(30, 'D'), n)
+    }))
 
 # 16. WISHLIST Table
-def generate_wishlists(users_df):
-    wishlists = []
-    wishlist_id = 1
-
-    for _, user in users_df.iterrows():
-        num_wishlists = random.randint(0, 2)
-
-        for i in range(num_wishlists):
-            created_at = fake.date_time_between(start_date=user['registration_date'], end_date='now')
-
-            name = "Wishlist Saya"
-            if i > 0:
-                name = f"Wishlist {fake.word().capitalize()}"
-
-            wishlists.append({
-                "wishlist_id": wishlist_id,
-                "user_id": user['user_id'],
-                "name": name,
-                "is_public": random.choice([0, 1]),
-                "created_at": created_at
-            })
-            wishlist_id += 1
-
-    return pd.DataFrame(wishlists)
+# 0-2 wishlist per user; wishlist pertama bernama "Wishlist Saya"
+def generate_wishlists(users_df, parent_index=None, counts=None):
+    parent_index = _parent_index(parent_index, 'users', users_df, 'user_id')
+    registration_dates = parent_index.gather('users', users_df['user_id'], 'registration_date').to_numpy()
+
+    user_pos, wishlist_pos = _expand(_fan_out(counts, len(users_df), 'wishlists'))
+    n = len(user_pos)
+    word = np.char.capitalize(_sample_pool('word', n).astype(str))
+
+    return _apply_schema('wishlists', pd.DataFrame({
+        "wishlist_id": np.arange(1, n + 1),
+        "user_id": users_df['user_id'].to_numpy()[user_pos],
+        "name": np.where(wishlist_pos == 0, 'Wishlist Saya', _join_text('Wishlist ', word)).astype(object),
+        "is_public": rng.integers(0, 2, n),
+        "created_at": _random_datetimes_between(registration_dates[user_pos], np.datetime64(_now(), 's'))
+    }))
 
 # 17. WISHLIST_ITEM Table
-def generate_wishlist_items(wishlists_df, products_df):
-    wishlist_items = []
-    wishlist_item_id = 1
-
-    for _, wishlist in wishlists_df.iterrows():
-        num_items = random.randint(1, 10)
-        sample_products = products_df.sample(min(num_items, len(products_df)))
-
-        for _, product in sample_products.iterrows():
-            added_at = fake.date_time_between(start_date=wishlist['created_at'], end_date='now')
-
-            wishlist_items.append({
-                "wishlist_item_id": wishlist_item_id,
-                "wishlist_id": wishlist['wishlist_id'],
-                "product_id": product['product_id'],
-                "added_at": added_at
-            })
-            wishlist_item_id += 1
-
-    return pd.DataFrame(wishlist_items)
+# 1-10 produk berbeda per wishlist diambil sekaligus sesuai model popularitas;
+# added_at antara created_at wishlist dan sekarang
+def generate_wishlist_items(wishlists_df, products_df, counts=None):
+    num_products = len(products_df)
+    wishlist_pos, _ = _expand(np.minimum(_fan_out(counts, len(wishlists_df), 'wishlist_items'), num_products))
+    sampler = _popularity_sampler(num_products, _product_weights(products_df))
+    product_pos = _distinct_in_group(wishlist_pos, sampler, num_products)
+    n = len(wishlist_pos)
+
+    created_at = wishlists_df['created_at'].to_numpy().astype('datetime64[s]')[wishlist_pos]
+    return _apply_schema('wishlist_items', pd.DataFrame({
+        "wishlist_item_id": np.arange(1, n + 1),
+        "wishlist_id": wishlists_df['wishlist_id'].to_numpy()[wishlist_pos],
+        "product_id": products_df['product_id'].to_numpy()[product_pos],
+        "added_at": _random_datetimes_between(created_at, np.datetime64(_now(), 's'))
+    }))
 
 # 18. NOTIFICATION Table
-def generate_notifications(users_df):
-    notifications = []
-    notification_id = 1
-
-    notification_types = ['order', 'promo', 'payment', 'shipping', 'system']
-
-    for _, user in users_df.iterrows():
-        num_notifications = random.randint(0, 15)
-
-        for _ in range(num_notifications):
-            notification_type = random.choice(notification_types)
-            created_at = fake.date_time_between(start_date=user['registration_date'], end_date='now')
-            is_read = random.choice([0, 1])
-
-            title_prefix = {
-                'order': 'Pesanan Anda',
-                'promo': 'Promo Spesial',
-                'payment': 'Pembayaran',
-                'shipping': 'Pengiriman',
-                'system': 'Pemberitahuan Sistem'
-            }
-
-            title = f"{title_prefix[notification_type]} {fake.word().capitalize()}"
-
-            notifications.append({
-                "notification_id": notification_id,
-                "user_id": user['user_id'],
-                "title": title,
-                "message": fake.sentence(),
-                "notification_type": notification_type,
-                "reference_id": fake.bothify(text='REF-#####'),
-                "is_read": is_read,
-                "created_at": created_at
-            })
-            notification_id += 1
-
-    return pd.DataFrame(notifications)
+# 0-15 notifikasi per user; judul = prefix sesuai tipe + kata acak
+def generate_notifications(users_df, parent_index=None, counts=None):
+    title_prefix = {
+        'order': 'Pesanan Anda',
+        'promo': 'Promo Spesial',
+        'payment': 'Pembayaran',
+        'shipping': 'Pengiriman',
+        'system': 'Pemberitahuan Sistem'
+    }
+    notification_types = np.array(list(title_prefix), dtype=object)
+
+    parent_index = _parent_index(parent_index, 'users', users_df, 'user_id')
+    registration_dates = parent_index.gather('users', users_df['user_id'], 'registration_date').to_numpy()
+
+    user_pos, _ = _expand(_fan_out(counts, len(users_df), 'notifications'))
+    n = len(user_pos)
+    type_idx = rng.integers(0, len(notification_types), n)
+    word = np.char.capitalize(_sample_pool('word', n).astype(str))
+
+    return _apply_schema('notifications', pd.DataFrame({
+        "notification_id": np.arange(1, n + 1),
+        "user_id": users_df['user_id'].to_numpy()[user_pos],
+        "title": _join_text(np.array(list(title_prefix.values()))[type_idx], ' ', word).astype(object),
+        "message": _sample_text('sentence', n, size=5000),
+        "notification_type": notification_types[type_idx],
+        "reference_id": _random_codes('REF-', 5, n),
+        "is_read": rng.integers(0, 2, n),
+        "created_at": _random_datetimes_between(registration_dates[user_pos], np.datetime64(_now(), 's'))
+    }))
 
 # 19. CHAT Table
-def generate_chats(users_df, limit=500):
-    chats = []
-    chat_id = 1
-
-    for _ in range(limit):
-        sender_user = users_df.sample().iloc[0]
-        receiver_user = users_df[users_df['user_id'] != sender_user['user_id']].sample().iloc[0]
-
-        sent_at = fake.date_time_between(start_date='-6m', end_date='now')
-
-        message_types = ['text', 'image', 'product']
-        message_type = random.choices(message_types, weights=[0.8, 0.15, 0.05], k=1)[0]
-
-        if message_type == 'text':
-            message = fake.sentence()
-        elif message_type == 'image':
-            message = fake.image_url()
-        else:
-            message = f"PRODUCT:{random.randint(1, 100)}"
-
-        chats.append({
-            "chat_id": chat_id,
-            "sender_id": sender_user['user_id'],
-            "receiver_id": receiver_user['user_id'],
-            "message": message,
-            "message_type": message_type,
-            "is_read": random.choice([0, 1]),
-            "sent_at": sent_at
-        })
-        chat_id += 1
+# Pasangan sender/receiver diambil sebagai indeks: receiver digeser 1..n-1 posisi
+# dari sender, sehingga sender != receiver tanpa memfilter users_df per pesan
+def generate_chats(users_df, limit=500, start_date=None, end_date=None):
+    n_users = len(users_df)
+    if limit > 0 and n_users < 2:
+        raise ValueError("generate_chats membutuhkan minimal 2 user")
+
+    user_ids = users_df['user_id'].to_numpy()
+    sender_pos = rng.integers(0, n_users, limit)
+    receiver_pos = (sender_pos + rng.integers(1, n_users, limit)) % n_users
+
+    end_date = end_date or _now()
+    start_date = start_date or end_date - timedelta(days=182)
+    sent_at = _random_datetimes_between(np.datetime64(start_date, 's'), np.datetime64(end_date, 's'), limit)
+
+    message_type = _batched_choice(['text', 'image', 'product'], limit, weights=[0.8, 0.15, 0.05])
+    message = np.where(
+        message_type == 'text',
+        _sample_pool('sentence', limit, size=5000),
+        np.where(
+            message_type == 'image',
+            _sample_pool('image_url', limit),
+            np.char.add('PRODUCT:', rng.integers(1, 101, limit).astype(str)).astype(object)
+        )
+    )
 
-    return pd.DataFrame(chats)
+    return _apply_schema('chats', pd.DataFrame({
+        "chat_id": np.arange(1, limit + 1),
+        "sender_id": user_ids[sender_pos],
+        "receiver_id": user_ids[receiver_pos],
+        "message": message,
+        "message_type": message_type,
+        "is_read": rng.integers(0, 2, limit),
+        "sent_at": sent_at
+    }))
 
 # 20. PROMOTION Table
+# Promo berlaku mulai hari ini hingga 30 hari; reference_id sesuai target_type
 def generate_promotions(limit=20):
-    promotions = []
-    promotion_id = 1
-
-    target_types = ['category', 'product', 'seller', 'all']
-
-    for _ in range(limit):
-        target_type = random.choice(target_types)
-
-        if target_type == 'category':
-            reference_id = str(random.randint(1, 20))
-        elif target_type == 'product':
-            reference_id = str(random.randint(1, 100))
-        elif target_type == 'seller':
-            reference_id = str(random.randint(1, 20))
-        else:
-            reference_id = 'ALL'
-
-        start_date_p = fake.date_between(start_date='-2m', end_date='+1m')
-        end_date_p = fake.date_between(start_date=start_date_p, end_date=start_date_p + timedelta(days=30))
-
-        promotions.append({
-            "promotion_id": promotion_id,
-            "title": f"Promo {fake.word().capitalize()}",
-            "description": fake.paragraph(),
-            "banner_url": fake.image_url(),
-            "start_date": start_date_p,
-            "end_date": end_date_p,
-            "target_type": target_type,
-            "reference_id": reference_id,
-            "is_active": random.choice([0, 1])
-        })
-        promotion_id += 1
-
-    return pd.DataFrame(promotions)
+    target_type = _batched_choice(['category', 'product', 'seller', 'all'], limit)
+    reference_id = np.select(
+        [target_type == 'category', target_type == 'product', target_type == 'seller'],
+        [rng.integers(1, 21, limit).astype(str), rng.integers(1, 101, limit).astype(str),
+         rng.integers(1, 21, limit).astype(str)],
+        default='ALL'
+    )
+    start_date = np.full(limit, np.datetime64(_now().date(), 'D'))
+    word = np.char.capitalize(_sample_pool('word', limit).astype(str))
+
+    return _apply_schema('promotions', pd.DataFrame({
+        "promotion_id": np.arange(1, limit + 1),
+        "title": _join_text('Promo ', word).astype(object),
+        "description": _sample_text('paragraph', limit, size=2000),
+        "banner_url": _sample_text('image_url', limit),
+        "start_date": start_date,
+        "end_date": start_date + rng.integers(0, 31, limit).astype('timedelta64[D]'),
+        "target_type": target_type,
+        "reference_id": reference_id.astype(object),
+        "is_active": rng.integers(0, 2, limit)
+    }))
+
+# JSON daftar URL media review ('[]' bila tidak ada), dibangun per jumlah media
+# sekaligus untuk semua review, dengan format yang sama seperti json.dumps
+def _review_media_urls(review_ids, num_media):
+    ids = review_ids.astype(str).astype(object)
+    media_urls = np.full(len(ids), '[]', dtype=object)
+    for count in range(1, int(num_media.max(initial=0)) + 1):
+        mask = num_media == count
+        if not mask.any():
+            continue
+        base = '"https://ecommerce.com/reviews/' + ids[mask] + '/media/'
+        urls = '[' + base + '1.jpg"'
+        for i in range(2, count + 1):
+            urls = urls + ', ' + base + f'{i}.jpg"'
+        media_urls[mask] = urls + ']'
+    return media_urls
+
+# Geser review_id; media_urls memuat review_id sehingga ikut dibangun ulang
+def _offset_review_ids(reviews_df, offset):
+    if not offset or reviews_df.empty:
+        return
+    num_media = reviews_df['media_urls'].str.count(r'\.jpg').to_numpy()
+    reviews_df['review_id'] += offset
+    reviews_df['media_urls'] = _review_media_urls(reviews_df['review_id'].to_numpy(), num_media)
 
 # 21. PRODUCT_REVIEW Table
-def generate_product_reviews(products_df, order_items_df, users_df, product_variants_df):
-    reviews = []
-    review_id = 1
-
+# Sekitar separuh order item yang sudah Delivered/Completed mendapat review. Semua kolom
+# dibuat per array: reviewer adalah user pembeli order-nya (order_items.order_id ->
+# orders.buyer_id -> buyers.user_id) bila orders_df dan buyers_df diberikan, atau user acak
+# per indeks; review_date = status_updated + offset acak hingga 14 hari, paling lambat end_date.
+def generate_product_reviews(products_df, order_items_df, users_df, product_variants_df, parent_index=None,
+                             orders_df=None, buyers_df=None, end_date=None):
     # Filter order_items yang statusnya Delivered atau Completed
     completed_order_items = order_items_df[order_items_df['order_status'].isin(['Delivered', 'Completed'])]
 
-    # Jika tidak ada order_items yang selesai, kembalikan DataFrame kosong
-    if completed_order_items.empty:
-        print("Tidak ada order_items dengan status Delivered atau Completed untuk membuat review.")
-        return pd.DataFrame(reviews)
-
-    # Gabungkan order_items dengan product_variants untuk mendapatkan product_id
-    completed_order_items = completed_order_items.merge(
-        product_variants_df[['variant_id', 'product_id']],
-        on='variant_id',
-        how='left'
-    )
+    # Ambil product_id dari product_variants lewat indeks parent
+    parent_index = _parent_index(parent_index, 'variants', product_variants_df, 'variant_id')
+    parent_index = _parent_index(parent_index, 'products', products_df, 'product_id')
+    completed_order_items = completed_order_items.reset_index(drop=True)
+    variant_pos = parent_index.positions('variants', completed_order_items['variant_id'], strict=False)
 
     # Pastikan semua variant_id memiliki product_id yang sesuai
-    if completed_order_items['product_id'].isna().any():
+    if (variant_pos < 0).any():
         print("Warning: Ada variant_id di order_items yang tidak ditemukan di product_variants.")
-        completed_order_items = completed_order_items.dropna(subset=['product_id'])
+        completed_order_items = completed_order_items[variant_pos >= 0].reset_index(drop=True)
+    product_ids = parent_index.gather('variants', completed_order_items['variant_id'], 'product_id').to_numpy()
 
     # Pastikan semua product_id ada di products_df
-    completed_order_items = completed_order_items[completed_order_items['product_id'].isin(products_df['product_id'])]
-
-    if completed_order_items.empty:
-        print("Tidak ada order_items yang cocok dengan product_id di products untuk membuat review.")
-        return pd.DataFrame(reviews)
-
-    # Iterasi berdasarkan order_items yang valid
-    for _, order_item in completed_order_items.iterrows():
-        # Tentukan apakah akan membuat review untuk order_item ini (misalnya, 50% kemungkinan)
-        if random.random() < 0.5:
-            user_id = random.choice(users_df['user_id'].tolist())
-
-            review_date = fake.date_time_between(
-                start_date=order_item['status_updated'],
-                end_date=order_item['status_updated'] + timedelta(days=14)
-            )
-
-            media_urls = []
-            if random.random() < 0.3:
-                num_media = random.randint(1, 3)
-                for i in range(num_media):
-                    media_urls.append(f"https://ecommerce.com/reviews/{review_id}/media/{i+1}.jpg")
-
-            reviews.append({
-                "review_id": review_id,
-                "product_id": int(order_item['product_id']),  # Pastikan tipe data integer
-                "user_id": user_id,
-                "order_item_id": order_item['order_item_id'],
-                "rating": random.randint(1, 5),
-                "comment": fake.paragraph(),
-                "review_date": review_date,
-                "media_urls": json.dumps(media_urls) if media_urls else '[]',
-                "helpful_votes": random.randint(0, 50)
-            })
-            review_id += 1
-
-    return pd.DataFrame(reviews)
-
-# Fungsi untuk menghasilkan semua data
-def generate_all_data(num_users=50):
+    valid = parent_index.positions('products', product_ids, strict=False) >= 0
+    if completed_order_items.empty or not valid.any():
+        print("Tidak ada order_items dengan status Delivered atau Completed untuk membuat review.")
+
+    # Tentukan order_item mana yang mendapat review (50% kemungkinan)
+    reviewed = valid & (rng.random(len(valid)) < 0.5)
+    items = completed_order_items[reviewed]
+    product_ids = product_ids[reviewed]
+    n = len(items)
+
+    if orders_df is not None and buyers_df is not None:
+        parent_index = _parent_index(parent_index, 'orders', orders_df, 'order_id')
+        parent_index = _parent_index(parent_index, 'buyers', buyers_df, 'buyer_id')
+        buyer_ids = parent_index.gather('orders', items['order_id'], 'buyer_id')
+        user_ids = parent_index.gather('buyers', buyer_ids, 'user_id').to_numpy()
+    else:
+        user_ids = users_df['user_id'].to_numpy()[rng.integers(0, len(users_df), n)]
+
+    status_updated = items['status_updated'].to_numpy().astype('datetime64[s]')
+    review_ids = np.arange(1, n + 1)
+    num_media = np.where(rng.random(n) < 0.3, rng.integers(1, 4, n), 0)
+
+    return _apply_schema('product_reviews', pd.DataFrame({
+        "review_id": review_ids,
+        "product_id": product_ids,
+        "user_id": user_ids,
+        "order_item_id": items['order_item_id'].to_numpy(),
+        "rating": rng.integers(1, 6, n),
+        "comment": _sample_text('paragraph', n, size=2000),
+        "review_date": _random_datetimes_between(status_updated, np.minimum(
+            status_updated + np.timedelta64(14, 'D'), np.datetime64(end_date or _now(), 's'))),
+        "media_urls": _review_media_urls(review_ids, num_media),
+        "helpful_votes": rng.integers(0, 51, n)
+    }))
+
+def _silent(*args, **kwargs):
+    pass
+
+# Graf dependensi pembuatan tabel: tabel -> tabel yang harus sudah ada sebelumnya
+TABLE_DEPENDENCIES = {
+    'users': [],
+    'sellers': ['users'],
+    'buyers': ['users'],
+    'addresses': ['users'],
+    'product_categories': [],
+    'products': ['sellers', 'product_categories'],
+    'product_variants': ['products'],
+    'variant_options': ['product_variants'],
+    'product_images': ['products'],
+    'carts': ['users'],
+    'cart_items': ['carts', 'product_variants', 'products'],
+    'orders': ['buyers', 'sellers', 'product_variants', 'products'],
+    'order_items': ['orders'],
+    'vouchers': ['sellers'],
+    'user_vouchers': ['users', 'vouchers'],
+    'wishlists': ['users'],
+    'wishlist_items': ['wishlists', 'products'],
+    'notifications': ['users'],
+    'chats': ['users'],
+    'promotions': [],
+    'product_reviews': ['products', 'order_items', 'users', 'product_variants', 'orders', 'buyers'],
+}
+
+# Pembuat tiap tabel: menerima tabel yang sudah dibuat (t) dan konteks run (ctx)
+TABLE_BUILDERS = {
+    'users': lambda t, ctx: generate_dummy_users(ctx['num_users'], id_start=ctx['user_id_start'], id_space=ctx['user_id_space']),
+    'sellers': lambda t, ctx: generate_sellers(t['users'], parent_index=ctx['parent_index'],
+                                               total_products=_planned(ctx, 'sellers', 'total_products')),
+    'buyers': lambda t, ctx: generate_buyers(t['users'], parent_index=ctx['parent_index'],
+                                             orders_count=_planned(ctx, 'buyers', 'orders_count')),
+    'addresses': lambda t, ctx: generate_addresses(t['users'], counts=_planned(ctx, 'addresses')),
+    'product_categories': lambda t, ctx: generate_product_categories(),
+    'products': lambda t, ctx: generate_products(t['sellers'], t['product_categories'], parent_index=ctx['parent_index'],
+                                                 counts=_planned(ctx, 'products')),
+    'product_variants': lambda t, ctx: generate_product_variants(t['products'], parent_index=ctx['parent_index'],
+                                                                 counts=_planned(ctx, 'product_variants')),
+    'variant_options': lambda t, ctx: generate_variant_options(t['product_variants'],
+                                                               counts=_planned(ctx, 'variant_options')),
+    'product_images': lambda t, ctx: generate_product_images(t['products'], counts=_planned(ctx, 'product_images')),
+    'carts': lambda t, ctx: generate_carts(t['users'], parent_index=ctx['parent_index']),
+    'cart_items': lambda t, ctx: generate_cart_items(t['carts'], t['product_variants'], products_df=t['products'],
+                                                     counts=_planned(ctx, 'cart_items')),
+    'orders': lambda t, ctx: dict(zip(('orders', 'order_items'), generate_orders_with_items(
+        t['buyers'], t['sellers'], t['product_variants'], products_df=t['products'],
+        payment_status=_planned(ctx, 'orders', 'payment_status'), counts=_planned(ctx, 'order_items')))),
+    'vouchers': lambda t, ctx: generate_vouchers(t['sellers'], counts=_planned(ctx, 'vouchers')),
+    'user_vouchers': lambda t, ctx: generate_user_vouchers(t['users'], t['vouchers'],
+                                                           counts=_planned(ctx, 'user_vouchers')),
+    'wishlists': lambda t, ctx: generate_wishlists(t['users'], parent_index=ctx['parent_index'],
+                                                   counts=_planned(ctx, 'wishlists')),
+    'wishlist_items': lambda t, ctx: generate_wishlist_items(t['wishlists'], t['products'],
+                                                             counts=_planned(ctx, 'wishlist_items')),
+    'notifications': lambda t, ctx: generate_notifications(t['users'], parent_index=ctx['parent_index'],
+                                                           counts=_planned(ctx, 'notifications')),
+    'chats': lambda t, ctx: generate_chats(t['users'], limit=ctx['chat_limit']),
+    'promotions': lambda t, ctx: generate_promotions(limit=ctx['promotion_limit']),
+    'product_reviews': lambda t, ctx: generate_product_reviews(
+        t['products'], t['order_items'], t['users'], t['product_variants'], parent_index=ctx['parent_index'],
+        orders_df=t['orders'], buyers_df=t['buyers']),
+}
+
+# Tabel yang dibuat sekaligus oleh pembuat tabel lain (tabel -> tabel pembuatnya).
+# Pembuat seperti itu mengembalikan dict nama tabel -> DataFrame.
+FUSED_TABLES = {'order_items': 'orders'}
+
+def _build_tables(table_name, tables, context):
+    result = TABLE_BUILDERS[table_name](tables, context)
+    return result if isinstance(result, dict) else {table_name: result}
+
+# Kolom parent yang benar-benar dibaca setiap pembuat tabel (parent yang tidak tercantum
+# dimuat utuh). Dipakai saat tabel perantara disimpan di ColumnStore.
+TABLE_INPUT_COLUMNS = {
+    'sellers': {'users': ['user_id', 'registration_date']},
+    'buyers': {'users': ['user_id', 'registration_date']},
+    'addresses': {'users': ['user_id']},
+    'products': {'sellers': ['seller_id', 'joined_date', 'total_products']},
+    'product_variants': {'products': ['product_id', 'min_price', 'seller_sku', 'total_stock']},
+    'variant_options': {'product_variants': ['variant_id']},
+    'product_images': {'products': ['product_id']},
+    'carts': {'users': ['user_id', 'registration_date']},
+    'cart_items': {'carts': ['cart_id'], 'product_variants': ['variant_id', 'product_id', 'price'],
+                   'products': ['product_id', 'sold_count', 'views_count']},
+    'orders': {'buyers': ['buyer_id', 'orders_count'], 'sellers': ['seller_id'],
+               'product_variants': ['variant_id', 'product_id', 'price'],
+               'products': ['product_id', 'sold_count', 'views_count']},
+    'vouchers': {'sellers': ['seller_id']},
+    'user_vouchers': {'users': ['user_id'], 'vouchers': ['voucher_id']},
+    'wishlists': {'users': ['user_id', 'registration_date']},
+    'wishlist_items': {'wishlists': ['wishlist_id', 'created_at'],
+                       'products': ['product_id', 'sold_count', 'views_count']},
+    'notifications': {'users': ['user_id', 'registration_date']},
+    'chats': {'users': ['user_id']},
+    'product_reviews': {'products': ['product_id'], 'users': ['user_id'],
+                        'order_items': ['order_item_id', 'order_id', 'variant_id', 'order_status', 'status_updated'],
+                        'product_variants': ['variant_id', 'product_id'], 'orders': ['order_id', 'buyer_id'],
+                        'buyers': ['buyer_id', 'user_id']},
+}
+
+# Tabel yang didaftarkan ke ParentIndex setelah dibuat: nama indeks dan key-nya
+_PARENT_INDEX_KEYS = {
+    'users': ('users', 'user_id'),
+    'sellers': ('sellers', 'seller_id'),
+    'products': ('products', 'product_id'),
+    'product_variants': ('variants', 'variant_id'),
+}
+
+ALL_TABLES = PART1_TABLES + PART2_TABLES
+
+# Himpunan minimal tabel yang harus dibuat untuk tabel yang diminta (beserta semua
+# leluhurnya), dalam urutan pembuatan
+def resolve_tables(tables=None):
+    if tables is None:
+        return list(ALL_TABLES)
+    unknown = [t for t in tables if t not in TABLE_DEPENDENCIES]
+    if unknown:
+        raise ValueError(f"Tabel tidak dikenal: {unknown}")
+    needed = set()
+    stack = list(tables)
+    while stack:
+        table_name = stack.pop()
+        if table_name not in needed:
+            needed.add(table_name)
+            stack.extend(TABLE_DEPENDENCIES[table_name])
+    return [t for t in ALL_TABLES if t in needed]
+
+# Cache dataset di disk, dialamatkan dengan hash isi: seed, skala, parameter per tabel,
+# model popularitas, waktu acuan dan versi generator (GENERATOR_VERSION + hash source
+# modul ini). Entri ditulis ke direktori sementara lalu di-rename (atomik), sehingga
+# beberapa job bisa berbagi cache yang sama; bila total ukuran melebihi max_bytes,
+# entri yang paling lama tidak dipakai dihapus (LRU, berdasarkan mtime entri).
+GENERATOR_VERSION = '1'
+DATASET_CACHE_DIR = os.environ.get(
+    'DATA_DUMMY_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'data_dummy_ecommerce', 'datasets')
+)
+_STALE_TMP_SECONDS = 24 * 3600
+
+_source_digest = []
+
+def _generator_version():
+    if not _source_digest:
+        try:
+            with open(__file__, 'rb') as f:
+                _source_digest.append(hashlib.sha256(f.read()).hexdigest()[:16])
+        except OSError:
+            _source_digest.append('')
+    return f"{GENERATOR_VERSION}-{_source_digest[0]}"
+
+# Parameter yang menentukan isi dataset. Tanpa waktu acuan yang dipatok, tanggal
+# relatif terhadap hari ini, sehingga entri hanya berlaku untuk hari yang sama.
+# scheduler membedakan dataset generate_all_data (satu stream acak) dari scheduler DAG
+# (seed turunan per tabel): seed yang sama menghasilkan data yang berbeda
+def _dataset_cache_params(seed, selected, context, scheduler='sequential', reference_now=None, plan=None):
+    session = current_session()
+    reference_now = reference_now or session.reference_now
+    params = {
+        'version': _generator_version(),
+        'seed': seed,
+        'tables': list(selected),
+        'num_users': context['num_users'],
+        'user_id_start': context['user_id_start'],
+        'user_id_space': context['user_id_space'],
+        'seller_percentage': SELLER_PERCENTAGE,
+        'active_cart_percentage': ACTIVE_CART_PERCENTAGE,
+        'fanout': FANOUT_RANGES,
+        'chat_limit': context['chat_limit'],
+        'promotion_limit': context['promotion_limit'],
+        'popularity': dict(session.popularity),
+        'reference_now': reference_now.isoformat() if reference_now is not None else _now().date().isoformat(),
+        'scheduler': scheduler,
+    }
+    if plan is not None:
+        params['plan'] = _plan_fingerprint(plan)
+    return params
+
+# Plan dari pemanggil menentukan jumlah baris dan fan-out per parent, jadi ikut masuk key
+# cache: jumlah baris, rentang ID, dan digest array counts/columns
+def _plan_fingerprint(plan):
+    digest = hashlib.sha256()
+    for name, values in sorted(list(plan.counts.items()) + [('.'.join(k), v) for k, v in plan.columns.items()]):
+        digest.update(name.encode())
+        digest.update(np.asarray(values).astype(str).tobytes())
+    return {
+        'rows': {t: int(n) for t, n in plan.rows.items()},
+        'id_ranges': {t: [int(lo), int(hi)] for t, (lo, hi) in plan.id_ranges().items()},
+        'digest': digest.hexdigest(),
+    }
+
+def _tree_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def _raise(error):
+    raise error
+
+# Salin semua file di src ke dst dengan struktur yang sama. Sengaja tidak memakai hard
+# link: file output yang diedit di tempat akan ikut mengubah isi cache. src yang tidak
+# ada adalah error.
+def _copy_tree(src, dst):
+    for root, _, files in os.walk(src, onerror=_raise):
+        target_dir = os.path.join(dst, os.path.relpath(root, src))
+        os.makedirs(target_dir, exist_ok=True)
+        for name in files:
+            target = os.path.join(target_dir, name)
+            if os.path.lexists(target):
+                os.unlink(target)
+            shutil.copy2(os.path.join(root, name), target)
+
+# File output yang masih berupa hard link (mis. ke cache dari versi lama) dilepas dulu
+# sebelum ditulis, agar overwrite maupun append tidak ikut mengubah file lain
+def _unshare_file(path, keep_content=False):
+    try:
+        if os.stat(path).st_nlink <= 1:
+            return
+    except FileNotFoundError:
+        return
+    if not keep_content:
+        os.unlink(path)
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    shutil.copy2(path, tmp_path)
+    os.replace(tmp_path, path)
+
+class DatasetCache:
+    def __init__(self, directory=None, max_bytes=2 * 2**30):
+        self.directory = directory or DATASET_CACHE_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(params):
+        return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+
+    def _touch(self, key):
+        try:
+            os.utime(self._entry(key))
+        except OSError:
+            pass
+
+    def __contains__(self, key):
+        return os.path.exists(os.path.join(self._entry(key), 'meta.json'))
+
+    # Tabel entri, atau None bila belum ada (atau baru saja tergusur). Kolom disimpan dalam
+    # format ColumnStore (npy + json, tanpa pickle), karena direktori cache bisa dipakai
+    # bersama oleh banyak job. Dengan store, file kolom disalin ke store dan hasilnya
+    # StoredTables; tanpa store, hasilnya dict DataFrame di memori.
+    def load(self, key, store=None):
+        entry = self._entry(key)
+        try:
+            with open(os.path.join(entry, 'meta.json')) as f:
+                meta = json.load(f)
+            cached = ColumnStore.attach(os.path.join(entry, 'tables'), meta['tables'])
+            if store is not None:
+                for name in cached.tables:
+                    store.copy_from(cached, name)
+                tables = StoredTables(store, list(cached.tables))
+            else:
+                tables = {name: cached.frame(name).copy() for name in cached.tables}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self._touch(key)
+        return tables
+
+    def put(self, key, tables, params=None):
+        if key in self:
+            self._touch(key)
+            return
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        try:
+            cached = ColumnStore.attach(os.path.join(tmp_dir, 'tables'), {})
+            for name in tables:
+                if isinstance(tables, StoredTables):
+                    cached.copy_from(tables.store, name)
+                else:
+                    cached.put(name, tables[name])
+            meta = {'tables': cached.tables, 'params': params, 'created_at': datetime.now().isoformat(timespec='seconds')}
+            _atomic_write_text(os.path.join(tmp_dir, 'meta.json'), json.dumps(meta, indent=2, default=str))
+            # Gagal bila job lain sudah menulis entri yang sama lebih dulu; entri itu yang dipakai
+            os.rename(tmp_dir, self._entry(key))
+        except OSError:
+            pass
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.evict(keep=key)
+
+    # Artefak turunan entri (mis. file CSV) dibuat sekali lewat build(direktori), lalu
+    # disalin ke output_dir. Mengembalikan True bila artefak sudah ada di cache.
+    # Bila entri sudah tergusur (atau artefak gagal disimpan), build menulis langsung
+    # ke output_dir; error dari build sendiri tidak pernah ditelan.
+    def materialize(self, key, name, output_dir, build):
+        artifact = os.path.join(self._entry(key), name)
+        hit = os.path.isdir(artifact)
+        if not hit:
+            try:
+                tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=self._entry(key))
+            except OSError:
+                tmp_dir = None
+            if tmp_dir is not None:
+                try:
+                    build(tmp_dir)
+                    try:
+                        os.rename(tmp_dir, artifact)
+                    except OSError:
+                        # Entri tergusur, atau job lain sudah menulis artefak yang sama
+                        pass
+                finally:
+                    shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not os.path.isdir(artifact):
+            build(output_dir)
+            return False
+        try:
+            _copy_tree(artifact, output_dir)
+        except OSError:
+            # Entri tergusur di tengah jalan: tulis langsung ke output_dir
+            build(output_dir)
+            return False
+        self._touch(key)
+        self.evict(keep=key)
+        return hit
+
+    def evict(self, keep=None):
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if name.startswith('.'):
+                # Sisa penulisan job yang terhenti
+                if time.time() - mtime > _STALE_TMP_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+                continue
+            entries.append((mtime, name, _tree_size(path)))
+        total = sum(size for _, _, size in entries)
+        for _, name, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name != keep:
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+                total -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+# Hasil generate_all_data yang berasal dari (atau sudah disimpan ke) DatasetCache; saver
+# memakai key-nya untuk menyalin file yang sudah pernah ditulis
+class CachedTables(dict):
+    def __init__(self, tables, cache, key):
+        super().__init__(tables)
+        self.cache = cache
+        self.key = key
+
+# Fungsi untuk menghasilkan semua data (atau hanya tabel tertentu beserta leluhurnya).
+# Dengan store (ColumnStore), setiap tabel langsung ditulis ke disk setelah dibuat dan
+# tabel anak hanya membaca kolom parent di TABLE_INPUT_COLUMNS; hasilnya StoredTables.
+# Dengan cache (DatasetCache), dataset yang sama (seed, skala, parameter) langsung diambil
+# dari cache tanpa validasi ulang; bila belum ada, hasilnya disimpan ke cache.
+# Jumlah baris setiap tabel mengikuti plan (DatasetPlan), yang dibuat di awal dari stream
+# acak aktif bila tidak diberikan; chat_limit/promotion_limit None = berskala dengan num_users.
+def generate_all_data(num_users=50, user_id_start=1000, user_id_space=None,
+                      chat_limit=None, promotion_limit=None, verbose=True, tracer=None, tables=None,
+                      validate=True, store=None, cache=None, plan=None):
     all_tables = {}
+    tracer = tracer or _NULL_TRACER
+    # Tanpa ParentIndex bersama di mode store: generator membangun indeks dari kolom sempit
+    parent_index = ParentIndex() if store is None else None
+    log = print if verbose else _silent
+
+    selected = resolve_tables(tables)
+    scaled_chats, scaled_promotions = _scaled_limits(num_users)
+    context = {
+        'num_users': num_users,
+        'user_id_start': user_id_start,
+        'user_id_space': user_id_space,
+        'chat_limit': scaled_chats if chat_limit is None else chat_limit,
+        'promotion_limit': scaled_promotions if promotion_limit is None else promotion_limit,
+        'parent_index': parent_index,
+    }
 
-    print("BAGIAN 1: MENGHASILKAN 10 TABEL PERTAMA")
-    print("---------------------------------------")
-
-    print("Generating Users...")
-    users_df = generate_dummy_users(num_users)
-    all_tables['users'] = users_df
-
-    print("Generating Sellers...")
-    sellers_df = generate_sellers(users_df)
-    all_tables['sellers'] = sellers_df
-
-    print("Generating Buyers...")
-    buyers_df = generate_buyers(users_df)
-    all_tables['buyers'] = buyers_df
-
-    print("Generating Addresses...")
-    addresses_df = generate_addresses(users_df)
-    all_tables['addresses'] = addresses_df
-
-    print("Generating Product Categories...")
-    categories_df = generate_product_categories()
-    all_tables['product_categories'] = categories_df
-
-    print("Generating Products...")
-    products_df = generate_products(sellers_df, categories_df)
-    all_tables['products'] = products_df
-
-    print("Generating Product Variants...")
-    variants_df = generate_product_variants(products_df)
-    all_tables['product_variants'] = variants_df
-
-    print("Generating Variant Options...")
-    options_df = generate_variant_options(variants_df)
-    all_tables['variant_options'] = options_df
-
-    print("Generating Product Images...")
-    images_df = generate_product_images(products_df)
-    all_tables['product_images'] = images_df
-
-    print("Generating Carts...")
-    carts_df = generate_carts(users_df)
-    all_tables['carts'] = carts_df
-
-    print("\nBAGIAN 2: MENGHASILKAN 11 TABEL BERIKUTNYA")
-    print("------------------------------------------")
-
-    print("Generating Cart Items...")
-    cart_items_df = generate_cart_items(carts_df, variants_df)
-    all_tables['cart_items'] = cart_items_df
-
-    print("Generating Orders...")
-    orders_df = generate_orders(buyers_df)
-    all_tables['orders'] = orders_df
-
-    print("Generating Order Items...")
-    order_items_df = generate_order_items(orders_df, sellers_df, variants_df)
-    all_tables['order_items'] = order_items_df
-
-    print("Generating Vouchers...")
-    vouchers_df = generate_vouchers(sellers_df)
-    all_tables['vouchers'] = vouchers_df
-
-    print("Generating User Vouchers...")
-    user_vouchers_df = generate_user_vouchers(users_df, vouchers_df)
-    all_tables['user_vouchers'] = user_vouchers_df
-
-    print("Generating Wishlists...")
-    wishlists_df = generate_wishlists(users_df)
-    all_tables['wishlists'] = wishlists_df
-
-    print("Generating Wishlist Items...")
-    wishlist_items_df = generate_wishlist_items(wishlists_df, products_df)
-    all_tables['wishlist_items'] = wishlist_items_df
-
-    print("Generating Notifications...")
-    notifications_df = generate_notifications(users_df)
-    all_tables['notifications'] = notifications_df
-
-    print("Generating Chats...")
-    chats_df = generate_chats(users_df, limit=200)
-    all_tables['chats'] = chats_df
-
-    print("Generating Promotions...")
-    promotions_df = generate_promotions(limit=15)
-    all_tables['promotions'] = promotions_df
-
-    print("Generating Product Reviews...")
-    reviews_df = generate_product_reviews(products_df, order_items_df, users_df, variants_df)  # Tambahkan variants_df
-    all_tables['product_reviews'] = reviews_df
-
-    # Verifikasi integritas foreign key untuk product_reviews
-    print("\nMemverifikasi integritas foreign key untuk product_reviews...")
-    invalid_product_ids = reviews_df[~reviews_df['product_id'].isin(products_df['product_id'])]['product_id'].unique()
-    if len(invalid_product_ids) > 0:
-        print(f"Error: Terdapat product_id di product_reviews yang tidak ada di products: {invalid_product_ids}")
-        raise ValueError("Foreign key constraint akan gagal untuk product_reviews karena product_id tidak valid.")
-    print("Verifikasi product_reviews: Semua product_id valid.")
-
-    print("\nMemverifikasi tidak ada NaN di semua tabel...")
-    for table_name, df in all_tables.items():
-        if df.isna().sum().sum() > 0:
-            print(f"Error: Tabel {table_name} masih mengandung NaN!")
-            print("Detail kolom dengan NaN:")
-            print(df.isna().sum())
-            raise ValueError(f"Tabel {table_name} mengandung NaN, padahal seharusnya tidak ada!")
-        print(f"Tabel {table_name}: Tidak ada NaN.")
+    cache_key = None
+    if cache is not None:
+        seed = _current_seed()
+        if seed is None:
+            log("Cache dilewati: stream acak sudah dipakai sejak set_seed")
+        else:
+            cache_params = _dataset_cache_params(seed, selected, context, plan=plan)
+            cache_key = cache.key(cache_params)
+            cached = cache.load(cache_key, store=store)
+            if cached is not None:
+                log(f"Dataset diambil dari cache ({cache_key[:12]})")
+                return cached if store is not None else CachedTables(cached, cache, cache_key)
+
+    if plan is None:
+        plan = DatasetPlan(num_users, user_id_start, user_id_space, context['chat_limit'], context['promotion_limit'])
+    context['plan'] = plan
+
+    part1 = [t for t in selected if t in PART1_TABLES]
+    part2 = [t for t in selected if t in PART2_TABLES]
+    for part_number, part_tables in ((1, part1), (2, part2)):
+        if not part_tables:
+            continue
+        if part_number == 1:
+            log(f"BAGIAN 1: MENGHASILKAN {len(part_tables)} TABEL PERTAMA")
+            log("---------------------------------------")
+        else:
+            log(f"\nBAGIAN 2: MENGHASILKAN {len(part_tables)} TABEL BERIKUTNYA")
+            log("------------------------------------------")
+
+        for table_name in part_tables:
+            if table_name in FUSED_TABLES:
+                # Sudah dibuat bersama tabel pembuatnya
+                continue
+            fused = [t for t, owner in FUSED_TABLES.items() if owner == table_name and t in selected]
+            log(f"Generating {' + '.join(t.replace('_', ' ').title() for t in [table_name] + fused)}...")
+            if store is None:
+                parents = all_tables
+            else:
+                input_columns = TABLE_INPUT_COLUMNS.get(table_name, {})
+                parents = {p: store.frame(p, input_columns.get(p)) for p in TABLE_DEPENDENCIES[table_name]}
+            produced = _traced(tracer, table_name, _build_tables, table_name, parents, context)
+            for name in [table_name] + fused:
+                df = produced[name]
+                if store is not None:
+                    with tracer.span(name, stage='spill') as span:
+                        store.put(name, df)
+                        span['rows'] = len(df)
+                    continue
+                all_tables[name] = df
+                if name in _PARENT_INDEX_KEYS:
+                    parent_index.add(_PARENT_INDEX_KEYS[name][0], df, _PARENT_INDEX_KEYS[name][1])
+            del parents, produced
+
+    if store is not None:
+        all_tables = StoredTables(store, selected)
+
+    if validate:
+        with tracer.span('all_tables', stage='validate') as span:
+            _validate_generated(all_tables, log)
+            span['rows'] = sum(_row_counts(all_tables).values())
+
+    if cache_key is not None:
+        cache.put(cache_key, all_tables, cache_params)
+        if store is None:
+            all_tables = CachedTables(all_tables, cache, cache_key)
 
     return all_tables
 
-# Fungsi untuk menyimpan data ke file CSV
-def save_data_to_csv(data_dict, output_dir="dummy_data/"):
+def _validate_generated(all_tables, log, validator=None):
+    log("\nMemverifikasi NaN, primary key dan foreign key di semua tabel...")
+    errors = (validator or IntegrityValidator()).check(all_tables, raise_on_error=False)
+    if errors:
+        for error in errors:
+            log(f"Error: {error}")
+        raise ValueError(f"Integritas data gagal: {errors[0]}" + (f" (+{len(errors) - 1} error lain)" if len(errors) > 1 else ""))
+    for table_name in all_tables:
+        log(f"Tabel {table_name}: Tidak ada NaN, PK unik, FK valid.")
+
+# Seed turunan untuk satu tabel dalam scheduler DAG (tidak bergantung urutan eksekusi)
+def _table_seed(seed, table_name):
+    return int(np.random.SeedSequence(seed, spawn_key=(ALL_TABLES.index(table_name),)).generate_state(1)[0])
+
+# Satu task scheduler: reseed stream acak untuk tabel ini, bangun ParentIndex dari
+# tabel parent yang dikirim, lalu jalankan builder-nya
+# parents berisi kolom sempit (mode store) bila index_parents False; generator lalu
+# membangun indeksnya sendiri seperti di generate_all_data(store=...)
+def _run_table_task(table_name, parents, context, seed, reference_now, popularity=None, index_parents=True):
+    parent_index = ParentIndex() if index_parents else None
+    for parent_name, df in parents.items():
+        if index_parents and parent_name in _PARENT_INDEX_KEYS:
+            parent_index.add(_PARENT_INDEX_KEYS[parent_name][0], df, _PARENT_INDEX_KEYS[parent_name][1])
+    start = time.perf_counter()
+    with GeneratorSession(_table_seed(seed, table_name), reference_now=reference_now, popularity=popularity):
+        produced = _build_tables(table_name, parents, dict(context, parent_index=parent_index))
+    return produced, time.perf_counter() - start
+
+# Scheduler DAG: setiap tabel adalah task yang dikirim ke process pool begitu semua
+# dependensinya selesai, sehingga waktu total dibatasi critical path. Setiap task
+# punya seed sendiri, jadi hasilnya sama berapa pun jumlah worker dan urutan selesainya.
+# Dengan store (ColumnStore), tabel yang selesai langsung ditulis ke store dan task hanya
+# menerima kolom parent di TABLE_INPUT_COLUMNS; hasilnya StoredTables. Dengan cache
+# (DatasetCache), dataset yang sama diambil dari cache seperti pada generate_all_data.
+def generate_all_data_concurrent(num_users=50, workers=None, seed=42, reference_now=None,
+                                 user_id_start=1000, user_id_space=None, chat_limit=None,
+                                 promotion_limit=None, verbose=True, tracer=None, tables=None, store=None,
+                                 cache=None):
+    log = print if verbose else _silent
+    selected = resolve_tables(tables)
+    # Satu plan untuk semua task, sama dengan plan generate_all_data setelah set_seed(seed)
+    plan = plan_dataset(num_users, seed=seed, user_id_start=user_id_start, user_id_space=user_id_space,
+                        chat_limit=chat_limit, promotion_limit=promotion_limit)
+    context = {
+        'num_users': num_users,
+        'user_id_start': user_id_start,
+        'user_id_space': user_id_space,
+        'chat_limit': plan.rows['chats'],
+        'promotion_limit': plan.rows['promotions'],
+        'plan': plan,
+    }
+
+    cache_key = None
+    if cache is not None:
+        cache_params = _dataset_cache_params(seed, selected, context, scheduler='dag', reference_now=reference_now)
+        cache_key = cache.key(cache_params)
+        cached = cache.load(cache_key, store=store)
+        if cached is not None:
+            log(f"Dataset diambil dari cache ({cache_key[:12]})")
+            return cached if store is not None else CachedTables(cached, cache, cache_key)
+
+    if reference_now is None:
+        reference_now = _now()
+    popularity = dict(current_session().popularity)
+
+    done = {}
+
+    def finish(table_name, produced, duration):
+        for name, df in produced.items():
+            rows = len(df)
+            if store is not None:
+                store.put(name, df)
+                df = None
+            done[name] = df
+            if isinstance(tracer, Tracer):
+                tracer.record(name, stage="generate", rows=rows, duration=duration)
+            log(f"✓ {name}: {rows} baris ({duration:.2f} s)")
+
+    def task_args(table_name):
+        if store is None:
+            parents = {p: done[p] for p in TABLE_DEPENDENCIES[table_name]}
+        else:
+            input_columns = TABLE_INPUT_COLUMNS.get(table_name, {})
+            parents = {p: store.frame(p, input_columns.get(p)) for p in TABLE_DEPENDENCIES[table_name]}
+        return table_name, parents, context, seed, reference_now, popularity, store is None
+
+    # Tabel di FUSED_TABLES selesai bersama task tabel pembuatnya
+    remaining = [t for t in selected if t not in FUSED_TABLES]
+    if workers is not None and workers <= 1:
+        for table_name in remaining:
+            finish(table_name, *_run_table_task(*task_args(table_name)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = {}
+            while remaining or pending:
+                ready = [t for t in remaining if all(d in done for d in TABLE_DEPENDENCIES[t])]
+                for table_name in ready:
+                    remaining.remove(table_name)
+                    pending[pool.submit(_run_table_task, *task_args(table_name))] = table_name
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(pending.pop(future), *future.result())
+
+    all_tables = StoredTables(store, selected) if store is not None else {t: done[t] for t in selected}
+    with (tracer or _NULL_TRACER).span('all_tables', stage='validate') as span:
+        _validate_generated(all_tables, log)
+        span['rows'] = sum(_row_counts(all_tables).values())
+
+    if cache_key is not None:
+        cache.put(cache_key, all_tables, cache_params)
+        if store is None:
+            all_tables = CachedTables(all_tables, cache, cache_key)
+    return all_tables
+
+# Fungsi untuk menyimpan data ke file CSV. Hasil generate_all_data sudah divalidasi;
+# validate=True untuk tabel dari sumber lain (mis. yang diubah setelah generate)
+def save_data_to_csv(data_dict, output_dir="dummy_data/", tracer=None, validate=False):
+    tracer = tracer or _NULL_TRACER
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
@@ -851,38 +2215,1067 @@ def save_data_to_csv(data_dict, output_dir="dummy_data/"):
     if not os.path.exists(part2_dir):
         os.makedirs(part2_dir)
 
-    part1_tables = ['users', 'sellers', 'buyers', 'addresses', 'product_categories',
-                   'products', 'product_variants', 'variant_options', 'product_images', 'carts']
+    if validate:
+        print("\nMemverifikasi data sebelum menyimpan...")
+        validate_tables(data_dict)
 
-    part2_tables = ['cart_items', 'orders', 'order_items', 'vouchers', 'user_vouchers',
-                   'wishlists', 'wishlist_items', 'notifications', 'chats', 'promotions', 'product_reviews']
-
-    print("\nMemverifikasi data sebelum menyimpan...")
-    for table_name, df in data_dict.items():
-        if df.isna().sum().sum() > 0:
-            print(f"Error: Tabel {table_name} masih mengandung NaN!")
-            print("Detail kolom dengan NaN:")
-            print(df.isna().sum())
-            raise ValueError(f"Tabel {table_name} mengandung NaN, padahal seharusnya tidak ada!")
+    if isinstance(data_dict, CachedTables):
+        hit = data_dict.cache.materialize(data_dict.key, "csv", output_dir, lambda directory: save_data_to_csv(
+            dict(data_dict), directory, tracer=tracer))
+        print(f"\n✓ Data {'disalin dari cache' if hit else 'disimpan'} ke {output_dir}")
+        return
 
     print("\nMenyimpan data bagian 1...")
-    for table_name in part1_tables:
+    for table_name in PART1_TABLES:
         if table_name in data_dict:
             file_path = os.path.join(part1_dir, f"{table_name}.csv")
-            data_dict[table_name].to_csv(file_path, index=False)
+            _unshare_file(file_path)
+            with tracer.span(table_name, stage='save') as span:
+                _csv_frame(table_name, data_dict[table_name]).to_csv(file_path, index=False)
+                span['rows'] = len(data_dict[table_name])
             print(f"✓ Data {table_name} disimpan ke {file_path}")
 
     print("\nMenyimpan data bagian 2...")
-    for table_name in part2_tables:
+    for table_name in PART2_TABLES:
         if table_name in data_dict:
             file_path = os.path.join(part2_dir, f"{table_name}.csv")
-            data_dict[table_name].to_csv(file_path, index=False)
+            _unshare_file(file_path)
+            with tracer.span(table_name, stage='save') as span:
+                _csv_frame(table_name, data_dict[table_name]).to_csv(file_path, index=False)
+                span['rows'] = len(data_dict[table_name])
             print(f"✓ Data {table_name} disimpan ke {file_path}")
 
     print("\nSemua data berhasil disimpan!")
 
-# Main Execution
-if __name__ == "__main__":
+# Validator integritas: NaN, keunikan primary key dan semua relasi FOREIGN_KEYS dalam
+# satu pass per tabel (parent lebih dulu, setiap tabel dimuat sekali). Key yang sudah
+# dilihat disimpan per tabel sebagai _KeySet, sehingga keanggotaan FK dicek dengan
+# searchsorted dan validator bisa dipakai bertahap per chunk (mode streaming).
+# sample_size membatasi baris yang dicek untuk NaN/FK per tabel.
+def _sorted_contains(sorted_keys, values):
+    if len(sorted_keys) == 0:
+        return np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(sorted_keys, values)
+    pos[pos == len(sorted_keys)] = 0
+    return sorted_keys[pos] == values
+
+# Himpunan key: rentang [low, high] untuk key berurutan (mis. ID hasil _offset_ids, yang
+# antar chunk bersambung menjadi satu rentang) dan array terurut untuk sisanya, sehingga
+# memori tidak tumbuh dengan jumlah baris
+class _KeySet:
+    def __init__(self):
+        self.lows = np.empty(0, dtype=np.int64)
+        self.highs = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0, dtype=np.int64)
+
+    # keys terurut dan unik. exact=False hanya mencatat rentang min-max-nya: cukup untuk
+    # tabel yang tidak pernah dirujuk FK, yang key-nya hanya dicek bentrok antar chunk
+    def add(self, keys, exact=True):
+        if len(keys) == 0:
+            return
+        low, high = int(keys[0]), int(keys[-1])
+        if exact and high - low + 1 != len(keys):
+            self.values = np.union1d(self.values, keys)
+            return
+        pos = int(np.searchsorted(self.lows, low))
+        if pos > 0 and self.highs[pos - 1] + 1 >= low:
+            self.highs[pos - 1] = max(int(self.highs[pos - 1]), high)
+        else:
+            self.lows = np.insert(self.lows, pos, low)
+            self.highs = np.insert(self.highs, pos, high)
+
+    def contains(self, values):
+        values = np.asarray(values)
+        result = _sorted_contains(self.values, values)
+        if len(self.lows):
+            pos = np.searchsorted(self.lows, values, side='right') - 1
+            result |= (pos >= 0) & (values <= self.highs[np.maximum(pos, 0)])
+        return result
+
+class IntegrityValidator:
+    def __init__(self, sample_size=None, seed=0):
+        self.sample_size = sample_size
+        self.keys = {}
+        self._sample_rng = np.random.default_rng(seed)
+        # Hanya key tabel yang dirujuk FOREIGN_KEYS yang disimpan lengkap
+        self.parents = {parent for columns in FOREIGN_KEYS.values() for parent in columns.values()}
+
+    def _sample(self, df):
+        if self.sample_size is None or len(df) <= self.sample_size:
+            return df
+        return df.iloc[np.sort(self._sample_rng.choice(len(df), self.sample_size, replace=False))]
+
+    # Daftarkan key yang sudah ada (mis. dari dataset di disk pada mode append)
+    def add_keys(self, table_name, keys):
+        self.keys.setdefault(table_name, _KeySet()).add(np.unique(keys), exact=table_name in self.parents)
+
+    def check(self, tables, raise_on_error=True):
+        errors = []
+        # Parent diproses sebelum anaknya, sehingga anak di chunk yang sama bisa merujuknya
+        order = sorted(tables, key=lambda t: ALL_TABLES.index(t) if t in ALL_TABLES else len(ALL_TABLES))
+        for table_name in order:
+            df = tables[table_name]
+            sample = self._sample(df)
+            # NaT di kolom nullable (mis. payment_date order yang belum dibayar) bukan error
+            checked = sample.drop(columns=NULLABLE_COLUMNS.get(table_name, []), errors='ignore')
+            if len(checked) and checked.isna().to_numpy().any():
+                nan_columns = checked.columns[checked.isna().any().to_numpy()].tolist()
+                errors.append(f"Tabel {table_name} mengandung NaN di kolom {nan_columns}")
+
+            pk = PRIMARY_KEYS.get(table_name)
+            if pk is not None and pk in df.columns:
+                keys = np.sort(df[pk].to_numpy())
+                if len(keys) > 1 and (keys[1:] == keys[:-1]).any():
+                    errors.append(f"Primary key {table_name}.{pk} tidak unik")
+                    keys = np.unique(keys)
+                seen = self.keys.get(table_name)
+                if seen is not None and seen.contains(keys).any():
+                    errors.append(f"Primary key {table_name}.{pk} bentrok dengan chunk sebelumnya")
+                self.keys.setdefault(table_name, _KeySet()).add(keys, exact=table_name in self.parents)
+
+            for column, parent in FOREIGN_KEYS.get(table_name, {}).items():
+                if column not in sample.columns or not len(sample):
+                    continue
+                if parent not in self.keys:
+                    errors.append(f"Tabel parent {parent} untuk {table_name}.{column} tidak tersedia")
+                    continue
+                values = sample[column].to_numpy()
+                missing = ~self.keys[parent].contains(values)
+                if missing.any():
+                    examples = np.unique(values[missing])[:5].tolist()
+                    errors.append(f"Foreign key {table_name}.{column} -> {parent}: "
+                                  f"{int(missing.sum())} baris tidak valid, mis. {examples}")
+            del df, sample, checked
+
+        if errors and raise_on_error:
+            raise ValueError("; ".join(errors))
+        return errors
+
+def validate_tables(tables, sample_size=None):
+    return IntegrityValidator(sample_size=sample_size).check(tables)
+
+# Kolom berkardinalitas rendah yang disimpan dengan dictionary encoding di Parquet
+DICTIONARY_COLUMNS = {
+    'payment_method', 'payment_status', 'order_status', 'shipping_method', 'option_type',
+    'option_value', 'label', 'notification_type', 'message_type', 'target_type',
+    'country', 'province', 'city',
+}
+
+PARQUET_COMPRESSIONS = ('snappy', 'zstd', 'gzip', 'brotli', 'lz4', 'none')
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Output Parquet membutuhkan pyarrow: pip install pyarrow") from e
+    return pyarrow, pyarrow.parquet
+
+# Kolom datetime64 menjadi timestamp (NaT menjadi null) dan kolom 'date' di TABLE_SCHEMAS
+# (mis. vouchers) menjadi date32, sehingga tipe tanggal tidak berubah menjadi string seperti di CSV
+def _to_arrow_table(df, schema=None, table_name=None):
+    pa, _ = _import_pyarrow()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for column in _schema_columns(table_name, 'date'):
+        if column in table.column_names:
+            position = table.column_names.index(column)
+            table = table.set_column(position, column, table.column(column).cast(pa.date32()))
+    return table.cast(schema) if schema is not None else table
+
+def _parquet_options(columns, compression, row_group_size):
+    if compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(f"Kompresi Parquet tidak dikenal: {compression}")
+    return {
+        "compression": compression,
+        "use_dictionary": [c for c in columns if c in DICTIONARY_COLUMNS],
+        "row_group_size": row_group_size,
+    }
+
+# Fungsi untuk menyimpan data ke file Parquet (layout part1/part2 sama dengan CSV);
+# validate sama seperti save_data_to_csv
+def save_data_to_parquet(data_dict, output_dir="dummy_data/", compression="snappy", row_group_size=100000,
+                         tracer=None, validate=False):
+    _, pq = _import_pyarrow()
+    tracer = tracer or _NULL_TRACER
+
+    for part in ("part1", "part2"):
+        os.makedirs(os.path.join(output_dir, part), exist_ok=True)
+
+    if validate:
+        print("\nMemverifikasi data sebelum menyimpan...")
+        validate_tables(data_dict)
+
+    if isinstance(data_dict, CachedTables):
+        artifact = f"parquet-{compression}-{row_group_size}"
+        hit = data_dict.cache.materialize(data_dict.key, artifact, output_dir, lambda directory: save_data_to_parquet(
+            dict(data_dict), directory, compression=compression, row_group_size=row_group_size, tracer=tracer))
+        print(f"\n✓ Data {'disalin dari cache' if hit else 'disimpan'} ke {output_dir}")
+        return
+
+    for label, tables in (("1", PART1_TABLES), ("2", PART2_TABLES)):
+        print(f"\nMenyimpan data bagian {label}...")
+        for table_name in tables:
+            if table_name in data_dict:
+                df = data_dict[table_name]
+                file_path = _table_path(output_dir, table_name, "parquet")
+                options = _parquet_options(df.columns, compression, row_group_size)
+                _unshare_file(file_path)
+                with tracer.span(table_name, stage='save') as span:
+                    pq.write_table(_to_arrow_table(df, table_name=table_name), file_path, **options)
+                    span['rows'] = len(df)
+                print(f"✓ Data {table_name} disimpan ke {file_path}")
+
+    print("\nSemua data berhasil disimpan!")
+
+# Penulis per tabel untuk mode streaming: chunk pertama membuat file, chunk
+# berikutnya ditambahkan ke file yang sama
+class _CsvTableWriter:
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.written = set()
+
+    def write(self, table_name, df):
+        if table_name not in self.written:
+            _unshare_file(_table_path(self.output_dir, table_name))
+        _csv_frame(table_name, df).to_csv(_table_path(self.output_dir, table_name), mode='a' if table_name in self.written else 'w',
+                  header=table_name not in self.written, index=False)
+        self.written.add(table_name)
+
+    def close(self):
+        pass
+
+class _ParquetTableWriter:
+    def __init__(self, output_dir, compression="snappy", row_group_size=100000):
+        _import_pyarrow()
+        self.output_dir = output_dir
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.writers = {}
+
+    def write(self, table_name, df):
+        _, pq = _import_pyarrow()
+        if table_name in self.writers:
+            # Samakan skema dengan chunk pertama (mis. presisi datetime yang berbeda)
+            writer = self.writers[table_name]
+            table = _to_arrow_table(df, schema=writer.schema, table_name=table_name)
+        else:
+            table = _to_arrow_table(df, table_name=table_name)
+            options = _parquet_options(df.columns, self.compression, self.row_group_size)
+            del options["row_group_size"]
+            _unshare_file(_table_path(self.output_dir, table_name, "parquet"))
+            writer = pq.ParquetWriter(_table_path(self.output_dir, table_name, "parquet"), table.schema, **options)
+            self.writers[table_name] = writer
+        writer.write_table(table, row_group_size=self.row_group_size)
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+def _table_writer(output_format, output_dir, **options):
+    if output_format == "csv":
+        return _CsvTableWriter(output_dir)
+    if output_format == "parquet":
+        return _ParquetTableWriter(output_dir, **options)
+    raise ValueError(f"Format output tidak dikenal: {output_format}")
+
+# Urutan tabel di mana parent selalu datang sebelum anaknya (sesuai FOREIGN_KEYS);
+# urutan part1/part2 dipakai sebagai urutan dasar
+def _dependency_order(table_names):
+    remaining = [t for t in PART1_TABLES + PART2_TABLES if t in table_names]
+    remaining += [t for t in table_names if t not in remaining]
+    ordered = []
+    while remaining:
+        for table_name in remaining:
+            parents = set(FOREIGN_KEYS.get(table_name, {}).values()) - {table_name}
+            if all(p in ordered or p not in remaining for p in parents):
+                ordered.append(table_name)
+                remaining.remove(table_name)
+                break
+        else:
+            raise ValueError(f"Dependensi tabel melingkar: {remaining}")
+    return ordered
+
+def _sqlite_type(series):
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    return "TEXT"
+
+def _sqlite_create_table(table_name, df):
+    columns = []
+    for column in df.columns:
+        definition = f'"{column}" {_sqlite_type(df[column])}'
+        if column == PRIMARY_KEYS.get(table_name):
+            definition += " PRIMARY KEY"
+        columns.append(definition)
+    for column, parent in FOREIGN_KEYS.get(table_name, {}).items():
+        columns.append(f'FOREIGN KEY ("{column}") REFERENCES "{parent}" ("{PRIMARY_KEYS[parent]}")')
+    return f'CREATE TABLE "{table_name}" (\n    ' + ",\n    ".join(columns) + "\n)"
+
+# Ubah satu batch DataFrame menjadi tuple bertipe Python (datetime -> teks ISO, null -> None)
+def _sqlite_rows(df):
+    columns = []
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.dt.strftime('%Y-%m-%d %H:%M:%S')
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            values = series.astype(object)
+        else:
+            values = series.astype(str).where(series.notna())
+        columns.append(values.astype(object).where(values.notna(), None).tolist())
+    return zip(*columns)
+
+# Sumber batch per tabel: dict hasil generate_all_data, atau direktori output CSV
+# (save_data_to_csv / generate_data_streaming) yang dibaca bertahap
+def _iter_table_batches(data, table_name, batch_size):
+    if isinstance(data, Mapping):
+        df = data[table_name]
+        for start in range(0, max(len(df), 1), batch_size):
+            yield df.iloc[start:start + batch_size]
+        return
+    file_path = _table_path(data, table_name)
+    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+        # String kosong tetap '' dan tanggal sentinel kembali NULL, sama seperti jalur dict
+        for batch in pd.read_csv(file_path, chunksize=batch_size, keep_default_na=False,
+                                 float_precision='round_trip',
+                                 dtype={c: str for c in TEXT_COLUMNS.get(table_name, ())}):
+            yield _from_csv_frame(table_name, batch)
+
+# Muat semua tabel langsung ke SQLite: skema dengan PK/FK, insert berurutan sesuai
+# dependensi memakai executemany per batch, lalu indeks FK dibuat setelah data masuk
+def load_data_to_sqlite(data, db_path="dummy_data.db", batch_size=50000, enforce_foreign_keys=False):
+    if isinstance(data, Mapping):
+        table_names = list(data)
+    else:
+        table_names = [t for t in PART1_TABLES + PART2_TABLES if os.path.exists(_table_path(data, t))]
+    ordered = _dependency_order(table_names)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode = MEMORY")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if enforce_foreign_keys else 'OFF'}")
+
+        for table_name in reversed(ordered):
+            conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+
+        row_counts = {}
+        for table_name in ordered:
+            created = False
+            row_counts[table_name] = 0
+            for batch in _iter_table_batches(data, table_name, batch_size):
+                if not created:
+                    conn.execute(_sqlite_create_table(table_name, batch))
+                    created = True
+                if batch.empty:
+                    continue
+                placeholders = ", ".join("?" * len(batch.columns))
+                with conn:
+                    conn.executemany(f'INSERT INTO "{table_name}" VALUES ({placeholders})', _sqlite_rows(batch))
+                row_counts[table_name] += len(batch)
+            print(f"✓ {table_name}: {row_counts[table_name]} baris dimuat ke {db_path}")
+
+        print("\nMembuat indeks foreign key...")
+        with conn:
+            for table_name in ordered:
+                for column in FOREIGN_KEYS.get(table_name, {}):
+                    conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_{column}" ON "{table_name}" ("{column}")')
+        conn.commit()
+    finally:
+        conn.close()
+
+    return row_counts
+
+def _table_path(output_dir, table_name, ext="csv"):
+    part = "part1" if table_name in PART1_TABLES else "part2"
+    return os.path.join(output_dir, part, f"{table_name}.{ext}")
+
+# Geser ID berurutan (PK dan FK) sebuah chunk agar tetap unik secara global.
+# offsets berisi jumlah baris yang sudah ditulis per tabel dan diperbarui di sini.
+def _offset_ids(tables, offsets):
+    base = dict(offsets)
+    for table_name, df in tables.items():
+        if df.empty:
+            continue
+        pk = PRIMARY_KEYS[table_name]
+        if table_name == 'product_reviews':
+            _offset_review_ids(df, base.get(table_name, 0))
+        elif table_name not in _NON_SEQUENTIAL_KEYS:
+            df[pk] += base.get(table_name, 0)
+        for column, parent in FOREIGN_KEYS.get(table_name, {}).items():
+            if parent not in _NON_SEQUENTIAL_KEYS:
+                df[column] += base.get(parent, 0)
+    for table_name, df in tables.items():
+        if table_name not in _NON_SEQUENTIAL_KEYS:
+            offsets[table_name] = offsets.get(table_name, 0) + len(df)
+
+# Bagi total menjadi ukuran chunk yang serata mungkin (tidak ada chunk sisa yang terlalu kecil)
+def _chunk_sizes(total, chunk_size):
+    num_chunks = max(1, -(-total // chunk_size))
+    base, extra = divmod(total, num_chunks)
+    return [base + 1 if i < extra else base for i in range(num_chunks)]
+
+# Seed turunan untuk sebuah chunk/shard; hanya bergantung pada master seed dan indeks shard,
+# bukan pada jumlah worker
+def _shard_seed(seed, shard_index):
+    return int(np.random.SeedSequence(seed, spawn_key=(shard_index,)).generate_state(1)[0])
+
+# Setiap shard berjalan di sesinya sendiri (juga di dalam proses pemanggil bila workers <= 1)
+def _generate_shard(shard_index, shard_users, user_id_start, chat_limit, promotion_limit, seed, reference_now,
+                    tables=None, popularity=None, tracer=None):
+    with GeneratorSession(_shard_seed(seed, shard_index), reference_now=reference_now, popularity=popularity):
+        return generate_all_data(
+            shard_users,
+            user_id_start=user_id_start,
+            user_id_space=shard_users,
+            chat_limit=chat_limit,
+            promotion_limit=promotion_limit,
+            verbose=False,
+            tracer=tracer,
+            tables=tables,
+            validate=False
+        )
+
+# Hasil shard selalu dikembalikan berurutan. Dengan beberapa worker, jumlah shard yang
+# sedang diproses dibatasi agar file part tidak menumpuk saat penggabungan lebih lambat
+def _iter_shards(shard_args, workers, tracer=None):
+    if workers <= 1:
+        # Tanpa pool, span setiap shard langsung tercatat di tracer
+        for args in shard_args:
+            yield _stream_shard(*args, tracer=tracer)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for args in shard_args:
+            pending.append(pool.submit(_stream_shard, *args))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+# Satu shard mode streaming, dijalankan di worker: buat tabelnya, geser ID dengan offset
+# dari plan shard sebelumnya, validasi, lalu tulis file part per tabel ke shard_dir.
+# product_reviews hanya diperkirakan oleh plan, jadi dikembalikan dengan ID lokal dan
+# digeser oleh proses induk setelah jumlah review shard sebelumnya diketahui.
+def _stream_shard(generate_args, offsets, planned_rows, shard_dir, output_format, writer_options,
+                  validate_sample_size=None, trace=False, tracer=None):
+    local_tracer = Tracer(verbose=False) if tracer is None and trace else None
+    tracer = tracer or local_tracer or _NULL_TRACER
+    shard_index = generate_args[0]
+    for part in ("part1", "part2"):
+        os.makedirs(os.path.join(shard_dir, part), exist_ok=True)
+    tables = _generate_shard(*generate_args, tracer=tracer if isinstance(tracer, Tracer) else None)
+    if shard_index > 0:
+        tables.pop('product_categories', None)
+
+    for table_name, df in tables.items():
+        if table_name in planned_rows and len(df) != planned_rows[table_name]:
+            raise RuntimeError(f"Shard {shard_index + 1}: {table_name} berisi {len(df)} baris, "
+                               f"plan {planned_rows[table_name]}")
+    _offset_ids(tables, dict(offsets))
+
+    # Key tiap shard berada di rentang ID-nya sendiri, jadi FK cukup dicek di dalam shard
+    validator = IntegrityValidator(sample_size=validate_sample_size)
+    if shard_index > 0:
+        validator.add_keys('product_categories', generate_product_categories()['category_id'].to_numpy())
+    with tracer.span(f"chunk-{shard_index + 1}", stage='validate', table='all_tables') as span:
+        validator.check(tables)
+        span['rows'] = sum(len(df) for df in tables.values())
+
+    reviews = tables.pop('product_reviews', None)
+    row_counts = {}
+    writer = _table_writer(output_format, shard_dir, **writer_options)
+    try:
+        for table_name, df in tables.items():
+            if df.empty:
+                continue
+            with tracer.span(table_name, stage='save') as span:
+                writer.write(table_name, df)
+                span['rows'] = len(df)
+            row_counts[table_name] = len(df)
+    finally:
+        writer.close()
+    return {
+        'row_counts': row_counts,
+        'reviews': reviews,
+        'spans': local_tracer.spans if local_tracer is not None else [],
+    }
+
+# Gabungkan file part satu shard ke file output: part pertama cukup di-rename, CSV
+# berikutnya ditambahkan tanpa header, Parquet disalin per row group lewat Arrow
+class _PartMerger:
+    def __init__(self, output_format, output_dir, compression="snappy", row_group_size=100000):
+        self.output_format = output_format
+        self.output_dir = output_dir
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.ext = "parquet" if output_format == "parquet" else "csv"
+        self.parts = {}
+        self.writers = {}
+
+    def add(self, table_name, part_path):
+        if self.output_format == "parquet":
+            self._add_parquet(table_name, part_path)
+        else:
+            self._add_csv(table_name, part_path)
+        self.parts[table_name] = self.parts.get(table_name, 0) + 1
+
+    def _add_csv(self, table_name, part_path):
+        file_path = _table_path(self.output_dir, table_name, self.ext)
+        if table_name not in self.parts:
+            _unshare_file(file_path)
+            os.replace(part_path, file_path)
+            return
+        with open(part_path, 'rb') as src, open(file_path, 'ab') as dst:
+            src.readline()
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+    def _add_parquet(self, table_name, part_path):
+        _, pq = _import_pyarrow()
+        part = pq.ParquetFile(part_path)
+        writer = self.writers.get(table_name)
+        if writer is None:
+            file_path = _table_path(self.output_dir, table_name, self.ext)
+            _unshare_file(file_path)
+            options = _parquet_options(part.schema_arrow.names, self.compression, self.row_group_size)
+            del options["row_group_size"]
+            writer = pq.ParquetWriter(file_path, part.schema_arrow, **options)
+            self.writers[table_name] = writer
+        for i in range(part.num_row_groups):
+            # Samakan skema dengan part pertama (mis. kategori kosong di shard lain)
+            writer.write_table(part.read_row_group(i).cast(writer.schema))
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+# Mode streaming: user dibuat per chunk (shard). Offset ID setiap shard dihitung di depan
+# dari DatasetPlan shard-shard sebelumnya, sehingga worker bisa menggeser ID, memvalidasi
+# dan menulis file part-nya sendiri; proses induk hanya menggabungkan file part berurutan.
+# Memori tetap datar berapa pun total datanya. Tiap shard punya seed turunan sendiri,
+# sehingga seed yang sama menghasilkan file yang identik berapa pun nilai workers.
+def generate_data_streaming(num_users, output_dir="dummy_data/", chunk_size=10000,
+                            chat_limit=None, promotion_limit=None, workers=1, seed=42,
+                            reference_now=None, output_format="csv", tracer=None, tables=None,
+                            validate_sample_size=None, **writer_options):
+    for part in ("part1", "part2"):
+        os.makedirs(os.path.join(output_dir, part), exist_ok=True)
+
+    scaled_chats, scaled_promotions = _scaled_limits(num_users)
+    chat_limit = scaled_chats if chat_limit is None else chat_limit
+    promotion_limit = scaled_promotions if promotion_limit is None else promotion_limit
+
+    if reference_now is None:
+        reference_now = _now()
+    popularity = dict(current_session().popularity)
+    tracer = tracer or _NULL_TRACER
+    trace = isinstance(tracer, Tracer)
+    work_dir = tempfile.mkdtemp(prefix=".shards-", dir=output_dir)
+
+    sizes = _chunk_sizes(num_users, chunk_size)
+    shard_args = []
+    offsets = {}
+    users_done = 0
+    for shard_index, shard_users in enumerate(sizes):
+        # Chat dibagi proporsional ke tiap shard; kategori dan promosi hanya sekali
+        shard_chats = (chat_limit * (users_done + shard_users)) // num_users - (chat_limit * users_done) // num_users
+        shard_promotions = promotion_limit if shard_index == 0 else 0
+        generate_args = (shard_index, shard_users, 1000 + users_done, shard_chats, shard_promotions,
+                         seed, reference_now, tables, popularity)
+        # Plan yang sama dengan yang diambil generate_all_data di dalam shard
+        plan = plan_dataset(shard_users, seed=_shard_seed(seed, shard_index), user_id_start=1000 + users_done,
+                            user_id_space=shard_users, chat_limit=shard_chats, promotion_limit=shard_promotions)
+        planned_rows = {t: rows for t, rows in plan.rows.items()
+                        if t not in plan.estimated and t not in _NON_SEQUENTIAL_KEYS}
+        shard_args.append((generate_args, dict(offsets), planned_rows,
+                           os.path.join(work_dir, f"shard-{shard_index:05d}"), output_format, writer_options,
+                           validate_sample_size, trace and workers > 1))
+        for table_name, rows in planned_rows.items():
+            offsets[table_name] = offsets.get(table_name, 0) + rows
+        users_done += shard_users
+
+    row_counts = {}
+    review_offset = 0
+    users_done = 0
+    merger = _PartMerger(output_format, output_dir, **writer_options)
+    review_writer = _table_writer(output_format, output_dir, **writer_options)
+
+    try:
+        shard_tracer = tracer if trace and workers <= 1 else None
+        with tracer.span('chunks', stage='stream', table='all_tables') as stream_span:
+            shards = _track(_iter_shards(shard_args, workers, shard_tracer), len(sizes))
+            for shard_index, result in enumerate(shards):
+                if trace:
+                    tracer.spans.extend(result['spans'])
+                shard_dir = shard_args[shard_index][3]
+                for table_name, rows in result['row_counts'].items():
+                    with tracer.span(table_name, stage='merge') as span:
+                        merger.add(table_name, _table_path(shard_dir, table_name, merger.ext))
+                        span['rows'] = rows
+                    row_counts[table_name] = row_counts.get(table_name, 0) + rows
+
+                reviews = result['reviews']
+                if reviews is not None and not reviews.empty:
+                    _offset_review_ids(reviews, review_offset)
+                    review_offset += len(reviews)
+                    with tracer.span('product_reviews', stage='save') as span:
+                        review_writer.write('product_reviews', reviews)
+                        span['rows'] = len(reviews)
+                    row_counts['product_reviews'] = row_counts.get('product_reviews', 0) + len(reviews)
+
+                users_done += sizes[shard_index]
+                del result, reviews
+                shutil.rmtree(shard_dir, ignore_errors=True)
+                print(f"Chunk {shard_index + 1}/{len(sizes)} selesai ({users_done}/{num_users} user)")
+            stream_span['rows'] = sum(row_counts.values())
+    finally:
+        merger.close()
+        review_writer.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return row_counts
+
+# Mode append: baca ID maksimum dan key parent yang dibutuhkan dari direktori output
+# CSV yang sudah ada, buat hanya baris baru (users + buyers dan carts-nya, orders,
+# order_items, product_reviews, chats) dalam rentang [start_date, end_date], lalu tambahkan
+# ke file tabel tersebut. buyers.csv ditulis ulang agar orders_count, total_spent dan
+# last_purchase ikut memperhitungkan order baru. Tabel lain tidak disentuh.
+APPEND_TABLES = ['users', 'buyers', 'carts', 'orders', 'order_items', 'product_reviews', 'chats']
+
+# Tabel yang harus sudah ada untuk setiap jenis baris baru (dibaca maupun ditambah)
+APPEND_REQUIRED_TABLES = {
+    'users': ['users', 'buyers', 'carts'],
+    'orders': ['users', 'buyers', 'sellers', 'product_variants', 'orders', 'order_items', 'product_reviews'],
+    'chats': ['users', 'chats'],
+}
+
+def _read_columns(output_dir, table_name, columns):
+    file_path = _table_path(output_dir, table_name)
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Tabel {table_name} tidak ditemukan di {file_path}")
+    return pd.read_csv(file_path, usecols=columns)
+
+def _max_id(output_dir, table_name):
+    pk = PRIMARY_KEYS[table_name]
+    file_path = _table_path(output_dir, table_name)
+    if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+        return 0
+    values = pd.read_csv(file_path, usecols=[pk])[pk]
+    return int(values.max()) if len(values) else 0
+
+# Tabel buyers lengkap dari CSV; last_purchase CSV_NULL_DATE kembali menjadi NaT
+def _read_buyers(output_dir):
+    return _from_csv_frame('buyers', _read_columns(output_dir, 'buyers', None))
+
+# Tambahkan order baru ke statistik buyer
+def _add_order_stats(buyers_df, orders_df):
+    pos = pd.Index(buyers_df['buyer_id']).get_indexer(orders_df['buyer_id'])
+    n = len(buyers_df)
+    last_purchase = buyers_df['last_purchase'].to_numpy().astype('datetime64[s]')
+    latest = np.full(n, np.datetime64('NaT', 's'))
+    order_dates = orders_df['order_date'].to_numpy().astype('datetime64[s]')
+    order = np.argsort(order_dates, kind='stable')
+    latest[pos[order]] = order_dates[order]
+    return buyers_df.assign(
+        orders_count=buyers_df['orders_count'].to_numpy() + np.bincount(pos, minlength=n),
+        total_spent=np.round(buyers_df['total_spent'].to_numpy()
+                             + np.bincount(pos, weights=orders_df['total_amount'].to_numpy(), minlength=n), 2),
+        last_purchase=np.fmax(last_purchase, latest),
+    )
+
+# Seed per append: diturunkan dari seed dasar, awal jendela dan ID terakhir yang sudah
+# ada, sehingga append berturut-turut menghasilkan data berbeda tetapi tetap reproducible
+def _append_seed(seed, start_date, max_ids):
+    spawn_key = (start_date.toordinal(), max_ids['buyers'], max_ids['orders'], max_ids['chats'])
+    return int(np.random.SeedSequence(seed, spawn_key=spawn_key).generate_state(1)[0])
+
+def append_data(output_dir="dummy_data/", new_users=0, num_orders=0, num_chats=0,
+                start_date=None, end_date=None, seed=None):
+    end_date = end_date or _now()
+    start_date = start_date or end_date - timedelta(days=1)
+    if start_date >= end_date:
+        raise ValueError("start_date harus sebelum end_date")
+    requested = {'users': new_users, 'orders': num_orders, 'chats': num_chats}
+    required = sorted({t for kind, n in requested.items() if n > 0 for t in APPEND_REQUIRED_TABLES[kind]},
+                      key=ALL_TABLES.index)
+    missing = [t for t in required if not os.path.exists(_table_path(output_dir, t))]
+    if missing:
+        raise FileNotFoundError(f"Mode append membutuhkan tabel yang tidak ada di {output_dir}: {', '.join(missing)}")
+
+    print(f"\nMembaca dataset yang ada di {output_dir}...")
+    max_ids = {t: _max_id(output_dir, t) for t in APPEND_TABLES if t != 'users'}
+    users_df = _read_columns(output_dir, 'users', ['user_id'])
+    # Semua kolom buyers: statistiknya diperbarui lalu file ditulis ulang
+    buyers_df = _read_buyers(output_dir)
+    buyer_columns = buyers_df.columns.tolist()
+    sellers_df = _read_columns(output_dir, 'sellers', ['seller_id'])
+    variants_df = _read_columns(output_dir, 'product_variants', ['variant_id', 'product_id', 'price'])
+    products_df = pd.DataFrame({'product_id': variants_df['product_id'].unique()})
+
+    # Baris baru dibuat di sesi sendiri dengan waktu acuan end_date; sesi pemanggil tidak berubah
+    session = current_session()
+    append_seed = _append_seed(session.seed if seed is None else seed, start_date, max_ids)
+    new_tables = {}
+    with GeneratorSession(append_seed, reference_now=end_date, popularity=session.popularity):
+        # User baru terdaftar di dalam rentang waktu, dengan user_id setelah ID terbesar
+        if new_users > 0:
+            max_user_id = int(users_df['user_id'].max()) if len(users_df) else 999
+            new_users_df = generate_dummy_users(new_users, id_start=max_user_id + 1, id_space=new_users,
+                                                start_date=start_date, end_date=end_date)
+            # Statistik buyer baru berasal dari order yang ditambahkan di bawah
+            new_buyers_df = generate_buyers(new_users_df, orders_count=np.zeros(new_users, dtype=np.int64))
+            new_buyers_df['buyer_id'] += max_ids['buyers']
+            # Setiap user punya tepat satu cart, sama seperti dataset lengkap
+            new_carts_df = generate_carts(new_users_df)
+            new_carts_df['cart_id'] += max_ids['carts']
+            new_tables['users'] = new_users_df
+            new_tables['buyers'] = new_buyers_df
+            new_tables['carts'] = new_carts_df
+            users_df = pd.concat([users_df, new_users_df[['user_id']]], ignore_index=True)
+            buyers_df = pd.concat([buyers_df, new_buyers_df[buyer_columns]], ignore_index=True)
+
+        # Order baru dibagi acak ke buyer lama maupun baru
+        if num_orders > 0:
+            counts = np.bincount(rng.integers(0, len(buyers_df), num_orders), minlength=len(buyers_df))
+            order_buyers = pd.DataFrame({'buyer_id': buyers_df['buyer_id'].to_numpy(), 'orders_count': counts})
+            orders_df, order_items_df = generate_orders_with_items(
+                order_buyers[counts > 0], sellers_df, variants_df, start_date=start_date, end_date=end_date,
+                products_df=products_df)
+            orders_df['order_id'] += max_ids['orders']
+            order_items_df['order_id'] += max_ids['orders']
+            order_items_df['order_item_id'] += max_ids['order_items']
+
+            reviews_df = generate_product_reviews(products_df, order_items_df, users_df, variants_df,
+                                                  orders_df=orders_df, buyers_df=buyers_df, end_date=end_date)
+            _offset_review_ids(reviews_df, max_ids['product_reviews'])
+
+            new_tables['orders'] = orders_df
+            new_tables['order_items'] = order_items_df
+            new_tables['product_reviews'] = reviews_df
+            buyers_df = _add_order_stats(buyers_df, orders_df)
+
+        if num_chats > 0:
+            chats_df = generate_chats(users_df, limit=num_chats, start_date=start_date, end_date=end_date)
+            chats_df['chat_id'] += max_ids['chats']
+            new_tables['chats'] = chats_df
+
+    # Cek FK baris baru terhadap key yang sudah ada
+    validator = IntegrityValidator()
+    existing = {'users': users_df, 'buyers': buyers_df, 'sellers': sellers_df,
+                'product_variants': variants_df, 'products': products_df}
+    for table_name, df in existing.items():
+        keys = df[PRIMARY_KEYS[table_name]].to_numpy()
+        if table_name in new_tables:
+            # Key baru sudah digabung di atas, jangan dianggap bentrok
+            keys = np.setdiff1d(keys, new_tables[table_name][PRIMARY_KEYS[table_name]].to_numpy())
+        validator.add_keys(table_name, keys)
+    validator.check(new_tables)
+
+    row_counts = {}
+    for table_name, df in new_tables.items():
+        # buyers ditulis ulang utuh di bawah
+        if df.empty or table_name == 'buyers':
+            continue
+        file_path = _table_path(output_dir, table_name)
+        header = pd.read_csv(file_path, nrows=0).columns.tolist()
+        _unshare_file(file_path, keep_content=True)
+        _csv_frame(table_name, df[header]).to_csv(file_path, mode='a', header=False, index=False)
+        row_counts[table_name] = len(df)
+        print(f"✓ {len(df)} baris ditambahkan ke {file_path}")
+
+    if new_users > 0 or num_orders > 0:
+        file_path = _table_path(output_dir, 'buyers')
+        _atomic_write_text(file_path, _csv_frame('buyers', buyers_df).to_csv(index=False))
+        if 'buyers' in new_tables:
+            row_counts['buyers'] = len(new_tables['buyers'])
+        print(f"✓ {file_path} diperbarui ({row_counts.get('buyers', 0)} buyer baru)")
+
+    return row_counts
+
+# Mode event stream: tabel transaksi (orders, order_items, cart_items, chats, notifications)
+# dibuat per batch user lalu dikirim sebagai event NDJSON berurutan waktu dengan laju
+# target (event/detik). Kolom waktu yang dipakai untuk mengurutkan event per tabel:
+STREAM_EVENT_TYPES = {
+    'orders': 'order_date',
+    'order_items': 'status_updated',
+    'cart_items': 'added_at',
+    'chats': 'sent_at',
+    'notifications': 'created_at',
+}
+
+# Pengali laju target terhadap waktu berjalan (detik)
+BURST_PROFILES = {
+    'constant': lambda t: 1.0,
+    'sine': lambda t: 1.0 + 0.5 * math.sin(2 * math.pi * t / 60.0),
+    'spike': lambda t: 4.0 if t % 30.0 < 3.0 else 1.0,
+    'ramp': lambda t: min(1.0, 0.1 + t / 30.0),
+}
+
+# Satu batch event: ID digeser agar unik antar batch, tiap baris diserialisasi sekaligus
+# per tabel (to_json), lalu semua event diurutkan berdasarkan kolom waktunya.
+# Setiap batch dibuat dengan rentang historinya sendiri, jadi semua kolom tanggal tabel
+# event dipetakan secara linear (urutan tetap) dari rentang waktu event batch ke slice
+# [window_start, window_start + window). Slice batch berikutnya dimulai tepat setelahnya,
+# sehingga waktu event di seluruh stream tidak pernah mundur.
+def _event_batch(tables, offsets, event_types, window_start, window):
+    _offset_ids(tables, offsets)
+    frames = {t: tables[t] for t in event_types if t in tables and not tables[t].empty}
+    if not frames:
+        return np.empty(0, dtype=object), np.empty(0, dtype=object)
+    event_times = [df[STREAM_EVENT_TYPES[t]] for t, df in frames.items()]
+    low = min(times.min() for times in event_times)
+    high = max(times.max() for times in event_times)
+    scale = window.total_seconds() / ((high - low).total_seconds() + 1)
+    types, times, rows = [], [], []
+    for table_name, df in frames.items():
+        df = df.copy()
+        for column in df.columns:
+            if df[column].dtype.kind == 'M':
+                df[column] = (pd.Timestamp(window_start) + (df[column] - low) * scale).dt.floor('s')
+        types.append(np.full(len(df), table_name, dtype=object))
+        times.append(df[STREAM_EVENT_TYPES[table_name]].to_numpy().astype('datetime64[s]').astype(np.int64))
+        rows.append(np.array(df.to_json(orient='records', lines=True, date_format='iso').splitlines(), dtype=object))
+    order = np.argsort(np.concatenate(times), kind='stable')
+    return np.concatenate(types)[order], np.concatenate(rows)[order]
+
+# Sumber event: batch berikutnya selalu sudah disiapkan di executor (thread, atau proses
+# bila workers > 1) selagi batch sekarang dikirim
+class _EventSource:
+    def __init__(self, batch_users, seed, reference_now, event_types, workers=1, batch_window=3600.0):
+        self.batch_users = batch_users
+        self.seed = seed
+        self.reference_now = reference_now
+        self.batch_window = timedelta(seconds=batch_window)
+        self.batches_done = 0
+        self.event_types = list(event_types)
+        self.popularity = dict(current_session().popularity)
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.pending = deque()
+        self.batch_index = 0
+        self.offsets = {}
+        self.types = np.empty(0, dtype=object)
+        self.rows = np.empty(0, dtype=object)
+        self.pos = 0
+
+    def _submit(self):
+        loop = asyncio.get_running_loop()
+        args = (self.batch_index, self.batch_users, 1000 + self.batch_index * self.batch_users,
+                self.batch_users * 4, 0, self.seed, self.reference_now, self.event_types, self.popularity)
+        self.pending.append(loop.run_in_executor(self.pool, _generate_shard, *args))
+        self.batch_index += 1
+
+    async def _next_batch(self):
+        while len(self.pending) < max(1, self.workers):
+            self._submit()
+        tables = await self.pending.popleft()
+        self._submit()
+        window_start = self.reference_now + self.batches_done * self.batch_window
+        self.batches_done += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _event_batch, tables, self.offsets, self.event_types,
+                                          window_start, self.batch_window)
+
+    async def prime(self):
+        self.types, self.rows = await self._next_batch()
+        self.pos = 0
+
+    async def take(self, n):
+        types, rows = [], []
+        while n > 0:
+            if self.pos >= len(self.rows):
+                await self.prime()
+                continue
+            end = min(self.pos + n, len(self.rows))
+            types.append(self.types[self.pos:end])
+            rows.append(self.rows[self.pos:end])
+            n -= end - self.pos
+            self.pos = end
+        return types, rows
+
+    def close(self):
+        for future in self.pending:
+            future.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+class _FileSink:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.file = open(path, 'wb')
+
+    # I/O file berjalan di thread agar tidak menahan event loop (dan producer yang diukur)
+    async def write(self, data):
+        await asyncio.to_thread(self.file.write, data)
+
+    async def close(self):
+        await asyncio.to_thread(self.file.close)
+
+class _StdoutSink:
+    async def write(self, data):
+        await asyncio.to_thread(self._write, data)
+
+    def _write(self, data):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    async def close(self):
+        await asyncio.to_thread(sys.stdout.buffer.flush)
+
+# Socket TCP/Unix: drain() menahan penulis saat buffer kernel penuh (backpressure dari penerima)
+class _SocketSink:
+    def __init__(self, writer):
+        self.writer = writer
+
+    async def write(self, data):
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+# Format sink: "stdout" atau "-", "file:<path>" (atau path .ndjson/.jsonl),
+# "tcp:<host>:<port>", "unix:<path>"
+async def _open_sink(sink):
+    if sink in ("stdout", "-"):
+        return _StdoutSink()
+    if sink.startswith("tcp:"):
+        host, _, port = sink[4:].rpartition(":")
+        _, writer = await asyncio.open_connection(host or "127.0.0.1", int(port))
+        return _SocketSink(writer)
+    if sink.startswith("unix:"):
+        _, writer = await asyncio.open_unix_connection(sink[5:])
+        return _SocketSink(writer)
+    return _FileSink(sink[5:] if sink.startswith("file:") else sink)
+
+# Jumlah event yang seharusnya terkirim dalam `seconds` detik menurut laju dan profil burst
+def _target_events(rate, profile, seconds, step=0.01):
+    if seconds <= 0:
+        return 0.0
+    t = np.linspace(0.0, seconds, max(2, int(seconds / step) + 1))
+    values = np.array([profile(x) for x in t])
+    return float(rate * np.sum((values[1:] + values[:-1]) / 2 * np.diff(t)))
+
+def _latency_stats(latencies, counts):
+    if not latencies:
+        return {}
+    values = np.repeat(np.array(latencies) * 1000.0, counts)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'p50': round(float(p50), 3), 'p95': round(float(p95), 3), 'p99': round(float(p99), 3),
+            'max': round(float(values.max()), 3)}
+
+# Producer menghitung jumlah event yang sudah jatuh tempo setiap tick (laju target x profil
+# burst) dan memasukkannya ke antrean berkapasitas terbatas; consumer menulis ke sink.
+# Bila sink lebih lambat, antrean penuh menahan producer dan event yang tertunda tercatat
+# sebagai lag (jumlah per tick dibatasi max_batch agar tidak menumpuk tanpa batas).
+# Laporan membandingkan event yang tertulis dengan laju target x profil burst sepanjang
+# seluruh waktu berjalan (termasuk saat antrean dikuras).
+# Latensi diukur dari tick saat event jatuh tempo sampai selesai ditulis ke sink.
+# Waktu event dimulai dari reference_now dan maju batch_window detik per batch.
+async def stream_events(sink="stdout", rate=1000, duration=10.0, max_events=None, burst_profile="constant",
+                        event_types=None, batch_users=2000, queue_size=64, tick=0.01, max_batch=None,
+                        workers=1, seed=42, reference_now=None, batch_window=3600.0, log=None):
+    profile = BURST_PROFILES[burst_profile] if isinstance(burst_profile, str) else burst_profile
+    event_types = list(event_types or STREAM_EVENT_TYPES)
+    unknown = [t for t in event_types if t not in STREAM_EVENT_TYPES]
+    if unknown:
+        raise ValueError(f"Tipe event tidak dikenal: {unknown}")
+    if duration is None and max_events is None:
+        raise ValueError("duration atau max_events harus diisi")
+    log = log or _silent
+    max_batch = max_batch or max(1000, int(rate * tick * 10))
+
+    source = _EventSource(batch_users, seed, reference_now or _now(), event_types, workers, batch_window)
+    output = await _open_sink(sink)
+    queue = asyncio.Queue(maxsize=queue_size)
+    loop = asyncio.get_running_loop()
+    stats = {'sent': 0, 'written': 0, 'due': 0.0, 'backpressure_waits': 0, 'by_type': {}}
+    latencies, counts = [], []
+
+    async def produce(start):
+        last = start
+        while True:
+            now = loop.time()
+            elapsed = now - start
+            if duration is not None and elapsed >= duration:
+                break
+            stats['due'] += rate * profile(elapsed) * (now - last)
+            last = now
+            n = min(int(stats['due']) - stats['sent'], max_batch)
+            if max_events is not None:
+                n = min(n, max_events - stats['sent'])
+            if n > 0:
+                types, rows = await source.take(n)
+                ts = datetime.now().isoformat(timespec='milliseconds')
+                data = ''.join(
+                    f'{{"type":"{t}","ts":"{ts}","data":{row}}}\n'
+                    for type_chunk, row_chunk in zip(types, rows)
+                    for t, row in zip(type_chunk, row_chunk)
+                ).encode()
+                for type_chunk in types:
+                    names, type_counts = np.unique(type_chunk, return_counts=True)
+                    for name, count in zip(names, type_counts):
+                        stats['by_type'][name] = stats['by_type'].get(name, 0) + int(count)
+                if queue.full():
+                    stats['backpressure_waits'] += 1
+                await queue.put((now, n, data))
+                stats['sent'] += n
+            if max_events is not None and stats['sent'] >= max_events:
+                break
+            await asyncio.sleep(tick)
+        await queue.put(None)
+
+    async def consume():
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            due_at, n, data = item
+            await output.write(data)
+            latencies.append(loop.time() - due_at)
+            counts.append(n)
+            stats['written'] += n
+
+    try:
+        # Batch pertama disiapkan sebelum jam mulai berjalan
+        await source.prime()
+        start = loop.time()
+        log(f"Streaming event ke {sink} dengan laju target {rate} event/detik...")
+        await asyncio.gather(produce(start), consume())
+        elapsed = loop.time() - start
+    finally:
+        source.close()
+        await output.close()
+
+    target = _target_events(rate, profile, elapsed)
+    if max_events is not None:
+        target = min(target, max_events)
+    report = {
+        'events': stats['written'],
+        'seconds': round(elapsed, 3),
+        'target_rate': round(target / elapsed, 1) if elapsed > 0 else None,
+        'achieved_rate': round(stats['written'] / elapsed, 1) if elapsed > 0 else None,
+        'lag_events': max(0, int(target) - stats['written']),
+        'backpressure_waits': stats['backpressure_waits'],
+        'latency_ms': _latency_stats(latencies, counts),
+        'by_type': stats['by_type'],
+    }
+    log(f"✓ {report['events']} event dalam {report['seconds']} s "
+        f"({report['achieved_rate']} event/detik, target {report['target_rate']}), "
+        f"latensi p50/p99 {report['latency_ms'].get('p50')}/{report['latency_ms'].get('p99')} ms")
+    return report
+
+def run_event_stream(**kwargs):
+    return asyncio.run(stream_events(**kwargs))
+
+# Mode interaktif lama (dipakai bila skrip dijalankan tanpa argumen)
+def _interactive_main():
     print("==============================================")
     print(" GENERATOR DATA DUMMY E-COMMERCE ")
     print("==============================================")
@@ -904,3 +3297,169 @@ if __name__ == "__main__":
         save_data_to_csv(all_data, output_dir)
 
     print("\nSelesai!")
+
+def print_plan(plan, tables=None):
+    estimate = plan.estimate()
+    id_ranges = plan.id_ranges()
+    selected = resolve_tables(tables)
+    print(f"Rencana {plan.num_users} user (scale factor {plan.scale_factor:g})")
+    print(f"{'Tabel':<20} {'Baris':>11} {'Rentang ID':>21} {'Memori (MB)':>12} {'CSV (MB)':>10}")
+    for table_name in selected:
+        info = estimate[table_name]
+        rows = f"{'~' if info['estimated'] else ''}{info['rows']}"
+        first, last = id_ranges[table_name]
+        print(f"{table_name:<20} {rows:>11} {f'{first}-{last}':>21} "
+              f"{info['memory_bytes'] / 2**20:>12.1f} {info['csv_bytes'] / 2**20:>10.1f}")
+    total = {key: sum(estimate[t][key] for t in selected) for key in ('rows', 'memory_bytes', 'csv_bytes')}
+    print(f"{'TOTAL':<20} {total['rows']:>11} {'':>21} "
+          f"{total['memory_bytes'] / 2**20:>12.1f} {total['csv_bytes'] / 2**20:>10.1f}")
+
+def _parse_table_list(values):
+    tables = []
+    for value in values or []:
+        tables.extend(t.strip() for t in value.split(',') if t.strip())
+    return tables or None
+
+def _build_arg_parser():
+    parser = argparse.ArgumentParser(description="Generator data dummy e-commerce")
+    parser.add_argument("-n", "--users", type=int, default=50, help="jumlah user (default: 50)")
+    parser.add_argument("--seed", type=int, default=42, help="seed acak (default: 42)")
+    parser.add_argument("--reference-now", type=datetime.fromisoformat,
+                        help="patok waktu acuan 'sekarang' (ISO), agar output bisa dibandingkan antar run")
+    parser.add_argument("-f", "--format", choices=["csv", "parquet", "sqlite", "none"], default="csv",
+                        help="format output (default: csv; 'none' tidak menyimpan apa pun)")
+    parser.add_argument("-o", "--output-dir", default="dummy_data/", help="direktori output (default: dummy_data/)")
+    parser.add_argument("-t", "--tables", nargs="+",
+                        help="hanya buat tabel ini (dipisah spasi/koma) beserta tabel leluhurnya")
+    parser.add_argument("--chunk-size", type=int,
+                        help="aktifkan mode streaming dengan ukuran chunk user ini")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="jumlah proses: per shard pada mode streaming, atau per tabel (scheduler DAG) (default: 1)")
+    parser.add_argument("--compression", default="snappy", choices=PARQUET_COMPRESSIONS,
+                        help="kompresi Parquet (default: snappy)")
+    parser.add_argument("--db-path", help="file SQLite untuk --format sqlite (default: <output-dir>/dummy_data.db)")
+    parser.add_argument("--trace-json", help="simpan trace per tahap sebagai JSON")
+    parser.add_argument("--trace-prom", help="simpan trace per tahap dalam format teks Prometheus")
+    parser.add_argument("--append", action="store_true",
+                        help="tambahkan baris baru ke dataset CSV di --output-dir")
+    parser.add_argument("--new-users", type=int, default=0, help="jumlah user (dan buyer) baru untuk --append")
+    parser.add_argument("--orders", type=int, default=0, help="jumlah order baru untuk --append")
+    parser.add_argument("--chats", type=int, default=0, help="jumlah chat baru untuk --append")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="awal rentang waktu --append (ISO)")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="akhir rentang waktu --append (ISO)")
+    parser.add_argument("--stream", action="store_true",
+                        help="kirim event transaksi (orders, order_items, cart_items, chats, notifications) ke --sink")
+    parser.add_argument("--sink", default="stdout",
+                        help="tujuan --stream: stdout, file:<path>.ndjson, tcp:<host>:<port>, unix:<path> (default: stdout)")
+    parser.add_argument("--rate", type=float, default=1000, help="laju target --stream dalam event/detik (default: 1000)")
+    parser.add_argument("--duration", type=float, default=10.0, help="lama --stream dalam detik (default: 10)")
+    parser.add_argument("--max-events", type=int, help="hentikan --stream setelah sejumlah event ini")
+    parser.add_argument("--burst", choices=sorted(BURST_PROFILES), default="constant",
+                        help="profil burst laju --stream (default: constant)")
+    parser.add_argument("--batch-window", type=float, default=3600.0,
+                        help="rentang waktu event (detik) per batch --stream; waktu event maju monoton (default: 3600)")
+    parser.add_argument("--stream-report", help="simpan laporan laju dan latensi --stream sebagai JSON")
+    parser.add_argument("--spill-dir",
+                        help="simpan tabel perantara sebagai kolom memory-mapped di direktori ini (hemat RAM)")
+    parser.add_argument("--popularity", choices=POPULARITY_MODELS, default="zipf",
+                        help="model popularitas produk/variant/seller (default: zipf)")
+    parser.add_argument("--zipf-exponent", type=float, default=1.1, help="eksponen model zipf (default: 1.1)")
+    parser.add_argument("--plan", action="store_true",
+                        help="dry-run: tampilkan rencana jumlah baris, rentang ID dan perkiraan ukuran tanpa membuat data")
+    parser.add_argument("--cache", nargs="?", const=DATASET_CACHE_DIR, metavar="DIR",
+                        help=f"pakai cache dataset di DIR (default: {DATASET_CACHE_DIR}); tidak untuk --chunk-size")
+    parser.add_argument("--cache-max-mb", type=int, default=2048, help="batas ukuran cache dataset dalam MB (default: 2048)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="kurangi output log")
+    return parser
+
+def main(argv=None):
+    args = _build_arg_parser().parse_args(argv)
+    set_popularity(args.popularity, args.zipf_exponent)
+    tables = _parse_table_list(args.tables)
+    if tables and not args.stream:
+        print(f"Tabel yang akan dibuat: {', '.join(resolve_tables(tables))}")
+    tracer = Tracer(verbose=not args.quiet) if (args.trace_json or args.trace_prom) else None
+    db_path = args.db_path or os.path.join(args.output_dir, "dummy_data.db")
+
+    if args.plan:
+        if args.chunk_size:
+            raise SystemExit("--plan tidak bisa dipakai dengan --chunk-size (mode streaming membuat rencana per chunk)")
+        print_plan(plan_dataset(args.users, seed=args.seed), tables)
+        return 0
+
+    if args.stream:
+        # Log dan laporan ke stderr agar tidak bercampur dengan event bila sink-nya stdout
+        log = _silent if args.quiet else (lambda *a, **kw: print(*a, file=sys.stderr, **kw))
+        report = run_event_stream(
+            sink=args.sink, rate=args.rate, duration=args.duration, max_events=args.max_events,
+            burst_profile=args.burst, event_types=tables, workers=args.workers, seed=args.seed,
+            batch_window=args.batch_window, reference_now=args.reference_now, log=log
+        )
+        if args.stream_report:
+            _atomic_write_text(args.stream_report, json.dumps(report, indent=2))
+        print(json.dumps(report, indent=2), file=sys.stderr)
+        return 0
+
+    if args.append:
+        try:
+            row_counts = append_data(args.output_dir, new_users=args.new_users, num_orders=args.orders,
+                                     num_chats=args.chats, start_date=args.start,
+                                     end_date=args.end or args.reference_now, seed=args.seed)
+        except FileNotFoundError as e:
+            raise SystemExit(f"Error: {e}")
+    elif args.chunk_size:
+        if args.format == "none":
+            raise SystemExit("Mode streaming membutuhkan format output")
+        if args.spill_dir:
+            raise SystemExit("--spill-dir tidak bisa dipakai dengan --chunk-size (mode streaming sudah menulis per chunk)")
+        if args.cache:
+            raise SystemExit("--cache tidak bisa dipakai dengan --chunk-size")
+        stream_format = "parquet" if args.format == "parquet" else "csv"
+        writer_options = {"compression": args.compression} if stream_format == "parquet" else {}
+        row_counts = generate_data_streaming(
+            args.users, args.output_dir, chunk_size=args.chunk_size, workers=args.workers,
+            seed=args.seed, reference_now=args.reference_now, output_format=stream_format, tracer=tracer,
+            tables=tables, **writer_options
+        )
+        if args.format == "sqlite":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            load_data_to_sqlite(args.output_dir, db_path)
+    else:
+        store = ColumnStore(args.spill_dir) if args.spill_dir else None
+        cache = DatasetCache(args.cache, max_bytes=args.cache_max_mb * 2**20) if args.cache else None
+        try:
+            # Selalu lewat scheduler DAG (serial bila --workers 1): seed per tabel, sehingga
+            # --seed yang sama menghasilkan data yang sama berapa pun jumlah worker
+            all_data = generate_all_data_concurrent(args.users, workers=args.workers, seed=args.seed,
+                                                    reference_now=args.reference_now, verbose=not args.quiet,
+                                                    tracer=tracer, tables=tables, store=store, cache=cache)
+            row_counts = _row_counts(all_data)
+            if args.format == "csv":
+                save_data_to_csv(all_data, args.output_dir, tracer=tracer)
+            elif args.format == "parquet":
+                save_data_to_parquet(all_data, args.output_dir, compression=args.compression, tracer=tracer)
+            elif args.format == "sqlite":
+                os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+                load_data_to_sqlite(all_data, db_path)
+        finally:
+            if store is not None:
+                store.close()
+
+    print("\n=== STATISTIK DATA YANG DIHASILKAN ===")
+    for name, count in row_counts.items():
+        print(f"{name.capitalize()}: {count} baris")
+
+    if tracer is not None:
+        if args.trace_json:
+            tracer.write_json(args.trace_json)
+        if args.trace_prom:
+            tracer.write_prometheus(args.trace_prom)
+
+    print("\nSelesai!")
+    return 0
+
+# Main Execution
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
+    _interactive_main()
@@ -0,0 +1,80 @@
+import shutil
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import data_dummy_ecommerce as dde
+
+START = datetime(2025, 1, 1)
+END = datetime(2025, 1, 1, 23, 59, 59)
+
+@pytest.fixture
+def dataset(tmp_path):
+    output_dir = str(tmp_path / "data")
+    with dde.GeneratorSession(3, reference_now=datetime(2024, 12, 31)):
+        tables = dde.generate_all_data(40, verbose=False)
+    dde.save_data_to_csv(tables, output_dir, validate=False)
+    return output_dir
+
+def _read(output_dir, table_name):
+    return pd.read_csv(dde._table_path(output_dir, table_name))
+
+def _append(output_dir, start=START, end=END):
+    return dde.append_data(output_dir, new_users=5, num_orders=60, num_chats=10,
+                           start_date=start, end_date=end, seed=42)
+
+def test_append_continues_ids_and_keeps_carts_per_user(dataset):
+    before = {t: _read(dataset, t) for t in dde.APPEND_TABLES}
+    counts = _append(dataset)
+    after = {t: _read(dataset, t) for t in dde.APPEND_TABLES}
+
+    for table_name, df in after.items():
+        pk = dde.PRIMARY_KEYS[table_name]
+        assert df[pk].is_unique, table_name
+        added = df[pk].iloc[len(before[table_name]):]
+        assert len(added) == counts.get(table_name, 0), table_name
+        if table_name != 'users':
+            old_max = before[table_name][pk].max()
+            assert added.tolist() == list(range(old_max + 1, old_max + 1 + len(added))), table_name
+    assert (after['users']['user_id'].iloc[len(before['users']):] > before['users']['user_id'].max()).all()
+    assert sorted(after['carts']['user_id']) == sorted(after['users']['user_id'])
+
+    # orders_count tiap buyer bertambah sebanyak order barunya
+    new_orders = after['orders'].iloc[len(before['orders']):]
+    buyers = after['buyers'].set_index('buyer_id')['orders_count']
+    previous = before['buyers'].set_index('buyer_id')['orders_count'].reindex(buyers.index, fill_value=0)
+    expected = new_orders.groupby('buyer_id').size().reindex(buyers.index, fill_value=0)
+    assert (buyers - previous).equals(expected)
+
+def test_appended_dates_stay_inside_window(dataset):
+    before = {t: len(_read(dataset, t)) for t in ('orders', 'order_items', 'product_reviews')}
+    end = datetime(2025, 1, 10, 23, 59, 59)
+    _append(dataset, START, end)
+    columns = {'orders': ['order_date', 'payment_date'],
+               'order_items': ['status_updated', 'estimated_delivery'],
+               'product_reviews': ['review_date']}
+    for table_name, date_columns in columns.items():
+        added = _read(dataset, table_name).iloc[before[table_name]:]
+        assert len(added), table_name
+        for column in date_columns:
+            values = pd.to_datetime(added[column])
+            values = values[values != dde.CSV_NULL_DATE]
+            assert values.max() <= pd.Timestamp(end), (table_name, column)
+            if column == 'order_date':
+                assert values.min() >= pd.Timestamp(START)
+
+def test_successive_appends_differ_but_are_reproducible(dataset, tmp_path):
+    copy_dir = str(tmp_path / "copy")
+    shutil.copytree(dataset, copy_dir)
+    next_day = (datetime(2025, 1, 2), datetime(2025, 1, 2, 23, 59, 59))
+
+    for output_dir in (dataset, copy_dir):
+        _append(output_dir)
+        _append(output_dir, *next_day)
+
+    orders = _read(dataset, 'orders')
+    assert orders.equals(_read(copy_dir, 'orders'))
+    first, second = orders.iloc[-120:-60], orders.iloc[-60:]
+    assert not set(first['order_number']) & set(second['order_number'])
+    assert (first['total_amount'].to_numpy() != second['total_amount'].to_numpy()).any()
@@ -0,0 +1,66 @@
+import os
+import shutil
+from datetime import datetime
+
+import data_dummy_ecommerce as dde
+
+def _generate(cache, **kwargs):
+    with dde.GeneratorSession(7, reference_now=datetime(2025, 1, 1)):
+        return dde.generate_all_data(30, verbose=False, cache=cache, **kwargs)
+
+def _csv_files(directory):
+    return sorted(os.path.relpath(os.path.join(root, name), directory)
+                  for root, _, files in os.walk(directory) for name in files)
+
+def test_cache_hit_returns_same_tables(tmp_path):
+    cache = dde.DatasetCache(str(tmp_path / "cache"))
+    first = _generate(cache)
+    second = _generate(cache)
+    assert isinstance(second, dde.CachedTables)
+    assert list(second) == list(first)
+    for name in first:
+        assert second[name].equals(first[name]), name
+    # Entri disimpan tanpa pickle
+    entry = os.path.join(cache.directory, second.key)
+    assert not [f for f in _csv_files(entry) if f.endswith(".pkl")]
+
+def test_save_after_entry_evicted_writes_output(tmp_path):
+    cache = dde.DatasetCache(str(tmp_path / "cache"))
+    tables = _generate(cache)
+    shutil.rmtree(os.path.join(cache.directory, tables.key))
+
+    output_dir = str(tmp_path / "out")
+    dde.save_data_to_csv(tables, output_dir, validate=False)
+    assert _csv_files(output_dir) == sorted(
+        os.path.join("part1" if name in dde.PART1_TABLES else "part2", f"{name}.csv") for name in tables
+    )
+
+def test_cache_hit_with_store_stays_in_store(tmp_path):
+    cache = dde.DatasetCache(str(tmp_path / "cache"))
+    expected = _generate(cache)
+    with dde.ColumnStore(str(tmp_path / "store")) as store:
+        stored = _generate(cache, store=store)
+        assert isinstance(stored, dde.StoredTables)
+        assert set(store.tables) == set(expected)
+        for name in expected:
+            assert stored[name].equals(expected[name]), name
+
+def test_caller_plan_is_part_of_cache_key(tmp_path):
+    cache = dde.DatasetCache(str(tmp_path / "cache"))
+    default = _generate(cache)
+    planned = _generate(cache, plan=dde.plan_dataset(30, seed=99))
+    assert planned.key != default.key
+    assert len(planned["orders"]) != len(default["orders"])
+
+def test_editing_saved_output_keeps_cache_intact(tmp_path):
+    cache = dde.DatasetCache(str(tmp_path / "cache"))
+    tables = _generate(cache)
+    first_dir = str(tmp_path / "first")
+    dde.save_data_to_csv(tables, first_dir, validate=False)
+    with open(dde._table_path(first_dir, "users"), "a") as f:
+        f.write("rusak\n")
+
+    second_dir = str(tmp_path / "second")
+    dde.save_data_to_csv(_generate(cache), second_dir, validate=False)
+    with open(dde._table_path(second_dir, "users")) as f:
+        assert "rusak" not in f.read()
@@ -0,0 +1,24 @@
+import json
+from datetime import datetime
+
+import pytest
+
+import data_dummy_ecommerce as dde
+
+def test_target_events_follow_rate_and_profile():
+    assert dde._target_events(1000, dde.BURST_PROFILES['constant'], 2.0) == pytest.approx(2000)
+    # spike: 4x selama 3 detik pertama
+    assert dde._target_events(100, dde.BURST_PROFILES['spike'], 3.0) == pytest.approx(1200, rel=0.01)
+    assert dde._target_events(1000, dde.BURST_PROFILES['constant'], 0) == 0
+
+def test_stream_report_and_monotonic_event_times(tmp_path):
+    path = str(tmp_path / "events.ndjson")
+    report = dde.run_event_stream(sink=path, rate=5000, duration=None, max_events=3000, batch_users=200,
+                                  reference_now=datetime(2025, 1, 1), batch_window=600.0)
+    with open(path) as f:
+        events = [json.loads(line) for line in f]
+    assert report['events'] == len(events) == 3000
+    assert report['lag_events'] >= 0
+    assert 0 < report['target_rate'] <= 5000
+    times = [e['data'][dde.STREAM_EVENT_TYPES[e['type']]] for e in events]
+    assert times == sorted(times)
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import data_dummy_ecommerce as dde
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+# Kolom 'date' dibaca kembali sebagai datetime.date (date32), kategori sebagai Categorical
+def _normalized(table_name, df):
+    df = df.copy()
+    for column in df.columns:
+        if column in dde._schema_columns(table_name, 'date'):
+            df[column] = pd.to_datetime(df[column]).astype("datetime64[s]")
+        elif isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+        elif pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = df[column].astype("datetime64[s]")
+    return df
+
+def test_parquet_round_trip(tmp_path):
+    with dde.GeneratorSession(8, reference_now=datetime(2025, 1, 1)):
+        tables = dde.generate_all_data(30, verbose=False)
+    output_dir = str(tmp_path / "parquet")
+    dde.save_data_to_parquet(tables, output_dir, validate=False)
+
+    for table_name, df in tables.items():
+        loaded = pd.read_parquet(dde._table_path(output_dir, table_name, "parquet"))
+        pd.testing.assert_frame_equal(_normalized(table_name, loaded), _normalized(table_name, df), obj=table_name)
+        # Kolom berkardinalitas rendah disimpan dengan dictionary encoding
+        metadata = pq.ParquetFile(dde._table_path(output_dir, table_name, "parquet")).metadata
+        if not metadata.num_row_groups:
+            continue
+        row_group = metadata.row_group(0)
+        for i in range(row_group.num_columns):
+            column = row_group.column(i)
+            if column.path_in_schema in dde.DICTIONARY_COLUMNS:
+                assert "RLE_DICTIONARY" in column.encodings, f"{table_name}.{column.path_in_schema}"
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+import pytest
+
+import data_dummy_ecommerce as dde
+
+@pytest.mark.parametrize("num_users", [25, 120])
+def test_planned_rows_match_generated_tables(num_users):
+    plan = dde.plan_dataset(num_users, seed=6)
+    with dde.GeneratorSession(6, reference_now=datetime(2025, 1, 1)):
+        tables = dde.generate_all_data(num_users, verbose=False, plan=plan)
+    assert set(tables) == set(plan.rows)
+    for table_name, rows in plan.rows.items():
+        if table_name in plan.estimated:
+            continue
+        assert len(tables[table_name]) == rows, table_name
+
+def test_id_ranges_cover_generated_keys():
+    plan = dde.plan_dataset(30, seed=2)
+    with dde.GeneratorSession(2, reference_now=datetime(2025, 1, 1)):
+        tables = dde.generate_all_data(30, verbose=False, plan=plan)
+    for table_name, (low, high) in plan.id_ranges().items():
+        if table_name in plan.estimated:
+            continue
+        keys = tables[table_name][dde.PRIMARY_KEYS[table_name]]
+        assert low <= keys.min() and keys.max() <= high, table_name
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import data_dummy_ecommerce as dde
+
+def _alias_probabilities(table):
+    n = len(table)
+    probs = table.prob.copy()
+    np.add.at(probs, table.alias, 1.0 - table.prob)
+    return probs / n
+
+@pytest.mark.parametrize("weights", [
+    [1.0, 1.0, 1.0, 1.0],
+    [10.0, 1.0, 0.5, 0.25, 3.0],
+    1.0 / np.arange(1, 501) ** 1.1,
+])
+def test_alias_table_matches_weights(weights):
+    weights = np.asarray(weights, dtype=float)
+    table = dde.AliasTable(weights)
+    np.testing.assert_allclose(_alias_probabilities(table), weights / weights.sum(), atol=1e-12)
+
+def test_alias_table_samples_follow_weights():
+    weights = np.array([5.0, 3.0, 1.0, 1.0])
+    with dde.GeneratorSession(1):
+        picks = dde.AliasTable(weights).sample(200_000)
+    observed = np.bincount(picks, minlength=len(weights)) / len(picks)
+    np.testing.assert_allclose(observed, weights / weights.sum(), atol=0.01)
+
+def test_distinct_in_group_is_unique_even_for_skewed_sampler():
+    # Satu pilihan mendominasi, dan beberapa grup sama besar dengan jumlah pilihan
+    num_choices = 6
+    sizes = np.array([1, 6, 3, 6, 2, 5])
+    group_pos = np.repeat(np.arange(len(sizes)), sizes)
+    with dde.GeneratorSession(5):
+        sampler = dde.AliasTable(np.array([1000.0, 1.0, 1.0, 1.0, 1.0, 1.0]))
+        picks = dde._distinct_in_group(group_pos, sampler, num_choices)
+    assert len(picks) == len(group_pos)
+    assert ((picks >= 0) & (picks < num_choices)).all()
+    for group in range(len(sizes)):
+        in_group = picks[group_pos == group]
+        assert len(set(in_group.tolist())) == len(in_group)
+
+def _top_share(popularity, n=1000, size=50_000, top=10):
+    with dde.GeneratorSession(9, popularity=popularity):
+        picks = dde._popularity_sampler(n).sample(size)
+    return np.sort(np.bincount(picks, minlength=n))[::-1][:top].sum() / size
+
+def test_zipf_popularity_is_skewed_and_uniform_is_not():
+    uniform = _top_share({'model': 'uniform'})
+    zipf = _top_share({'model': 'zipf', 'exponent': 1.1})
+    assert uniform < 0.02
+    assert zipf > 0.3
+
+def test_zipf_skews_generated_order_items():
+    def top_variant_share(popularity):
+        with dde.GeneratorSession(4, reference_now=datetime(2025, 1, 1), popularity=popularity):
+            tables = dde.generate_all_data(60, verbose=False, validate=False)
+        counts = tables['order_items']['variant_id'].value_counts()
+        return counts.iloc[:10].sum() / counts.sum()
+
+    assert top_variant_share({'model': 'zipf', 'exponent': 1.1}) > 2 * top_variant_share({'model': 'uniform'})
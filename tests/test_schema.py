@@ -0,0 +1,20 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+import data_dummy_ecommerce as dde
+
+def test_large_user_ids_are_not_wrapped():
+    with dde.GeneratorSession(1, reference_now=datetime(2025, 1, 1)):
+        users = dde.generate_dummy_users(5, id_start=3_000_000_000)
+        wide = dde.generate_dummy_users(5, id_space=10**12)
+        buyers = dde.generate_buyers(users)
+    assert (users['user_id'] >= 3_000_000_000).all()
+    assert (wide['user_id'] >= 1000).all()
+    assert buyers['user_id'].isin(users['user_id']).all()
+
+def test_narrow_id_out_of_range_raises():
+    df = pd.DataFrame({'seller_id': [1, 2**31]})
+    with pytest.raises(ValueError, match='sellers.seller_id'):
+        dde._apply_schema('sellers', df)
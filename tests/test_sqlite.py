@@ -0,0 +1,30 @@
+import sqlite3
+from datetime import datetime
+
+import data_dummy_ecommerce as dde
+
+def _dump(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+        return {t: sorted(conn.execute(f'SELECT * FROM "{t}"').fetchall(), key=repr) for t in tables}
+    finally:
+        conn.close()
+
+def test_dict_and_csv_directory_load_identically(tmp_path):
+    with dde.GeneratorSession(11, reference_now=datetime(2025, 1, 1)):
+        tables = dde.generate_all_data(60, verbose=False)
+    output_dir = str(tmp_path / "csv")
+    dde.save_data_to_csv(tables, output_dir, validate=False)
+
+    dde.load_data_to_sqlite(tables, str(tmp_path / "dict.db"), batch_size=500)
+    dde.load_data_to_sqlite(output_dir, str(tmp_path / "csv.db"), batch_size=500)
+
+    from_dict = _dump(str(tmp_path / "dict.db"))
+    from_csv = _dump(str(tmp_path / "csv.db"))
+    assert sorted(from_dict) == sorted(from_csv)
+    for table_name in from_dict:
+        assert from_csv[table_name] == from_dict[table_name], table_name
+    # NULL tetap NULL dan string kosong tetap ''
+    nulls = [row for row in from_csv['buyers'] if row[-1] is None]
+    assert nulls and not [row for row in from_csv['buyers'] if row[-1] == '1970-01-01 00:00:00']
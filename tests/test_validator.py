@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+
+import data_dummy_ecommerce as dde
+
+@pytest.fixture(scope="module")
+def tables():
+    with dde.GeneratorSession(11, reference_now=datetime(2025, 1, 1)):
+        return dde.generate_all_data(40, verbose=False, validate=False)
+
+def _broken(tables, table_name, column, value):
+    broken = dict(tables)
+    broken[table_name] = tables[table_name].copy()
+    broken[table_name].loc[broken[table_name].index[0], column] = value
+    return broken
+
+def test_valid_dataset_passes(tables):
+    assert dde.validate_tables(tables) == []
+
+def test_broken_foreign_key_is_reported(tables):
+    missing_variant = int(tables["product_variants"]["variant_id"].max()) + 1
+    broken = _broken(tables, "order_items", "variant_id", missing_variant)
+    with pytest.raises(ValueError, match=r"Foreign key order_items\.variant_id -> product_variants: 1 baris"):
+        dde.validate_tables(broken)
+
+    errors = dde.IntegrityValidator().check(broken, raise_on_error=False)
+    assert len(errors) == 1
+    assert str(missing_variant) in errors[0]
+
+def test_duplicate_primary_key_is_reported(tables):
+    duplicate = int(tables["orders"]["order_id"].iloc[1])
+    errors = dde.IntegrityValidator().check(_broken(tables, "orders", "order_id", duplicate), raise_on_error=False)
+    assert any("Primary key orders.order_id tidak unik" in error for error in errors)
+
+def test_save_validates_only_on_request(tables, tmp_path):
+    missing_variant = int(tables["product_variants"]["variant_id"].max()) + 1
+    broken = _broken(tables, "order_items", "variant_id", missing_variant)
+    dde.save_data_to_csv(broken, str(tmp_path / "default"))
+    with pytest.raises(ValueError, match="Foreign key order_items.variant_id"):
+        dde.save_data_to_csv(broken, str(tmp_path / "checked"), validate=True)